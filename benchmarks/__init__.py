@@ -0,0 +1,11 @@
+"""性能計測スイート（合成データセット）。
+
+目的:
+- 100〜100k 枚の合成データセットを生成し、実際の入口関数（読み込み・決まり字算出・盤面操作・
+  クリック処理・結果/Tips の HTML 構築）の所要時間を計る。
+- 結果を JSON で出力し、コミット間で比較して性能の後退を検出する。
+
+使い方:
+- `python -m benchmarks --out bench.json`
+- `python -m benchmarks --sizes 100,1000 --compare base.json`（比較して閾値を超えた後退があれば終了コード 1）
+"""
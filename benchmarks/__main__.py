@@ -0,0 +1,104 @@
+"""`python -m benchmarks` の入口。"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+
+from src.competitive_karuta_trainer.services.disk_cache import CACHE_DIR_ENV
+
+DEFAULT_SIZES = (100, 1000, 10_000, 100_000)
+
+
+def _parse_sizes(raw: str) -> list[int]:
+    return [int(x) for x in raw.split(",") if x.strip()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        type=_parse_sizes,
+        default=list(DEFAULT_SIZES),
+        help="デッキの枚数（カンマ区切り、既定: 100,1000,10000,100000）",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="各ケースの計測回数（既定: 5）")
+    parser.add_argument("--only", default=None, help="名前にこの文字列を含むケースだけ計る")
+    parser.add_argument("--seed", type=int, default=0, help="合成データの乱数シード")
+    parser.add_argument("--out", default=None, help="結果 JSON の出力先")
+    parser.add_argument("--compare", default=None, help="比較対象の結果 JSON")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="後退とみなす最小値の比（既定: 1.25）",
+    )
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="karuta-bench-") as cache_dir:
+        # 利用者のキャッシュを汚さず、毎回空の状態から計る（モジュール読み込み前に設定する）
+        os.environ[CACHE_DIR_ENV] = cache_dir
+        return _run(args)
+
+
+def _run(args: argparse.Namespace) -> int:
+    from benchmarks import runner
+    from benchmarks.cases import build_cases, build_checks, build_fixed_checks
+    from benchmarks.synthetic import generate
+
+    results: list[runner.CaseResult] = []
+    checks: list[runner.CheckResult] = []
+
+    def run_check(check: runner.Check) -> None:
+        ok, detail = check.run()
+        checks.append({"name": check.name, "size": check.size, "ok": ok, "detail": detail})
+        print(f"[{'ok' if ok else 'NG'}] {check.name} n={check.size}: {detail}", flush=True)
+
+    for check in build_fixed_checks():
+        run_check(check)
+    for size in args.sizes:
+        ds = generate(size, seed=args.seed)
+        for check in build_checks(ds):
+            run_check(check)
+        for case in build_cases(ds):
+            if args.only and args.only not in case.name:
+                continue
+            r = runner.measure(case, args.repeat)
+            results.append(r)
+            per_op = f" ({runner.format_seconds(r['per_op_s'])}/op)" if case.ops > 1 else ""
+            print(
+                f"{case.name:<45} n={size:<7} "
+                f"median {runner.format_seconds(r['median_s'])}{per_op}",
+                flush=True,
+            )
+
+    report: runner.Report = {
+        "schema": runner.SCHEMA_VERSION,
+        "meta": runner.metadata(),
+        "results": results,
+        "checks": checks,
+    }
+    if args.out:
+        runner.write_report(args.out, report)
+
+    status = 0 if all(c["ok"] for c in checks) else 1
+    if args.compare:
+        rows = runner.compare(runner.load_report(args.compare), report, args.threshold)
+        print()
+        for row in rows:
+            mark = "REGRESSION" if row["regression"] else ""
+            print(
+                f"{row['name']:<45} n={row['size']:<7} "
+                f"{runner.format_seconds(row['base_s'])} -> "
+                f"{runner.format_seconds(row['current_s'])} "
+                f"x{row['ratio']:.2f} {mark}"
+            )
+        if any(row["regression"] for row in rows):
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
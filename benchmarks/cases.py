@@ -0,0 +1,270 @@
+"""計測ケースと正しさの確認の定義。
+
+対象（いずれも実際の入口関数）:
+- 読み込み: `load_from_zip_bytes`（csv / pandas エンジン、キャッシュ無し・あり）、`load_from_multi_bytes`
+- 決まり字: `compute_kimariji_for_texts`
+- 盤面: `init_deck` / `init_grid` / `choose_target_from_grid`
+- クリック処理: `handle_cell_click`（`GameEngine` 経由で 1 ゲーム分）、1 ゲーム通し
+- HTML: 結果画面のポップオーバー用 Tips 索引（ui/status）、Tips ページの表（pages/cards_list）
+
+確認:
+- 決まり字: トライによる算出結果を総当たりの算出結果と突き合わせる（小さいデッキのみ）。
+- 読み込み: csv エンジンと pandas エンジンの出力（ペア・Tips 表）が一致すること。
+  数値・欠損らしき値を含む CSV では、ペアと決まり字が一致し、既定エンジンのヒントの型が
+  `pandas.read_csv` と同じであること。
+- ゲーム: 100 枚のデッキ・ミス率 0.1 で `GameEngine.simulate` が毎秒
+  `GAMES_PER_S_FLOOR` ゲーム以上を処理できること（複数回の最良値で判定）。
+"""
+
+from __future__ import annotations
+
+import functools
+import io
+import random
+from typing import TYPE_CHECKING
+
+from benchmarks.runner import Case, Check
+from benchmarks.synthetic import HEADER, SyntheticDataset, generate
+from src.competitive_karuta_trainer.app.engine import GameEngine
+from src.competitive_karuta_trainer.domain import (
+    PairTable,
+    choose_target_from_grid,
+    init_deck,
+    init_grid,
+)
+from src.competitive_karuta_trainer.services import dataset_loader
+from src.competitive_karuta_trainer.services.dataset_cache import get_dataset_cache
+from src.competitive_karuta_trainer.services.kimariji import (
+    _original_prefix_end_index,
+    _strip_for_kimariji,
+    compute_kimariji_for_texts,
+    compute_kimariji_prefixes,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# 総当たりの確認を行う最大枚数（O(n^2) のため）
+BRUTE_FORCE_MAX_SIZE = 1000
+
+# 1 ゲームの使用枚数と盤面
+GAME_SAMPLES = 30
+GAME_ROWS = 5
+GAME_COLS = 4
+
+# ゲームのスループットの下限（ゲーム/秒）と、判定に使う計測の回数・1 回のゲーム数
+GAMES_PER_S_FLOOR = 500
+THROUGHPUT_REPEAT = 5
+THROUGHPUT_GAMES = 100
+
+
+# 数値・欠損らしき値を含む CSV（ヒント・上の句の値の型推論がエンジンで異なる）
+_MIXED_ROWS = (
+    ("1", "秋の田の", "わが衣手は", "あきのたの", "わがころもでは", "1"),
+    ("2", "春過ぎて", "衣ほすてふ", "はるすぎて", "ころもほすてふ", "NA"),
+    ("3", "あしびきの", "ながながし夜を", "あしびきの", "ながながしよを", ""),
+    ("4", "100", "200", "ひゃく", "にひゃく", "2.5"),
+    ("5", "田子の浦に", "富士の高嶺に", "たごのうらに", "N/A", "null"),
+    ("6", "奥山に", "声きく時ぞ", "おくやまに", "こえきくときぞ", "#N/A"),
+)
+MIXED_DATASET = SyntheticDataset(
+    len(_MIXED_ROWS),
+    "\n".join(",".join(row) for row in (tuple(HEADER), *_MIXED_ROWS)).encode("utf-8") + b"\n",
+)
+
+
+def _clear_dataset_cache() -> None:
+    get_dataset_cache().clear()
+
+
+def build_cases(ds: SyntheticDataset) -> list[Case]:
+    """データセット 1 つ分の計測ケースを返す。"""
+    size = ds.size
+    zip_bytes = ds.zip_bytes
+    multi_bytes = ds.multi_bytes
+    kana, kanji, tips_df, _ = dataset_loader.load_from_zip_bytes(zip_bytes)
+    kana_upper = [p.kami for p in kana]
+
+    cases: list[Case] = []
+    for csv_engine in dataset_loader.ENGINES:
+        cases.append(
+            Case(
+                f"load_from_zip_bytes[{csv_engine}]",
+                size,
+                functools.partial(dataset_loader.load_from_zip_bytes, zip_bytes, engine=csv_engine),
+                before=_clear_dataset_cache,
+            )
+        )
+    cases.append(
+        Case(
+            "load_from_zip_bytes[cached]",
+            size,
+            lambda: dataset_loader.load_from_zip_bytes(zip_bytes),
+        )
+    )
+    for csv_engine in dataset_loader.ENGINES:
+        cases.append(
+            Case(
+                f"load_from_multi_bytes[{csv_engine}]",
+                size,
+                functools.partial(
+                    dataset_loader.load_from_multi_bytes, multi_bytes, engine=csv_engine
+                ),
+                before=_clear_dataset_cache,
+            )
+        )
+    cases.append(
+        Case(
+            "compute_kimariji_for_texts",
+            size,
+            lambda: compute_kimariji_for_texts(kana_upper, original_label="上の句（ひらがな）"),
+        )
+    )
+
+    def deal() -> None:
+        deck = init_deck(kana)
+        grid = init_grid(deck, GAME_ROWS, GAME_COLS)
+        choose_target_from_grid(grid)
+
+    cases.append(Case("init_deck+init_grid+choose_target_from_grid", size, deal))
+
+    game = GameEngine(
+        PairTable.from_pairs(kana, kanji),
+        rows=GAME_ROWS,
+        cols=GAME_COLS,
+        samples=GAME_SAMPLES,
+        rng=random.Random(size),
+    )
+    clicks = min(GAME_SAMPLES, len(kana))
+
+    def take_all() -> None:
+        while not game.finished:
+            game.take(1.0)
+
+    cases.append(Case("handle_cell_click", size, take_all, before=game.start, ops=clicks))
+    cases.append(Case("game.play", size, game.play))
+    cases.extend(_html_cases(size, tips_df))
+    return cases
+
+
+def _html_cases(size: int, tips_df: pd.DataFrame) -> list[Case]:
+    """結果画面・Tips ページの HTML 構築（streamlit が無ければ省略）。"""
+    try:
+        from src.competitive_karuta_trainer.ui import status
+        from src.competitive_karuta_trainer.ui.tips_table import _build_tips_page_html
+    except ImportError:
+        return []
+
+    # 1 ゲーム分（GAME_SAMPLES 枚）の札のヒントリンクが表内に散らばっている想定
+    positions = list(range(0, size, max(1, size // GAME_SAMPLES)))[:GAME_SAMPLES]
+
+    def results_popover() -> None:
+        # キャッシュを経由せずに索引を作り、ポップオーバーの HTML まで組み立てる
+        index = status._TipsIndex(tips_df)
+        status._build_triggers_with_popover_html(index.payload_json(positions))
+
+    return [
+        Case("ui.status.results_popover", size, results_popover),
+        Case("pages.cards_list.tips_html", size, lambda: _build_tips_page_html(tips_df)),
+    ]
+
+
+def _brute_force_prefixes(originals: list[str]) -> list[str]:
+    """決まり字を定義どおりに総当たりで求める（O(n^2 L)）。
+
+    他のどの札とも共有しない最短の接頭辞（空白・句読点を除いて数える）。無ければ全体。
+    """
+    stripped = [_strip_for_kimariji(s) for s in originals]
+    out: list[str] = []
+    for i, s in enumerate(stripped):
+        klen = 0
+        if s:
+            klen = len(s)
+            for d in range(1, len(s) + 1):
+                p = s[:d]
+                if not any(j != i and t.startswith(p) for j, t in enumerate(stripped)):
+                    klen = d
+                    break
+        out.append(originals[i][: _original_prefix_end_index(originals[i], klen)])
+    return out
+
+
+def build_checks(ds: SyntheticDataset) -> list[Check]:
+    """データセット 1 つ分の確認を返す。"""
+    checks: list[Check] = []
+    if ds.size <= BRUTE_FORCE_MAX_SIZE:
+
+        def kimariji_brute_force() -> tuple[bool, str]:
+            kana, _, _, _ = dataset_loader.load_from_zip_bytes(ds.zip_bytes)
+            originals = [p.kami for p in kana]
+            got = compute_kimariji_prefixes(originals)
+            want = _brute_force_prefixes(originals)
+            bad = [i for i, (g, w) in enumerate(zip(got, want, strict=True)) if g != w]
+            if bad:
+                i = bad[0]
+                return (
+                    False,
+                    f"{len(bad)} 件不一致（例: {originals[i]!r}: {got[i]!r} != {want[i]!r}）",
+                )
+            return True, f"{len(originals)} 件一致"
+
+        checks.append(Check("kimariji.brute_force", ds.size, kimariji_brute_force))
+
+    def engine_parity() -> tuple[bool, str]:
+        a = dataset_loader.load_from_zip_bytes(ds.zip_bytes, engine="csv")
+        b = dataset_loader.load_from_zip_bytes(ds.zip_bytes, engine="pandas")
+        if a[0] != b[0] or a[1] != b[1]:
+            return False, "かな/漢字ペアが一致しません"
+        if not a[2].equals(b[2]) or list(a[2].dtypes) != list(b[2].dtypes):
+            return False, "Tips 表が一致しません"
+        return True, f"{len(a[0])} 件一致"
+
+    checks.append(Check("load.engine_parity[csv=pandas]", ds.size, engine_parity))
+    return checks
+
+
+def build_fixed_checks() -> list[Check]:
+    """データセットの大きさによらない確認を返す。"""
+
+    def engine_parity_mixed() -> tuple[bool, str]:
+        import pandas as pd
+
+        ds = MIXED_DATASET
+        a = dataset_loader.load_from_zip_bytes(ds.zip_bytes, engine="csv")
+        b = dataset_loader.load_from_zip_bytes(ds.zip_bytes, engine="pandas")
+        if a[0] != b[0] or a[1] != b[1]:
+            return False, "かな/漢字ペアが一致しません"
+        if a[2]["決まり字"].tolist() != b[2]["決まり字"].tolist():
+            return False, "決まり字が一致しません"
+        # 既定のエンジンは pandas.read_csv と同じ型でヒントを返す
+        default = dataset_loader.load_from_zip_bytes(ds.zip_bytes)[2]["ヒント"]
+        want = pd.read_csv(io.BytesIO(ds.csv_bytes))["ヒント"]
+        if default.dtype != want.dtype or not default.equals(want):
+            return False, f"既定エンジンのヒントが read_csv と異なります（{default.dtype}）"
+        return True, f"{len(a[0])} 件一致（ヒント {default.dtype}）"
+
+    def game_throughput() -> tuple[bool, str]:
+        kana, kanji, _, _ = dataset_loader.load_from_zip_bytes(generate(100).zip_bytes)
+        game = GameEngine(
+            PairTable.from_pairs(kana, kanji),
+            rows=GAME_ROWS,
+            cols=GAME_COLS,
+            samples=GAME_SAMPLES,
+            miss_rate=0.1,
+            rng=random.Random(0),
+        )
+        game.simulate(THROUGHPUT_GAMES)  # 暖機
+        best = max(
+            (game.simulate(THROUGHPUT_GAMES) for _ in range(THROUGHPUT_REPEAT)),
+            key=lambda report: report.games_per_s,
+        )
+        detail = (
+            f"{best.games_per_s:,.0f} games/s（{best.clicks_per_s:,.0f} clicks/s、"
+            f"下限 {GAMES_PER_S_FLOOR:,} games/s）"
+        )
+        return best.games_per_s >= GAMES_PER_S_FLOOR, detail
+
+    return [
+        Check("load.engine_parity[numeric/NA]", MIXED_DATASET.size, engine_parity_mixed),
+        Check("game.throughput[miss_rate=0.1]", 100, game_throughput),
+    ]
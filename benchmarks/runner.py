@@ -0,0 +1,201 @@
+"""計測の実行・JSON 出力・比較。
+
+契約:
+- 各ケースは 1 回の暖機の後 repeat 回計る。1 回が短い（1ms 未満）ケースは、
+  1 計測あたり number 回まとめて実行して平均をとる。
+- 事前処理（before）は計測に含めない（キャッシュの破棄・新しいゲームの開始など）。
+- 比較は (name, size) ごとの最小値の比で行い、threshold を超えたものを後退とみなす
+  （最小値は他プロセスの影響を受けにくいため）。
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TypedDict
+
+SCHEMA_VERSION = 1
+
+# 1 計測あたりの最短時間（秒）。これより短いケースはまとめて実行する
+_MIN_SAMPLE_S = 0.001
+
+
+@dataclass(frozen=True)
+class Case:
+    """1 つの計測対象。
+
+    - run: 計測する処理
+    - before: 各回の前に呼ぶ準備（計測に含めない）
+    - ops: 1 回の run に含まれる操作数（1 操作あたりの時間の算出用）
+    """
+
+    name: str
+    size: int
+    run: Callable[[], object]
+    before: Callable[[], object] | None = None
+    ops: int = 1
+
+
+@dataclass(frozen=True)
+class Check:
+    """計測に付随する正しさの確認。run は (成否, 詳細) を返す。"""
+
+    name: str
+    size: int
+    run: Callable[[], tuple[bool, str]]
+
+
+class CaseResult(TypedDict):
+    """1 ケースの計測結果（秒）。"""
+
+    name: str
+    size: int
+    repeat: int
+    number: int
+    min_s: float
+    median_s: float
+    mean_s: float
+    ops: int
+    per_op_s: float
+
+
+class CheckResult(TypedDict):
+    name: str
+    size: int
+    ok: bool
+    detail: str
+
+
+class Report(TypedDict):
+    """結果 JSON の形式。"""
+
+    schema: int
+    meta: dict[str, object]
+    results: list[CaseResult]
+    checks: list[CheckResult]
+
+
+class CompareRow(TypedDict):
+    name: str
+    size: int
+    base_s: float
+    current_s: float
+    ratio: float
+    regression: bool
+
+
+def _calibrate(case: Case) -> int:
+    """1 計測あたりの実行回数を決める（before があるケースは常に 1）。"""
+    if case.before is not None:
+        return 1
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            case.run()
+        if time.perf_counter() - t0 >= _MIN_SAMPLE_S or number >= 1 << 16:
+            return number
+        number *= 4
+
+
+def measure(case: Case, repeat: int) -> CaseResult:
+    """ケースを計り、統計を返す。"""
+    if case.before is not None:
+        case.before()
+    case.run()
+    number = _calibrate(case)
+    samples: list[float] = []
+    for _ in range(max(1, repeat)):
+        if case.before is not None:
+            case.before()
+        t0 = time.perf_counter()
+        for _ in range(number):
+            case.run()
+        samples.append((time.perf_counter() - t0) / number)
+    best = min(samples)
+    return {
+        "name": case.name,
+        "size": case.size,
+        "repeat": len(samples),
+        "number": number,
+        "min_s": best,
+        "median_s": statistics.median(samples),
+        "mean_s": statistics.fmean(samples),
+        "ops": case.ops,
+        "per_op_s": best / case.ops,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def metadata() -> dict[str, object]:
+    """実行環境の情報（比較時の参考）を返す。"""
+    return {
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def write_report(path: str, report: Report) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def load_report(path: str) -> Report:
+    with open(path, encoding="utf-8") as f:
+        report: Report = json.load(f)
+    return report
+
+
+def compare(base: Report, current: Report, threshold: float) -> list[CompareRow]:
+    """(name, size) ごとに最小値を比べた行を返す。ratio > threshold の行は regression=True。"""
+    base_by_key = {(r["name"], r["size"]): r for r in base.get("results", [])}
+    rows: list[CompareRow] = []
+    for r in current.get("results", []):
+        b = base_by_key.get((r["name"], r["size"]))
+        if b is None or not b["min_s"]:
+            continue
+        ratio = r["min_s"] / b["min_s"]
+        rows.append(
+            {
+                "name": r["name"],
+                "size": r["size"],
+                "base_s": b["min_s"],
+                "current_s": r["min_s"],
+                "ratio": ratio,
+                "regression": ratio > threshold,
+            }
+        )
+    return rows
+
+
+def format_seconds(sec: float) -> str:
+    if sec >= 1:
+        return f"{sec:.3f}s"
+    if sec >= 1e-3:
+        return f"{sec * 1e3:.2f}ms"
+    return f"{sec * 1e6:.1f}us"
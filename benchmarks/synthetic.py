@@ -0,0 +1,74 @@
+"""合成データセットの生成。
+
+契約:
+- 同じ (枚数, seed) からは同じバイト列を生成する。
+- 列構成は同梱の CSV と同じ（id, 上の句, 下の句, 上の句（ひらがな）, 下の句（ひらがな）, ヒント）。
+- 上の句かなは 5-7-5 音の句を空白区切りで作る。先頭の音は偏りを持たせ、枚数が増えるほど
+  決まり字が長くなるようにする（実データの「大山札」に近い分布）。
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import random
+import zipfile
+from dataclasses import dataclass
+from functools import cached_property
+
+_KANA = (
+    "あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよらりるれろわをん"
+    "がぎぐげござじずぜぞだぢづでどばびぶべぼぱぴぷぺぽ"
+)
+_KANJI = (
+    "秋田春夏冬山川風月花雪空雲海波浪夜朝露袖衣手人恋思君我世今昔音声庵苫宿道松竹梅桜紅葉白妙天香具"
+)
+
+HEADER = ["id", "上の句", "下の句", "上の句（ひらがな）", "下の句（ひらがな）", "ヒント"]
+
+
+@dataclass(frozen=True)
+class SyntheticDataset:
+    """生成した 1 データセット分のバイト列。"""
+
+    size: int
+    csv_bytes: bytes
+
+    @cached_property
+    def zip_bytes(self) -> bytes:
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("dataset/cards.csv", self.csv_bytes)
+        return buf.getvalue()
+
+    @property
+    def multi_bytes(self) -> dict[str, bytes]:
+        return {"cards.csv": self.csv_bytes}
+
+
+def _phrase(rng: random.Random, alphabet: str, n: int) -> str:
+    return "".join(rng.choice(alphabet) for _ in range(n))
+
+
+def _verse(rng: random.Random, alphabet: str, lengths: tuple[int, ...]) -> str:
+    return " ".join(_phrase(rng, alphabet, n) for n in lengths)
+
+
+def generate(size: int, seed: int = 0) -> SyntheticDataset:
+    """size 枚の合成データセットを生成する。"""
+    rng = random.Random(seed * 1_000_003 + size)
+    # 先頭の音は少数の候補に偏らせる（上位の音ほど多くの札が共有する）
+    heads = _KANA[:20]
+    weights = [1.0 / (i + 1) for i in range(len(heads))]
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(HEADER)
+    for i in range(size):
+        head = rng.choices(heads, weights)[0]
+        kana_upper = head + _verse(rng, _KANA, (4, 7, 5))
+        kana_lower = _verse(rng, _KANA, (7, 7))
+        kanji_upper = _verse(rng, _KANJI, (3, 4, 3))
+        kanji_lower = _verse(rng, _KANJI, (4, 4))
+        hint = f"判定:『{kana_upper[:3]}』まで（合成データ {i}）。"
+        writer.writerow([i, kanji_upper, kanji_lower, kana_upper, kana_lower, hint])
+    return SyntheticDataset(size=size, csv_bytes=out.getvalue().encode("utf-8"))
@@ -2,33 +2,49 @@
 公式ルールページ
 - セッション内の画像（ZIP/個別で読み込まれたもの）があれば表示します。
 - 画像が無い場合は何も表示せず、ページ（タイトル・キャプション）のみを示します。
+  読み込み時に画像を外した場合（不正な PNG・大きすぎる画像）はその理由を警告として示します。
+- 画像は読み込み時に縮小・再圧縮済みのものを、内容ハッシュ由来のメディア URL で参照します
+  （再訪問時はブラウザのキャッシュから表示され、base64 の再エンコード・再送信をしない）。
 """
 
 import base64
+from functools import lru_cache
 
 import streamlit as st
 
+from src.competitive_karuta_trainer.adapters.session_store_streamlit import StSessionStore
+from src.competitive_karuta_trainer.services import data_access
 from src.competitive_karuta_trainer.services.config_loader import get_official_rule_subheader_text
+from src.competitive_karuta_trainer.ui.media import media_url
+
+
+@lru_cache(maxsize=4)
+def _data_uri(data: bytes, mimetype: str) -> str:
+    """メディア URL を使えない場合の data URI（画像ごとにメモ化）。"""
+    return f"data:{mimetype};base64," + base64.b64encode(data).decode("utf-8")
+
 
 # ページ設定
 st.set_page_config(page_title="公式ルール", layout="wide")
 st.title("公式ルール")
 st.caption(get_official_rule_subheader_text())
 
-img_bytes: bytes | None = st.session_state.get("rule_image_bytes")
+store = StSessionStore()
+rule = data_access.get_rule_image(store)
 
-if img_bytes is None:
+if rule is None:
+    for warning in data_access.get_dataset_warnings(store):
+        st.warning(warning)
     # 画像が無い場合はなにも表示しない（ページ遷移は可能）
     st.stop()
 
-try:
-    b64 = base64.b64encode(img_bytes).decode("utf-8")
-    html = f"""
-    <div style="width:100%; display:flex; justify-content:center;">
-        <img src="data:image/*;base64,{b64}" alt="公式ルール"
-             style="height:95vh; max-width:100%; width:auto; object-fit:contain;" />
-    </div>
-    """
-    st.markdown(html, unsafe_allow_html=True)
-except Exception as e:
-    st.error(f"画像の読み込みに失敗しました: {e}")
+src = media_url(rule.data, rule.mimetype, "karuta-rule-image") or _data_uri(
+    rule.data, rule.mimetype
+)
+html = f"""
+<div style="width:100%; display:flex; justify-content:center;">
+    <img src="{src}" alt="公式ルール" width="{rule.width}" height="{rule.height}"
+         style="height:95vh; max-width:100%; width:auto; object-fit:contain;" />
+</div>
+"""
+st.markdown(html, unsafe_allow_html=True)
@@ -0,0 +1,40 @@
+"""インメモリのセッション状態アダプタ。
+
+目的:
+- Streamlit を使わずにサービス層を動かす（シミュレーション・計測・検証）ための SessionStore 実装。
+
+使い方:
+- `InMemorySessionStore()` を生成してサービス関数へ渡す。
+- `stats()` で書き込み回数（set / 一括反映）を参照できる。
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from src.competitive_karuta_trainer.app.ports.session_store import SessionStore
+
+
+class InMemorySessionStore(SessionStore):
+    """dict に状態を保持する SessionStore。"""
+
+    def __init__(self, initial: Mapping[str, Any] | None = None) -> None:
+        self.data: dict[str, Any] = dict(initial or {})
+        self.sets = 0
+        self.commits = 0
+
+    def get(self, key: str, default: Any = None) -> Any:  # noqa: ANN401 - UI 橋渡しのため Any 許容
+        return self.data.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401 - UI 橋渡しのため Any 許容
+        self.data[key] = value
+        self.sets += 1
+
+    def set_many(self, values: Mapping[str, Any]) -> None:
+        self.data.update(values)
+        self.commits += 1
+
+    def stats(self) -> dict[str, int]:
+        """個別の set 回数と一括反映の回数を返す。"""
+        return {"sets": self.sets, "commits": self.commits, "keys": len(self.data)}
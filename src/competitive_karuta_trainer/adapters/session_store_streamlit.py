@@ -10,6 +10,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
 from src.competitive_karuta_trainer.app.ports.session_store import SessionStore
@@ -27,3 +28,8 @@ class StSessionStore(SessionStore):
         import streamlit as st
 
         st.session_state[key] = value
+
+    def set_many(self, values: Mapping[str, Any]) -> None:
+        import streamlit as st
+
+        st.session_state.update(values)
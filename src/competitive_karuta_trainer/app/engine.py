@@ -0,0 +1,174 @@
+"""UI を介さずにゲームを進めるエンジン。
+
+目的:
+- `services/app_state`・`services/gameplay` のイベント処理を、インメモリの SessionStore 上で直接呼び出す。
+- ブラウザ無しで多数のゲームを通しで実行し、ホットパスの計測やスループットの回帰確認に使う。
+
+使い方:
+- `GameEngine(PairTable.from_pairs(kana, kanji))` を作り、`play()` で 1 ゲーム、
+  `simulate(n)` で n ゲームを実行する。
+- 反応時間は `reaction` に乱数生成器を受け取る関数で与える（既定は対数正規分布）。
+
+契約:
+- 音声は使わない（常にミュートで進める）。
+- 使用札の抽出・ミス・反応時間はエンジンの乱数生成器（`rng`）に従う。
+  山札のシャッフル・ターゲット選択はドメイン層の `random` モジュールに従うため、
+  ゲーム全体の再現性が必要な場合は `rng` に加えて `random.seed` も設定すること。
+- 反応時間は、クリック直前に `target_started_at` を反応時間の分だけ遡らせて記録させる。
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from src.competitive_karuta_trainer.adapters.session_store_memory import InMemorySessionStore
+from src.competitive_karuta_trainer.domain import PairTable
+from src.competitive_karuta_trainer.services import app_state, data_access, gameplay
+from src.competitive_karuta_trainer.services.results import GameSummary, summarize_results
+
+# 反応時間の関数（乱数生成器 -> 秒）
+ReactionModel = Callable[[random.Random], float]
+
+
+def lognormal_reaction(median: float = 2.0, sigma: float = 0.5) -> ReactionModel:
+    """中央値 median 秒の対数正規分布の反応時間を返す関数を作る。"""
+    mu = math.log(median)
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+
+@dataclass(frozen=True)
+class SimulationReport:
+    """simulate() の集計。"""
+
+    games: int
+    clicks: int
+    misses: int
+    elapsed_s: float
+    summaries: list[GameSummary]
+
+    @property
+    def games_per_s(self) -> float:
+        return self.games / self.elapsed_s if self.elapsed_s > 0 else float("inf")
+
+    @property
+    def clicks_per_s(self) -> float:
+        return self.clicks / self.elapsed_s if self.elapsed_s > 0 else float("inf")
+
+
+class GameEngine:
+    """インメモリの SessionStore 上でゲームを進めるヘッドレスのエンジン。"""
+
+    def __init__(
+        self,
+        table: PairTable,
+        *,
+        mode: str = "kana",
+        rows: int = 5,
+        cols: int = 4,
+        samples: int = 30,
+        miss_rate: float = 0.0,
+        reaction: ReactionModel | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.rows = int(rows)
+        self.cols = int(cols)
+        self.samples = int(samples)
+        self.miss_rate = float(miss_rate)
+        self.reaction = reaction or lognormal_reaction()
+        self.rng = rng or random.Random()
+        self.store = InMemorySessionStore()
+        app_state.initialize_state(self.store)
+        # 設定は複製してから書き換える（初期化で作られた辞書をその場で変更しない）
+        settings = dict(self.store.get("settings") or {})
+        settings.update(
+            {
+                "mode": mode,
+                "rows": self.rows,
+                "cols": self.cols,
+                "samples": self.samples,
+                "muted": True,
+            }
+        )
+        self.store.set("settings", settings)
+        self.store.set("muted", True)
+        data_access.set_pair_table(self.store, table, mode)
+
+    def start(self) -> None:
+        """スタートボタンと同じ手順で新しいゲームを始める（使用札は無作為抽出）。"""
+        gameplay.sync_mode_pairs(self.store)
+        all_pairs = data_access.get_pairs(self.store)
+        if len(all_pairs) >= self.samples:
+            # 行を全件作らないよう、位置を抽出してから札を取り出す
+            selected = [all_pairs[i] for i in self.rng.sample(range(len(all_pairs)), self.samples)]
+        else:
+            selected = list(all_pairs)
+        app_state.reset_game(self.store, selected, self.rows, self.cols)
+        gameplay.start_game(self.store, selected, self.rows, self.cols)
+
+    @property
+    def finished(self) -> bool:
+        return self.store.get("target_id") is None
+
+    def take(self, reaction_s: float) -> None:
+        """反応時間 reaction_s 秒でターゲットの札を取る。"""
+        target_id = self.store.get("target_id")
+        board = data_access.get_board(self.store)
+        if target_id is None or board is None:
+            return
+        pos = board.position(target_id)
+        if pos is None:
+            return
+        self.store.set("target_started_at", time.time() - float(reaction_s))
+        gameplay.handle_cell_click(self.store, *pos)
+
+    def miss(self) -> bool:
+        """ターゲット以外の札をクリックする。盤面に他の札が無ければ False。"""
+        target_id = self.store.get("target_id")
+        board = data_access.get_board(self.store)
+        if target_id is None or board is None:
+            return False
+        others = [cid for cid in board.cards() if cid != target_id]
+        if not others:
+            return False
+        pos = board.position(self.rng.choice(others))
+        if pos is None:
+            return False
+        gameplay.handle_cell_click(self.store, *pos)
+        return True
+
+    def play(self) -> GameSummary:
+        """1 ゲームを最後まで進め、結果の集計を返す。"""
+        self.start()
+        while not self.finished:
+            if self.miss_rate > 0 and self.rng.random() < self.miss_rate:
+                self.miss()
+            self.take(self.reaction(self.rng))
+        return self.results()
+
+    def results(self) -> GameSummary:
+        """現在のゲームの結果を集計する。"""
+        return summarize_results(self.store)
+
+    def simulate(self, games: int) -> SimulationReport:
+        """games 回のゲームを続けて実行し、所要時間とクリック数を集計する。"""
+        summaries: list[GameSummary] = []
+        clicks = 0
+        misses = 0
+        t0 = time.perf_counter()
+        for _ in range(int(games)):
+            summary = self.play()
+            summaries.append(summary)
+            miss = int(self.store.get("miss", 0))
+            clicks += int(self.store.get("score", 0)) + miss
+            misses += miss
+        return SimulationReport(
+            games=len(summaries),
+            clicks=clicks,
+            misses=misses,
+            elapsed_s=time.perf_counter() - t0,
+            summaries=summaries,
+        )
@@ -1,7 +1,7 @@
 import streamlit as st
 
 from src.competitive_karuta_trainer.adapters.session_store_streamlit import StSessionStore
-from src.competitive_karuta_trainer.services import app_state, data_access
+from src.competitive_karuta_trainer.services import app_state, data_access, perf
 from src.competitive_karuta_trainer.services.audio_playback import maybe_get_scheduled_autoplay
 from src.competitive_karuta_trainer.services.config_loader import get_app_title, set_runtime_config
 from src.competitive_karuta_trainer.ui.audio_player import (
@@ -13,11 +13,19 @@ from src.competitive_karuta_trainer.ui.board import handle_click, render_board
 from src.competitive_karuta_trainer.ui.header import render_header
 from src.competitive_karuta_trainer.ui.landing import render_upload_ui
 from src.competitive_karuta_trainer.ui.muted_stream import render_muted_stream
+from src.competitive_karuta_trainer.ui.perf_panel import render_perf_panel
 from src.competitive_karuta_trainer.ui.sidebar import render_sidebar
 from src.competitive_karuta_trainer.ui.status import render_status_and_results
 
 
 def main():
+    # 再実行ごとに各段階の所要時間を記録し、有効なら計測パネルに表示する
+    with perf.rerun() as trace:
+        _run()
+    render_perf_panel(trace)
+
+
+def _run():
     # ページ設定は「アップロード前は常に既定タイトル」に固定する。
     # Streamlit の仕様上 set_page_config は最初に 1 度だけ呼ぶ必要があるため、
     # ここでは固定の既定タイトルを使い、データ読込後の見出しは別途動的に描画する。
@@ -26,7 +34,8 @@ def main():
 
     try:
         store = StSessionStore()
-        app_state.initialize_state(store)
+        with perf.span("initialize_state"):
+            app_state.initialize_state(store)
     except Exception as e:
         st.error(f"データ読み込みに失敗しました: {e}")
         return
@@ -47,43 +56,51 @@ def main():
         st.title(get_app_title(default_title))
 
     # サイドバー: 設定 UI
-    render_sidebar(store)
+    with perf.span("render_sidebar"):
+        render_sidebar(store)
 
     # ランディング: データ未読込ならメインエリアをアップロード画面にする
     if len(st.session_state.pairs) == 0:
         # アップロード画面ではゲームUIを表示しない
-        render_upload_ui(reset_game=lambda pairs: app_state.reset_game(store, pairs))
+        with perf.span("render_upload_ui"):
+            render_upload_ui(reset_game=lambda pairs: app_state.reset_game(store, pairs))
         return
 
     # ここから下はデータ読込済み時のゲームUI
     # ヘッダー操作（スタート + 音声プレーヤー置き場）
-    audio_placeholder = render_header(
-        store,
-        reset_game=lambda pairs, rows, cols: app_state.reset_game(store, pairs, rows, cols),
-    )
+    with perf.span("render_header"):
+        audio_placeholder = render_header(
+            store,
+            reset_game=lambda pairs, rows, cols: app_state.reset_game(store, pairs, rows, cols),
+        )
 
     # リセット時に自動で計測を開始するため、専用の計測開始ボタンは設置しない
 
     # ステータス表示と終了時の結果、ミュート時の上の句ストリーム
     target = data_access.get_pair(store, store.get("target_id"))
-    render_status_and_results(target)
-    render_muted_stream(target)
+    with perf.span("render_status_and_results"):
+        render_status_and_results(target)
+    with perf.span("render_muted_stream"):
+        render_muted_stream(target)
 
     # 音声プレースホルダ
-    render_audio_player(
-        audio_placeholder,
-        store,
-        store.get("target_id"),
-    )
+    with perf.span("render_audio_player"):
+        render_audio_player(
+            audio_placeholder,
+            store,
+            store.get("target_id"),
+        )
 
     # 盤面（ゲーム中のみ表示。結果画面では非表示）
     # target が None のときは全札取得完了＝結果表示中のため、ボードと区切り線を出さない。
     if target is not None:
         st.divider()
-        render_board(lambda r, c: handle_click(store, r, c))
+        with perf.span("render_board"):
+            render_board(lambda r, c: handle_click(store, r, c))
 
     # スケジュールされた自動再生（サービスで判定し、UIで描画）
-    attempted, audio_bytes, player_id = maybe_get_scheduled_autoplay(store)
+    with perf.span("maybe_get_scheduled_autoplay"):
+        attempted, audio_bytes, player_id = maybe_get_scheduled_autoplay(store)
     if attempted:
         if audio_bytes and player_id:
             defer_ms = int(store.get("autoplay_defer_ms") or 0)
@@ -4,11 +4,22 @@
 目的:
 - UI 依存の具体実装（例: Streamlit の session_state）からアプリ/サービスを切り離す。
 - サービス層は本ポート（Protocol）にのみ依存する。
+- 1 つのイベント処理内の書き込みをまとめ、最後に 1 回で反映するトランザクションを提供する。
+  トランザクションが取り消せるのは set した値だけで、取得したオブジェクト（盤面・決まり字の
+  追跡・dict 等）をその場で変更した分は取り消せない（`SessionTransaction` を参照）。
 """
 
 from __future__ import annotations
 
-from typing import Any, Protocol
+import functools
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from typing import Any, Concatenate, ParamSpec, Protocol, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_MISSING = object()
 
 
 class SessionStore(Protocol):
@@ -17,6 +28,7 @@ class SessionStore(Protocol):
     契約:
     - dict 風の get/set を提供する。
     - 値の型は任意（UI/サービス間の橋渡しのため）。
+    - set_many は複数キーの一括反映（`transaction` の commit はこれで 1 回だけ反映する）。
     """
 
     def get(self, key: str, default: Any = None) -> Any:  # noqa: ANN401 - UI 橋渡しのため Any 許容
@@ -24,3 +36,104 @@ class SessionStore(Protocol):
 
     def set(self, key: str, value: Any) -> None:  # noqa: ANN401 - UI 橋渡しのため Any 許容
         """キーに値を設定する。"""
+
+    def set_many(self, values: Mapping[str, Any]) -> None:
+        """複数のキーをまとめて設定する。"""
+
+
+class SessionTransaction:
+    """下位のストアへの書き込みを溜め、commit で一括反映する SessionStore。
+
+    現状の契約:
+    - get は溜めている値を優先し、無ければ下位のストアから読む。
+    - 下位のストアの現在値と同一オブジェクトの set は変更とみなさない（dirty に含めない）。
+      取得した dict 等をその場で変更して set し直す書き方は、反映済みのため書き込みが発生しない。
+    - commit は dirty なキーだけを下位のストアの `set_many` で 1 回で反映する。
+    - rollback が破棄するのは set した値だけ。取得したオブジェクトへのその場の変更
+      （例: `Board.remove`/`refill`、`LiveKimariji.remove`、`card_times` 等の dict への追加）は
+      下位のストアの値そのものを変えているため取り消せない。例外で中断した処理は、その時点までの
+      その場の変更を残す（スナップショットは取らない。盤面等を毎回複製すると 1 クリックの処理が
+      札数に比例して重くなるため）。例外を送出しうる処理は、その場の変更より前に行うこと。
+    """
+
+    def __init__(self, base: SessionStore) -> None:
+        self.base = base
+        self._staged: dict[str, Any] = {}
+
+    def get(self, key: str, default: Any = None) -> Any:  # noqa: ANN401 - UI 橋渡しのため Any 許容
+        value = self._staged.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        return self.base.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401 - UI 橋渡しのため Any 許容
+        if key not in self._staged and self.base.get(key, _MISSING) is value:
+            return
+        self._staged[key] = value
+
+    def set_many(self, values: Mapping[str, Any]) -> None:
+        for key, value in values.items():
+            self.set(key, value)
+
+    @property
+    def dirty(self) -> frozenset[str]:
+        """未反映のキー。"""
+        return frozenset(self._staged)
+
+    def commit(self) -> int:
+        """溜めた書き込みを下位のストアへ反映し、反映したキー数を返す。"""
+        staged, self._staged = self._staged, {}
+        if not staged:
+            return 0
+        self.base.set_many(staged)
+        return len(staged)
+
+    def rollback(self) -> None:
+        """溜めた書き込み（set した値）を破棄する。取得したオブジェクトへのその場の変更は残る。"""
+        self._staged.clear()
+
+
+@contextmanager
+def transaction(store: SessionStore) -> Iterator[SessionStore]:
+    """書き込みをまとめるトランザクションを開始する。
+
+    - 正常終了時に一括で反映し、例外時は溜めた書き込みを破棄する
+      （取得したオブジェクトへのその場の変更は残る。`SessionTransaction` を参照）。
+    - 既にトランザクション内のストアを渡した場合は、外側のトランザクションにそのまま合流する。
+    """
+    if isinstance(store, SessionTransaction):
+        yield store
+        return
+    tx = SessionTransaction(store)
+    try:
+        yield tx
+    except BaseException:
+        tx.rollback()
+        raise
+    tx.commit()
+
+
+def transactional(
+    func: Callable[Concatenate[SessionStore, P], R],
+) -> Callable[Concatenate[SessionStore, P], R]:
+    """第 1 引数のストアをトランザクションで包むデコレータ（サービス関数用）。
+
+    例外時に取り消せるのは set した値だけで、取得したオブジェクトへのその場の変更は残る
+    （`SessionTransaction` を参照）。
+    """
+
+    @functools.wraps(func)
+    def wrapper(store: SessionStore, *args: P.args, **kwargs: P.kwargs) -> R:
+        # `transaction` と同じ手順。クリックごとに呼ばれるため、コンテキストマネージャを介さない
+        if isinstance(store, SessionTransaction):
+            return func(store, *args, **kwargs)
+        tx = SessionTransaction(store)
+        try:
+            result = func(tx, *args, **kwargs)
+        except BaseException:
+            tx.rollback()
+            raise
+        tx.commit()
+        return result
+
+    return wrapper
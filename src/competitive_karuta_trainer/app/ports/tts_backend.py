@@ -0,0 +1,34 @@
+"""
+アプリケーション層のポート: 音声合成バックエンド
+
+目的:
+- 具体的な音声合成手段（gTTS / 録音済みファイル / オフライン用スタブ 等）からサービス層を切り離す。
+- サービス層は本ポート（Protocol）にのみ依存し、実装は設定で選択する。
+"""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+
+class TtsBackend(Protocol):
+    """音声合成バックエンドの抽象。
+
+    契約:
+    - 実装はハッシュ可能な値（frozen dataclass 等）とする。合成結果のメモリキャッシュは
+      バックエンドそのものをキーにする（等しいバックエンドは同じテキストに同じ音声を返す）。
+    - name: ディスクキャッシュのキーに含める識別子（同じ name なら同じテキストに同じ音声を返す）。
+    - cacheable: 合成結果をディスクキャッシュに保存する価値があるか（ローカル読込なら False）。
+    - synthesize: テキストから mp3 バイト列を返す。合成できない場合は None（例外は送出しない）。
+    """
+
+    @property
+    def name(self) -> str:
+        """ディスクキャッシュのキーに含める識別子。"""
+
+    @property
+    def cacheable(self) -> bool:
+        """合成結果をディスクキャッシュに保存するか。"""
+
+    def synthesize(self, text: str, lang: str) -> bytes | None:
+        """テキストを音声(mp3)のバイト列に変換する。"""
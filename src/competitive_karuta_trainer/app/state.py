@@ -11,9 +11,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
-from src.competitive_karuta_trainer.domain import Grid, Pair
+from src.competitive_karuta_trainer.domain import Grid, Pair, PairLookup
 
 
 @dataclass
@@ -35,7 +36,7 @@ class AppState:
     """アプリケーション全体の状態。
 
     現状の契約:
-    - pairs/pairs_by_id は問題データを保持する。
+    - pairs/pairs_by_id は問題データを保持する（札表から設定した場合はどちらも `PairView`）。
     - deck は残り札の ID 群を保持する。
     - grid は盤面の配置を表す。
     - target_id は現在のターゲット札 ID。
@@ -45,8 +46,8 @@ class AppState:
     """
 
     # データ
-    pairs: list[Pair] = field(default_factory=list)
-    pairs_by_id: dict[int, Pair] = field(default_factory=dict)
+    pairs: Sequence[Pair] = field(default_factory=list)
+    pairs_by_id: PairLookup = field(default_factory=dict[int, Pair])
 
     # 盤面
     deck: list[int] = field(default_factory=list)
@@ -63,6 +64,7 @@ class AppState:
     muted: bool = False
     autoplay_at: float | None = None  # epoch seconds
     last_streamed_target_id: int | None = None
+    streamed_at: float | None = None  # 上の句ストリームの表示開始（epoch seconds）
 
     # 計時/記録
     timing_started: bool = False
@@ -4,11 +4,20 @@
 """
 
 from src.competitive_karuta_trainer.domain.constants import FILE_ALIASES, STREAMING_CHAR_DELAY
-from src.competitive_karuta_trainer.domain.data import Pair, index_by_id
+from src.competitive_karuta_trainer.domain.data import (
+    PAIR_MODES,
+    Pair,
+    PairLookup,
+    PairTable,
+    PairView,
+    index_by_id,
+)
 from src.competitive_karuta_trainer.domain.game import (
+    Board,
     Grid,
     choose_target_from_grid,
     grid_positions,
+    init_board,
     init_deck,
     init_grid,
     refill_cell,
@@ -18,11 +27,17 @@ from src.competitive_karuta_trainer.domain.game import (
 __all__ = [
     # data
     "Pair",
+    "PairLookup",
+    "PairTable",
+    "PairView",
+    "PAIR_MODES",
     "index_by_id",
     # game
     "Grid",
     "init_deck",
     "init_grid",
+    "Board",
+    "init_board",
     "grid_positions",
     "choose_target_from_grid",
     "refill_cell",
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import csv
+import itertools
 import pathlib
 import re
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
+from typing import Protocol, overload
 
-import pandas as pd
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Pair:
     """札のペア（上の句/下の句）。
 
@@ -41,6 +43,61 @@ def _normalize_text(s: str) -> str:
     return s
 
 
+def normalize_texts(values: Iterable[object]) -> list[str]:
+    """値の並びに `_normalize_text` を列単位でまとめて適用する。
+
+    契約:
+    - 結果は要素ごとに `_normalize_text(str(v))` を適用したものと同一（欠損 None/NaN は ""）。
+    - 全角スペースも `str.isspace()` の空白に含まれるため、置換・トリム・連続空白の圧縮は
+      `" ".join(s.split())` の 1 回で済む（正規表現は使わない）。
+    - 欠損の判定は列ごとに 1 回（`isna`）で行う。
+    - 値が文字列/None だけなら pandas を読み込まない。
+    """
+    isna = getattr(values, "isna", None)
+    if callable(isna):
+        # pandas.Series
+        items = list(values.tolist())  # type: ignore[attr-defined]
+        missing = list(isna().tolist())
+    else:
+        items = list(values)
+        if all(v is None or isinstance(v, str) for v in items):
+            missing = [v is None for v in items]
+        else:
+            import pandas as pd
+
+            missing = pd.isna(pd.Series(items, dtype=object)).tolist()
+    return [
+        "" if m else " ".join((v if isinstance(v, str) else str(v)).split())
+        for v, m in zip(items, missing, strict=True)
+    ]
+
+
+# pandas.read_csv が dtype=str でも欠損（NaN）として扱う既定の文字列
+CSV_NA_VALUES = frozenset(
+    {
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    }
+)
+
+
 def load_pairs(csv_path: str | pathlib.Path) -> list[Pair]:
     """CSV から (id, 上の句, 下の句) を読み込み、正規化した `Pair` のリストを返す。
 
@@ -50,78 +107,183 @@ def load_pairs(csv_path: str | pathlib.Path) -> list[Pair]:
     - 欠損や2列未満の行はスキップ
     - 重複 (kami, shimo) は1件に統合
     - 文字コードは UTF-8 を想定
+    - ローカルファイルは 1 回だけ先頭から走査する（`_scan_csv`）。URL は pandas で読み込む。
+    - ペアの作成（欠損スキップ・重複統合）は `pairs_from_columns` と共通
     """
     src = str(csv_path)
     is_url = src.startswith("http://") or src.startswith("https://")
-    path = pathlib.Path(src) if not is_url else None
     if not is_url:
-        assert path is not None
+        path = pathlib.Path(src)
         if not path.exists():
             raise FileNotFoundError(f"CSV not found: {path}")
+        with path.open("r", encoding="utf-8", newline="") as f:
+            return _pairs_from_rows(_scan_csv(f))
 
-        # engine='python' は区切りゆらぎへの寛容度が高い
-        df = pd.read_csv(path, header=0, sep=",", engine="python", dtype=str, encoding="utf-8")
-    else:
-        # URL から直接読み込む
-        df = pd.read_csv(src, header=0, sep=",", engine="python", dtype=str, encoding="utf-8")
-    # カラム名の空白を除去
-    df.rename(columns={c: c.strip() for c in df.columns}, inplace=True)
-
-    # 列名の候補に対応
-    col_kami = next((c for c in df.columns if c.replace(" ", "") in ("上の句", "上の句")), None)
-    col_shimo = next((c for c in df.columns if c.replace(" ", "") in ("下の句", "下の句")), None)
+    # URL から直接読み込む（生テキスト読取のフォールバックは実施しない）
+    import pandas as pd
+
+    df = pd.read_csv(src, header=0, sep=",", engine="python", dtype=str, encoding="utf-8")
+    col_kami, col_shimo = _pair_columns(list(df.columns))
+    return pairs_from_columns(df.iloc[:, col_kami], df.iloc[:, col_shimo])
+
+
+def _scan_csv(lines: Iterable[str]) -> Iterator[tuple[str, str]]:
+    """CSV テキストを 1 回だけ走査し、正規化した (上の句, 下の句) を順に返す。
+
+    - 標準CSV解釈: `pandas.read_csv(engine="python", dtype=str)` と同じ行・列の解釈
+      （先頭の非空行がヘッダー、空行はスキップ、既定の欠損文字列は欠損、
+      先頭 2 データ行の列数による index 列の推定、列数が多すぎる行・引用符の崩れは ValueError）。
+    - フォールバック: 先頭を除く各物理行を最初の「,」（無ければ「、」）で分割した候補。
+      同じ物理行の標準CSV解釈と異なるものだけを保持し、標準CSV解釈の全行の後ろに返す
+      （2 回読みしていた頃と同じ順序。同じものは標準CSV解釈の側で登録済みのため省ける）。
+    """
+    consumed: list[str] = []
+
+    def _tap() -> Iterator[str]:
+        # csv.reader が 1 レコードのために読んだ物理行を記録する
+        for line in lines:
+            consumed.append(line)
+            yield line
+
+    extra: list[tuple[str, str]] = []
+    skip_first_line = True
+
+    def _candidates(physical: list[str]) -> list[tuple[str, str]]:
+        nonlocal skip_first_line
+        out: list[tuple[str, str]] = []
+        for raw in physical:
+            # read().splitlines() と同じ行分割にする（改行以外の行区切り文字でも分ける）
+            for line in raw.splitlines():
+                if skip_first_line:
+                    skip_first_line = False
+                    continue
+                key = _split_fallback_line(line)
+                if key is not None:
+                    out.append(key)
+        return out
+
+    header: list[str] | None = None
+    col_kami, col_shimo = 0, 1
+    # 先頭データ行（列の位置合わせが 2 行目で決まるまで保留する）、列の位置ずれ、許容する列数
+    pending: tuple[list[str], list[tuple[str, str]]] | None = None
+    offset: int | None = None
+    max_fields = 0
+
+    def _row_pair(row: list[str], candidates: list[tuple[str, str]]) -> tuple[str, str] | None:
+        assert offset is not None
+        if len(row) > max_fields:
+            raise ValueError(f"CSV の列数が多すぎます（{max_fields} 列のところ {len(row)} 列）。")
+        kami = _csv_cell(row, col_kami + offset)
+        shimo = _csv_cell(row, col_shimo + offset)
+        key = None
+        if kami is not None and shimo is not None:
+            key = (_normalize_text(kami), _normalize_text(shimo))
+        extra.extend(c for c in candidates if c != key)
+        return key
+
+    # pandas の python エンジンと同じく strict（引用符の直後に区切りが無い等は csv.Error）
+    reader = csv.reader(_tap(), strict=True)
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            break
+        except csv.Error as e:
+            raise ValueError(f"CSV を解析できません: {e}") from e
+        candidates = _candidates(consumed)
+        consumed.clear()
+        if header is None and row:
+            # pandas と同じく先頭の BOM は列名に含めない
+            row[0] = row[0].removeprefix("﻿")
+        if not row or (len(row) == 1 and not row[0].strip()):
+            extra.extend(candidates)
+        elif header is None:
+            header = row
+            col_kami, col_shimo = _pair_columns(header)
+            extra.extend(candidates)
+        elif offset is not None:
+            key = _row_pair(row, candidates)
+            if key is not None:
+                yield key
+        elif pending is None:
+            pending = (row, candidates)
+        else:
+            (first, first_candidates), pending = pending, None
+            # pandas と同じ位置合わせ:
+            # - 2 行目の列数が「先頭行 + ヘッダー」なら先頭行は index 名の行（データではない）
+            # - そうでなければ先頭行がヘッダーより多い分の先頭列を index とみなす
+            if len(row) == len(first) + len(header):
+                offset = len(first)
+                max_fields = len(row)
+                extra.extend(first_candidates)
+            else:
+                offset = max(0, len(first) - len(header))
+                max_fields = len(header) + offset
+                key = _row_pair(first, first_candidates)
+                if key is not None:
+                    yield key
+            key = _row_pair(row, candidates)
+            if key is not None:
+                yield key
+    extra.extend(_candidates(consumed))
+    if header is None:
+        raise ValueError("CSV の列が不足しています（上の句/下の句）。")
+    if pending is not None:
+        first, first_candidates = pending
+        offset = max(0, len(first) - len(header))
+        max_fields = len(header) + offset
+        key = _row_pair(first, first_candidates)
+        if key is not None:
+            yield key
+    yield from extra
+
+
+def _pair_columns(header: Sequence[str]) -> tuple[int, int]:
+    """列名から上の句/下の句の列位置を返す（判別できなければ先頭2列）。"""
+    # カラム名の空白を除去して照合する
+    names = [c.strip().replace(" ", "") for c in header]
+    col_kami = next((i for i, c in enumerate(names) if c == "上の句"), None)
+    col_shimo = next((i for i, c in enumerate(names) if c == "下の句"), None)
     if col_kami is None or col_shimo is None:
         # 列名が判別できない場合は先頭2列を使う
-        if len(df.columns) >= 2:
-            col_kami, col_shimo = df.columns[:2]
-        else:
-            raise ValueError("CSV の列が不足しています（上の句/下の句）。")
+        if len(header) >= 2:
+            return 0, 1
+        raise ValueError("CSV の列が不足しています（上の句/下の句）。")
+    return col_kami, col_shimo
 
-    records: list[Pair] = []
-    seen: set[tuple[str, str]] = set()
-    # まずは標準CSV解釈の行から作成
-    for _, row in df.iterrows():
-        kami_raw = row.get(col_kami)
-        shimo_raw = row.get(col_shimo)
-        if pd.isna(kami_raw) or pd.isna(shimo_raw):
-            # 列が欠損している行はスキップ
-            continue
-        kami = _normalize_text(str(kami_raw))
-        shimo = _normalize_text(str(shimo_raw))
-        if not kami or not shimo:
-            continue
-        key = (kami, shimo)
-        if key in seen:
-            continue
-        seen.add(key)
-        records.append(Pair(id=len(records), kami=kami, shimo=shimo))
 
-    # 追加のフォールバック: 行テキストを直接読み、区切りが「,」で無い場合は最初の「、」で分割
-    # 既存の records に無いものを補完
-    # URL の場合は生テキスト読取のフォールバックは実施しない
-    data_lines: list[str] = []
-    if not is_url:
-        assert path is not None
-        with path.open("r", encoding="utf-8") as f:
-            lines = f.read().splitlines()
-        if lines:
-            # ヘッダーをスキップ
-            data_lines = lines[1:]
-
-    for line in data_lines:
-        if not line.strip():
-            continue
-        # 既にCSVで読めている行はほぼ同一だが、安全のため同じロジックで正規化
-        if "," in line:
-            parts = line.split(",", 1)
-        elif "、" in line:
-            parts = line.split("、", 1)
-        else:
-            continue
-        if len(parts) != 2:
-            continue
-        kami = _normalize_text(parts[0])
-        shimo = _normalize_text(parts[1])
+def _csv_cell(row: list[str], index: int) -> str | None:
+    """行の index 列の値を返す。列が無い・既定の欠損文字列なら None。"""
+    if index >= len(row):
+        return None
+    value = row[index]
+    return None if value in CSV_NA_VALUES else value
+
+
+def _split_fallback_line(line: str) -> tuple[str, str] | None:
+    """行を最初の「,」（無ければ「、」）で分割し、正規化した (上の句, 下の句) を返す。"""
+    if not line.strip():
+        return None
+    if "," in line:
+        parts = line.split(",", 1)
+    elif "、" in line:
+        parts = line.split("、", 1)
+    else:
+        return None
+    return _normalize_text(parts[0]), _normalize_text(parts[1])
+
+
+def _collect_pairs(
+    records: list[Pair],
+    seen: set[tuple[str, str]],
+    rows: Iterable[tuple[str, str]],
+) -> None:
+    """正規化済みの (上の句, 下の句) の並びから `Pair` を作り records に追加する。
+
+    - 空（欠損を含む）の行はスキップ
+    - 既に seen にある (kami, shimo) はスキップし、新規分は seen に登録
+    """
+    for kami, shimo in rows:
         if not kami or not shimo:
             continue
         key = (kami, shimo)
@@ -130,12 +292,155 @@ def load_pairs(csv_path: str | pathlib.Path) -> list[Pair]:
         seen.add(key)
         records.append(Pair(id=len(records), kami=kami, shimo=shimo))
 
+
+def _pairs_from_rows(rows: Iterable[tuple[str, str]]) -> list[Pair]:
+    """正規化済みの (上の句, 下の句) の並びから `Pair` のリストを作る（空なら ValueError）。"""
+    records: list[Pair] = []
+    seen: set[tuple[str, str]] = set()
+    _collect_pairs(records, seen, rows)
     if not records:
         raise ValueError("CSV から有効な上の句/下の句ペアを読み込めませんでした。")
-
     return records
 
 
+def _normalized_rows(
+    kami_values: Iterable[object], shimo_values: Iterable[object]
+) -> Iterator[tuple[str, str]]:
+    # 正規化は列単位でまとめて行う（欠損は "" になり、追加時の空判定でスキップされる）
+    return zip(normalize_texts(kami_values), normalize_texts(shimo_values), strict=False)
+
+
+def pairs_from_columns(
+    kami_values: Iterable[object],
+    shimo_values: Iterable[object],
+    *,
+    fallback: tuple[Iterable[object], Iterable[object]] | None = None,
+) -> list[Pair]:
+    """解析済みの列（上の句/下の句の値の並び）から `Pair` のリストを作る。
+
+    `load_pairs` の標準CSV解釈と同じ正規化・欠損スキップ・重複統合を 1 パスで行う。
+    fallback（上の句/下の句の候補の並び）があれば、列から作った後ろに未登録のものだけを追加する。
+    ファイル I/O を伴わないため、読み取り専用の環境でも利用できる。
+    """
+    rows: Iterable[tuple[str, str]] = _normalized_rows(kami_values, shimo_values)
+    if fallback is not None:
+        rows = itertools.chain(rows, _normalized_rows(*fallback))
+    return _pairs_from_rows(rows)
+
+
 def index_by_id(pairs: list[Pair]) -> dict[int, Pair]:
     """`Pair` の id をキーにした辞書を作成して返す。"""
     return {p.id: p for p in pairs}
+
+
+class PairLookup(Protocol):
+    """id から `Pair` を引けるもの（`index_by_id` の辞書、または `PairView`）。"""
+
+    def get(self, pair_id: int, /) -> Pair | None: ...
+
+
+# 札データのモード
+PAIR_MODES = ("kana", "kanji")
+
+
+class PairView(Sequence[Pair]):
+    """`PairTable` の 1 モード分の読み取り専用ビュー。
+
+    - 並び（読み込み順）の Sequence として振る舞い、要素は参照のたびに作る `Pair`。
+    - `get(pair_id)` で id から引ける（`index_by_id` の辞書の代わりに使える）。
+    - 列は `ids`（連番なら range）・`kami`・`shimo` の並列タプルで保持する。
+    """
+
+    __slots__ = ("mode", "ids", "kami", "shimo", "_pos")
+
+    def __init__(
+        self,
+        mode: str,
+        ids: Sequence[int],
+        kami: tuple[str, ...],
+        shimo: tuple[str, ...],
+    ) -> None:
+        self.mode = mode
+        # id が 0..n-1 の連番（読み込み順）なら位置そのものを id とみなし、索引を持たない
+        if all(pid == i for i, pid in enumerate(ids)):
+            self.ids: Sequence[int] = range(len(ids))
+            self._pos: dict[int, int] | None = None
+        else:
+            self.ids = tuple(ids)
+            self._pos = {pid: i for i, pid in enumerate(self.ids)}
+        self.kami = kami
+        self.shimo = shimo
+
+    def __len__(self) -> int:
+        return len(self.kami)
+
+    @overload
+    def __getitem__(self, index: int) -> Pair: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Pair]: ...
+
+    def __getitem__(self, index: int | slice) -> Pair | list[Pair]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return Pair(id=self.ids[index], kami=self.kami[index], shimo=self.shimo[index])
+
+    def __iter__(self) -> Iterator[Pair]:
+        for pid, kami, shimo in zip(self.ids, self.kami, self.shimo, strict=True):
+            yield Pair(id=pid, kami=kami, shimo=shimo)
+
+    def position(self, pair_id: int) -> int | None:
+        """id の位置を返す。無ければ None。"""
+        if self._pos is not None:
+            return self._pos.get(pair_id)
+        if isinstance(pair_id, int) and 0 <= pair_id < len(self.kami):
+            return pair_id
+        return None
+
+    def get(self, pair_id: int | None, default: Pair | None = None) -> Pair | None:
+        """id の `Pair` を返す。無ければ default。"""
+        i = self.position(pair_id) if pair_id is not None else None
+        return default if i is None else self[i]
+
+    def __repr__(self) -> str:
+        return f"PairView(mode={self.mode!r}, n={len(self)})"
+
+
+class PairTable:
+    """かな・漢字の両モードの札データを列指向で保持する表。
+
+    現状の契約:
+    - モードごとに `PairView`（id・上の句・下の句の並列タプル）を 1 つずつ持つ。
+    - `view(mode)` は保持しているビューをそのまま返す（モード切替でコピーや索引の再構築をしない）。
+    - 文字列は元の `Pair` と共有し、行オブジェクトは保持しない。
+    """
+
+    __slots__ = ("_views",)
+
+    def __init__(self, views: dict[str, PairView]) -> None:
+        self._views = views
+
+    @classmethod
+    def from_pairs(cls, kana: Iterable[Pair], kanji: Iterable[Pair]) -> PairTable:
+        """かな・漢字の `Pair` 列から表を作る。"""
+        views: dict[str, PairView] = {}
+        for mode, pairs in (("kana", kana), ("kanji", kanji)):
+            rows = list(pairs)
+            views[mode] = PairView(
+                mode,
+                [p.id for p in rows],
+                tuple(p.kami for p in rows),
+                tuple(p.shimo for p in rows),
+            )
+        return cls(views)
+
+    def view(self, mode: str) -> PairView:
+        """モードのビューを返す（未知のモードはかな）。"""
+        return self._views[mode] if mode in self._views else self._views["kana"]
+
+    def __len__(self) -> int:
+        return len(self._views["kana"])
+
+    def __repr__(self) -> str:
+        sizes = ", ".join(f"{m}={len(v)}" for m, v in self._views.items())
+        return f"PairTable({sizes})"
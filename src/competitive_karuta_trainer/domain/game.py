@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import random
-from typing import Iterator, Tuple
+from collections.abc import Iterator
 
 # Grid の型は、整数の札 ID もしくは None を要素とする二次元配列
 Grid = list[list[int | None]]
@@ -32,27 +32,134 @@ def init_grid(deck: list[int], rows: int, cols: int) -> Grid:
     return grid
 
 
-def grid_positions(grid: Grid) -> Iterator[Tuple[int, int]]:
+class Board:
+    """盤面と、札のある位置の索引を一緒に保持する。
+
+    現状の契約:
+    - `grid` は従来どおりの二次元配列で、描画などからはそのまま参照してよい（直接書き換えないこと）。
+    - 札の配置・除去は `place`/`remove`/`refill` を通して行い、占有セルの一覧と
+      札 ID -> セルの対応を差分で更新する。
+    - `choose_target` と `remaining` は盤面を走査せず O(1) で求める。
+    """
+
+    __slots__ = ("grid", "_occupied", "_slot", "_where")
+
+    def __init__(self, grid: Grid) -> None:
+        self.grid = grid
+        # 占有セルの一覧（順不同）と、セル -> 一覧内の位置（削除を末尾との入れ替えで O(1) にする）
+        self._occupied: list[tuple[int, int]] = []
+        self._slot: dict[tuple[int, int], int] = {}
+        self._where: dict[int, tuple[int, int]] = {}
+        for r, c in grid_positions(grid):
+            card_id = grid[r][c]
+            if card_id is not None:
+                self._index(r, c, card_id)
+
+    @classmethod
+    def from_deck(cls, deck: list[int], rows: int, cols: int) -> Board:
+        """山札から rows×cols の盤面を作る（配置は `init_grid` と同じ）。"""
+        return cls(init_grid(deck, rows, cols))
+
+    def _index(self, r: int, c: int, card_id: int) -> None:
+        self._slot[(r, c)] = len(self._occupied)
+        self._occupied.append((r, c))
+        self._where[card_id] = (r, c)
+
+    @property
+    def rows(self) -> int:
+        return len(self.grid)
+
+    @property
+    def cols(self) -> int:
+        return len(self.grid[0]) if self.grid else 0
+
+    @property
+    def remaining(self) -> int:
+        """盤面に残っている札の枚数。"""
+        return len(self._occupied)
+
+    def card_at(self, r: int, c: int) -> int | None:
+        """セルの札 ID を返す（空なら None）。"""
+        return self.grid[r][c]
+
+    def position(self, card_id: int) -> tuple[int, int] | None:
+        """札のあるセルを返す。盤面に無ければ None。"""
+        return self._where.get(card_id)
+
+    def cards(self) -> list[int]:
+        """盤面に残っている札 ID を返す（順不同）。"""
+        return list(self._where)
+
+    def place(self, r: int, c: int, card_id: int) -> None:
+        """空きセルに札を置く。"""
+        if self.grid[r][c] is not None:
+            raise ValueError(f"セル ({r}, {c}) には既に札があります。")
+        self.grid[r][c] = card_id
+        self._index(r, c, card_id)
+
+    def remove(self, r: int, c: int) -> int | None:
+        """セルの札を取り除いて返す（空なら None）。"""
+        card_id = self.grid[r][c]
+        if card_id is None:
+            return None
+        self.grid[r][c] = None
+        i = self._slot.pop((r, c))
+        last = self._occupied.pop()
+        if last != (r, c):
+            self._occupied[i] = last
+            self._slot[last] = i
+        self._where.pop(card_id, None)
+        return card_id
+
+    def refill(self, r: int, c: int, deck: list[int]) -> None:
+        """セルが空なら deck から1枚補充する（無ければ空のまま）。"""
+        if self.grid[r][c] is None and deck:
+            self.place(r, c, deck.pop())
+
+    def choose_target(self) -> int | None:
+        """盤面の札からランダムに選んで返す。無ければ None。"""
+        if not self._occupied:
+            return None
+        r, c = random.choice(self._occupied)
+        return self.grid[r][c]
+
+
+def init_board(deck: list[int], rows: int, cols: int) -> Board:
+    """山札から rows×cols の `Board` を作る。"""
+    return Board.from_deck(deck, rows, cols)
+
+
+def grid_positions(grid: Grid) -> Iterator[tuple[int, int]]:
     """grid の実サイズに基づく走査位置を返す。"""
     for r, row in enumerate(grid):
         for c, _ in enumerate(row):
             yield r, c
 
 
-def choose_target_from_grid(grid: Grid) -> int | None:
-    """現在 grid に存在する id からランダムに選んで返す。無ければ None。"""
+def choose_target_from_grid(grid: Grid | Board) -> int | None:
+    """現在 grid に存在する id からランダムに選んで返す。無ければ None。
+
+    `Board` を渡した場合は占有セルの索引から選ぶ（盤面を走査しない）。
+    """
+    if isinstance(grid, Board):
+        return grid.choose_target()
     choices = [grid[r][c] for r, c in grid_positions(grid) if grid[r][c] is not None]
     if not choices:
         return None
     return random.choice(choices)
 
 
-def refill_cell(grid: Grid, r: int, c: int, deck: list[int]) -> None:
+def refill_cell(grid: Grid | Board, r: int, c: int, deck: list[int]) -> None:
     """指定セルが空なら deck から1枚補充する（無ければ None のまま）。"""
+    if isinstance(grid, Board):
+        grid.refill(r, c, deck)
+        return
     if grid[r][c] is None and deck:
         grid[r][c] = deck.pop()
 
 
-def remaining_on_grid(grid: Grid) -> int:
+def remaining_on_grid(grid: Grid | Board) -> int:
     """grid 上に残っている札の枚数を返す。"""
+    if isinstance(grid, Board):
+        return grid.remaining
     return sum(1 for r, c in grid_positions(grid) if grid[r][c] is not None)
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
-from src.competitive_karuta_trainer.app.ports.session_store import SessionStore
+from collections.abc import Sequence
+
+from src.competitive_karuta_trainer.app.ports.session_store import SessionStore, transactional
 from src.competitive_karuta_trainer.domain import (
     Pair,
-    choose_target_from_grid,
+    init_board,
     init_deck,
-    init_grid,
 )
 from src.competitive_karuta_trainer.services import data_access
+from src.competitive_karuta_trainer.services.audio import prefetch_grid_audio
 from src.competitive_karuta_trainer.services.config_loader import load_default_settings_values
+from src.competitive_karuta_trainer.services.kimariji import LiveKimariji
 
 
+@transactional
 def initialize_state(store: SessionStore) -> None:
     """アプリ起動時に必要なセッション状態を初期化する。
 
@@ -39,11 +43,11 @@ def initialize_state(store: SessionStore) -> None:
         settings = store.get("settings", {})
         rows = int(settings.get("rows", 5))
         cols = int(settings.get("cols", 4))
-        grid = init_grid(deck, rows, cols)
-        store.set("grid", grid)
+        board = init_board(deck, rows, cols)
+        data_access.set_board(store, board)
         store.set("active_rows", rows)
         store.set("active_cols", cols)
-        store.set("target_id", choose_target_from_grid(grid))
+        store.set("target_id", board.choose_target())
         # 情報表示用のデータ識別
         data_access.set_dataset_meta(store, "uploaded://pending", "kana")
         store.set("score", 0)
@@ -65,14 +69,17 @@ def initialize_state(store: SessionStore) -> None:
         store.set("card_times", {})
     if store.get("card_misses") is None:
         store.set("card_misses", {})
+    if store.get("card_kimariji") is None:
+        store.set("card_kimariji", {})
     # 音声キャッシュ
     if store.get("audio_cache") is None:
         store.set("audio_cache", {})
 
 
+@transactional
 def reset_game(
     store: SessionStore,
-    pairs_subset: list[Pair] | None = None,
+    pairs_subset: Sequence[Pair] | None = None,
     rows: int | None = None,
     cols: int | None = None,
 ) -> None:
@@ -87,9 +94,9 @@ def reset_game(
     cols_val = int(cols) if cols is not None else int(settings.get("cols", 4))
     deck = init_deck(pairs)
     store.set("deck", deck)
-    grid = init_grid(deck, rows_val, cols_val)
-    store.set("grid", grid)
-    store.set("target_id", choose_target_from_grid(grid))
+    board = init_board(deck, rows_val, cols_val)
+    data_access.set_board(store, board)
+    store.set("target_id", board.choose_target())
     store.set("score", 0)
     store.set("miss", 0)
     store.set("audio_cache", {})
@@ -108,3 +115,21 @@ def reset_game(
     store.set("target_started_at", None)
     store.set("card_times", {})
     store.set("card_misses", {})
+    # 読まれた札を除外しながら決まり字を追跡する（今回の使用札で初期化）
+    store.set("live_kimariji", build_live_kimariji(store, pairs))
+    store.set("card_kimariji", {})
+    # 新しい盤面の音声を先読みしておく
+    prefetch_grid_audio(store)
+
+
+def build_live_kimariji(store: SessionStore, pairs: Sequence[Pair]) -> LiveKimariji:
+    """使用札から `LiveKimariji` を構築する。
+
+    決まり字は上の句（かな）で判定するため、漢字モードでも同じ id のかなペアを用いる。
+    かなペアが無い札はその札自身の上の句を用いる。
+    """
+    table = data_access.get_pair_table(store)
+    if table is None:
+        return LiveKimariji((p.id, p.kami) for p in pairs)
+    kana = table.view("kana")
+    return LiveKimariji((p.id, (kana.get(p.id) or p).kami) for p in pairs)
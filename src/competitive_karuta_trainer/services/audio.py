@@ -1,35 +1,122 @@
 from __future__ import annotations
 
-from functools import lru_cache
-from io import BytesIO
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
 
 from src.competitive_karuta_trainer.app.ports.session_store import SessionStore
-from src.competitive_karuta_trainer.services import data_access
+from src.competitive_karuta_trainer.app.ports.tts_backend import TtsBackend
+from src.competitive_karuta_trainer.services import data_access, perf
+from src.competitive_karuta_trainer.services.audio_cache import get_audio_cache
+from src.competitive_karuta_trainer.services.audio_prefetch import AudioPrefetcher
+from src.competitive_karuta_trainer.services.config_loader import get_tts_settings
+from src.competitive_karuta_trainer.services.tts_backends import create_tts_backend
 
-try:
-    from gtts import gTTS
-except Exception:  # pragma: no cover - import error handling
-    gTTS = None  # type: ignore
+
+class _BackendStore:
+    explicit: TtsBackend | None = None
+    resolved: tuple[tuple[str, str | None], TtsBackend] | None = None
+
+
+_BACKEND_STORE = _BackendStore()
+_BACKEND_LOCK = threading.Lock()
+
+
+def set_tts_backend(backend: TtsBackend | None) -> None:
+    """使用する音声合成バックエンドを明示的に設定する。None で設定（環境変数）に戻す。"""
+    _BACKEND_STORE.explicit = backend
+
+
+def get_tts_backend() -> TtsBackend:
+    """現在の音声合成バックエンドを返す（明示設定 → 環境変数 → gtts）。"""
+    if _BACKEND_STORE.explicit is not None:
+        return _BACKEND_STORE.explicit
+    settings = get_tts_settings()
+    with _BACKEND_LOCK:
+        resolved = _BACKEND_STORE.resolved
+        if resolved is None or resolved[0] != settings:
+            backend = create_tts_backend(settings[0], local_dir=settings[1])
+            _BACKEND_STORE.resolved = (settings, backend)
+            return backend
+        return resolved[1]
 
 
-@lru_cache(maxsize=256)
 def synthesize_kami(text: str, lang: str = "ja") -> bytes | None:
     """上の句テキストから音声(mp3)のバイト列を生成して返す。
 
-    - gTTS のネットワーク障害などが起きた場合は None を返す。
-    - lru_cache でテキストごとの結果をメモリキャッシュ。
+    - 合成は現在のバックエンド（`get_tts_backend()`）に委譲する。
+    - 合成できない場合（ネットワーク障害など）は None を返す。
     """
     if not text:
         return None
-    if gTTS is None:
-        return None
-    try:
-        tts = gTTS(text=text, lang=lang)
-        bio = BytesIO()
-        tts.write_to_fp(bio)
-        return bio.getvalue()
-    except Exception:
-        return None
+    return _synthesize_with(get_tts_backend(), text, lang)
+
+
+# 合成結果のメモリキャッシュの件数
+SYNTH_MEMORY_ENTRIES = 256
+
+
+class _SynthMemo:
+    """合成に成功した音声の LRU メモリキャッシュ（キーは (バックエンド, テキスト, 言語)）。
+
+    - バックエンドはハッシュ可能な値（frozen dataclass）として比較する。同じ name でも
+      設定の異なるバックエンドの音声は取り違えない。
+    - 失敗（None）は保存しない（一時的な障害の後は次の要求で合成し直す）。
+    - 先読みのワーカーと描画スレッドから同時に使われるため、ロックで保護する。
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict[tuple[TtsBackend, str, str], bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[TtsBackend, str, str]) -> bytes | None:
+        with self._lock:
+            audio_bytes = self._entries.get(key)
+            if audio_bytes is not None:
+                self._entries.move_to_end(key)
+            return audio_bytes
+
+    def put(self, key: tuple[TtsBackend, str, str], audio_bytes: bytes) -> None:
+        with self._lock:
+            self._entries[key] = audio_bytes
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_SYNTH_MEMO = _SynthMemo(SYNTH_MEMORY_ENTRIES)
+
+
+def _synthesize_with(backend: TtsBackend, text: str, lang: str) -> bytes | None:
+    """バックエンドごとの合成結果を返す。
+
+    - 成功した結果はメモリキャッシュ（バックエンドごと）に保持する。
+    - 合成前にディスクキャッシュ（`audio_cache`）を参照し、合成結果はディスクにも保存する。
+    """
+    key = (backend, text, lang)
+    audio_bytes = _SYNTH_MEMO.get(key)
+    if audio_bytes is not None:
+        return audio_bytes
+    cache = get_audio_cache()
+    if backend.cacheable:
+        audio_bytes = cache.get(text, lang, backend.name)
+    if not audio_bytes:
+        t0 = time.perf_counter()
+        with perf.span("tts.synthesize"):
+            audio_bytes = backend.synthesize(text, lang)
+        cache.record_synthesis(time.perf_counter() - t0, ok=bool(audio_bytes))
+        if not audio_bytes:
+            return None
+        if backend.cacheable:
+            cache.put(text, lang, backend.name, audio_bytes)
+    _SYNTH_MEMO.put(key, audio_bytes)
+    return audio_bytes
 
 
 def get_target_audio_bytes(store: SessionStore) -> bytes | None:
@@ -43,9 +130,64 @@ def get_target_audio_bytes(store: SessionStore) -> bytes | None:
     pair = data_access.get_pair(store, target_id)
     if pair is None:
         return None
-    audio_bytes = synthesize_kami(pair.kami)
+    # 先読み中であれば完了を待つ（二重に合成しない）
+    with perf.span("tts.wait"):
+        audio_bytes = _PREFETCHER.result(pair.kami)
     if audio_bytes:
         cache[target_id] = audio_bytes
         # 変更を永続化
         store.set("audio_cache", cache)
     return audio_bytes
+
+
+# 盤面の札の音声を先読みするワーカープール（プロセス共通）
+_PREFETCHER = AudioPrefetcher(lambda text: synthesize_kami(text))
+
+
+def get_prefetcher() -> AudioPrefetcher:
+    """プロセス共通の音声先読みワーカープールを返す。"""
+    return _PREFETCHER
+
+
+def prefetch_grid_audio(store: SessionStore) -> int:
+    """盤面に並んでいる全札の上の句音声をバックグラウンドで合成しておく。
+
+    - 次のターゲットは必ず盤面から選ばれるため、取得直後の読み上げが合成待ちにならない。
+    - ミュート中は音声を使わないため何もしない。
+    Returns:
+        新たに先読みを開始した件数。
+    """
+    if store.get("muted", False):
+        return 0
+    board = data_access.get_board(store)
+    if board is None:
+        return 0
+    return _prefetch_cards(store, board.cards())
+
+
+def prefetch_cell_audio(store: SessionStore, r: int, c: int) -> int:
+    """盤面のセル (r, c) の札（補充された札）の上の句音声だけを先読みする。
+
+    盤面の他の札は配置時に先読み済みのため、クリックごとに投入し直さない。
+    ミュート中・空きセルでは何もしない。
+    """
+    if store.get("muted", False):
+        return 0
+    board = data_access.get_board(store)
+    if board is None:
+        return 0
+    card_id = board.card_at(r, c)
+    if card_id is None:
+        return 0
+    return _prefetch_cards(store, (card_id,))
+
+
+def _prefetch_cards(store: SessionStore, card_ids: Iterable[int]) -> int:
+    if store.get("muted", False):
+        return 0
+    texts: list[str] = []
+    for card_id in card_ids:
+        pair = data_access.get_pair(store, card_id)
+        if pair is not None:
+            texts.append(pair.kami)
+    return _PREFETCHER.prefetch(texts)
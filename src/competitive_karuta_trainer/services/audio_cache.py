@@ -0,0 +1,126 @@
+"""
+読み上げ音声のディスクキャッシュ（Streamlit 非依存）
+
+目的:
+- (テキスト, 言語, バックエンド) のハッシュをキーに、合成済み音声(mp3)をディスクに保持する。
+- サーバ再起動や新しいワーカーでも、合成済みの札はネットワーク合成を行わずに再生できるようにする。
+
+契約:
+- 容量上限（バイト）は環境変数 `KARUTA_TRAINER_AUDIO_CACHE_BYTES` で変更できる（既定 128MB）。
+- 上限を超えたら参照の古いものから削除する（LRU、`DiskCache` に委譲）。
+- ヒット/ミス回数と、参照・合成それぞれの所要時間の統計を `audio_cache_stats()` で返す。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+
+from src.competitive_karuta_trainer.services.disk_cache import DiskCache, default_cache_dir
+
+# 容量上限を上書きする環境変数
+AUDIO_CACHE_BYTES_ENV = "KARUTA_TRAINER_AUDIO_CACHE_BYTES"
+
+# 既定の容量上限（バイト）
+AUDIO_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+
+def audio_key(text: str, lang: str, backend: str) -> str:
+    """音声キャッシュのキー（内容ハッシュ）を返す。"""
+    h = hashlib.sha256()
+    for part in (backend, lang, text):
+        b = part.encode("utf-8")
+        h.update(len(b).to_bytes(8, "big"))
+        h.update(b)
+    return h.hexdigest()
+
+
+class _Timing:
+    """所要時間の簡易統計（回数・合計・最大）。"""
+
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, sec: float) -> None:
+        self.count += 1
+        self.total += sec
+        if sec > self.max:
+            self.max = sec
+
+    def as_dict(self) -> dict[str, float]:
+        mean = self.total / self.count if self.count else 0.0
+        return {"count": self.count, "total_s": self.total, "mean_s": mean, "max_s": self.max}
+
+
+class AudioCache:
+    """合成音声のディスクキャッシュと統計。"""
+
+    def __init__(self, disk: DiskCache) -> None:
+        self.disk = disk
+        self._lock = threading.Lock()
+        self._lookup = _Timing()
+        self._synth = _Timing()
+        self.synth_failures = 0
+
+    def get(self, text: str, lang: str, backend: str) -> bytes | None:
+        """キャッシュ済みの音声を返す。無ければ None。"""
+        t0 = time.perf_counter()
+        data = self.disk.get(audio_key(text, lang, backend))
+        with self._lock:
+            self._lookup.add(time.perf_counter() - t0)
+        return data
+
+    def put(self, text: str, lang: str, backend: str, data: bytes) -> None:
+        """合成した音声を保存する（書き込み失敗は無視）。"""
+        self.disk.put(audio_key(text, lang, backend), data)
+
+    def record_synthesis(self, sec: float, ok: bool) -> None:
+        """合成 1 回分の所要時間を記録する。"""
+        with self._lock:
+            self._synth.add(sec)
+            if not ok:
+                self.synth_failures += 1
+
+    def stats(self) -> dict[str, object]:
+        """ヒット/ミス回数・容量・所要時間の統計を返す。"""
+        disk = self.disk.stats()
+        with self._lock:
+            return {
+                "hits": disk["hits"],
+                "misses": disk["misses"],
+                "evictions": disk["evictions"],
+                "bytes": disk["bytes"],
+                "max_bytes": disk["max_bytes"],
+                "lookup": self._lookup.as_dict(),
+                "synthesis": self._synth.as_dict(),
+                "synthesis_failures": self.synth_failures,
+            }
+
+
+def _max_bytes_from_env() -> int:
+    raw = os.environ.get(AUDIO_CACHE_BYTES_ENV)
+    if raw:
+        try:
+            return max(0, int(raw))
+        except ValueError:
+            pass
+    return AUDIO_CACHE_MAX_BYTES
+
+
+_CACHE = AudioCache(DiskCache(default_cache_dir("audio"), _max_bytes_from_env()))
+
+
+def get_audio_cache() -> AudioCache:
+    """プロセス共通の音声キャッシュを返す。"""
+    return _CACHE
+
+
+def audio_cache_stats() -> dict[str, object]:
+    """プロセス共通の音声キャッシュの統計を返す。"""
+    return _CACHE.stats()
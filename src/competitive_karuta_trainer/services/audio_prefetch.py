@@ -0,0 +1,95 @@
+"""
+読み上げ音声の先読み（Streamlit 非依存）
+
+目的:
+- 盤面に並んだ札の上の句音声を、次のターゲットに選ばれる前にバックグラウンドで合成しておく。
+- 描画中の音声取得は、先読み中であればその完了を待ち、二重に合成しない。
+
+契約:
+- 同時実行数はワーカー数（既定 4）で制限する。
+- 同じテキストの合成要求は、実行中のものがあれば 1 件にまとめる。
+- 合成関数の例外はワーカー内で握りつぶし、結果は None として扱う。
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# 先読みの同時実行数
+PREFETCH_MAX_WORKERS = 4
+
+
+class AudioPrefetcher:
+    """音声合成の先読みを行うワーカープール。"""
+
+    def __init__(
+        self,
+        synthesize: Callable[[str], bytes | None],
+        max_workers: int = PREFETCH_MAX_WORKERS,
+    ) -> None:
+        self._synthesize = synthesize
+        self._max_workers = max(1, int(max_workers))
+        self._executor: ThreadPoolExecutor | None = None
+        self._inflight: dict[str, Future[bytes | None]] = {}
+        # 完了済み Future の add_done_callback は呼び出し元スレッドで即時実行されるため再入可能にする
+        self._lock = threading.RLock()
+        self.submitted = 0
+        self.deduplicated = 0
+
+    def _run(self, text: str) -> bytes | None:
+        try:
+            return self._synthesize(text)
+        except Exception:
+            return None
+
+    def _done(self, text: str, fut: Future[bytes | None]) -> None:
+        with self._lock:
+            if self._inflight.get(text) is fut:
+                del self._inflight[text]
+
+    def prefetch(self, texts: Iterable[str]) -> int:
+        """テキスト群の合成をバックグラウンドで開始する。新たに投入した件数を返す。"""
+        submitted = 0
+        with self._lock:
+            for text in dict.fromkeys(t for t in texts if t):
+                if text in self._inflight:
+                    self.deduplicated += 1
+                    continue
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._max_workers, thread_name_prefix="audio-prefetch"
+                    )
+                fut = self._executor.submit(self._run, text)
+                self._inflight[text] = fut
+                fut.add_done_callback(functools.partial(self._done, text))
+                submitted += 1
+            self.submitted += submitted
+        return submitted
+
+    def result(self, text: str, timeout: float | None = None) -> bytes | None:
+        """テキストの音声を返す。先読み中なら完了を待ち、そうでなければその場で合成する。"""
+        with self._lock:
+            fut = self._inflight.get(text)
+        if fut is not None:
+            try:
+                return fut.result(timeout=timeout)
+            except Exception:
+                return None
+        return self._run(text)
+
+    def pending(self) -> int:
+        """実行中（未完了）の先読み件数を返す。"""
+        with self._lock:
+            return len(self._inflight)
+
+    def stats(self) -> dict[str, int]:
+        """投入数・重複として省いた数・実行中の数を返す。"""
+        with self._lock:
+            return {
+                "submitted": self.submitted,
+                "deduplicated": self.deduplicated,
+                "pending": len(self._inflight),
+            }
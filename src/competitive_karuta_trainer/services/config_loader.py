@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import os
 import tomllib
 from typing import TYPE_CHECKING, Any
 
+# 音声合成バックエンドを選ぶ環境変数（サーバ側の設定。アップロードされた TOML では変えられない）
+TTS_BACKEND_ENV = "KARUTA_TRAINER_TTS_BACKEND"
+TTS_LOCAL_DIR_ENV = "KARUTA_TRAINER_TTS_DIR"
+
 
 class _RuntimeStore:
     config: dict[str, Any] | None = None
@@ -70,6 +75,18 @@ def get_official_rule_subheader_text(default: str = "") -> str:
     return default
 
 
+def get_tts_settings() -> tuple[str, str | None]:
+    """音声合成バックエンドの設定 (backend, local_dir) を返す。
+
+    - 環境変数（サーバ側の設定）のみを参照し、無ければ既定値 ("gtts", None)。
+    - アップロードされた TOML はプロセス共通の設定に入るため、読み込み先のディレクトリや
+      バックエンドを利用者が切り替えられないよう [audio] は参照しない。
+    """
+    backend = (os.environ.get(TTS_BACKEND_ENV) or "").strip() or "gtts"
+    local_dir = (os.environ.get(TTS_LOCAL_DIR_ENV) or "").strip() or None
+    return backend, local_dir
+
+
 def load_default_settings_values() -> dict[str, int | bool]:
     result: dict[str, int | bool] = {}
     cfg = _get_config()
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
 from src.competitive_karuta_trainer.app.ports.session_store import SessionStore
-from src.competitive_karuta_trainer.domain import Pair
+from src.competitive_karuta_trainer.domain import Board, Pair, PairLookup, PairTable, PairView
 from src.competitive_karuta_trainer.domain import index_by_id as _index_by_id
+from src.competitive_karuta_trainer.services.rule_image import RuleImage
+from src.competitive_karuta_trainer.services.shared_datasets import DatasetLease, SharedDataset
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def get_pair(store: SessionStore, pair_id: int | None) -> Pair | None:
-    """セッション（store）内のペア辞書からIDで取得する。
+    """セッション（store）内のペア索引（辞書または `PairView`）からIDで取得する。
 
     pair_id が None の場合は None を返す。
     """
     if pair_id is None:
         return None
-    pairs_by_id: dict[int, Pair] = store.get("pairs_by_id", {})
+    pairs_by_id: PairLookup = store.get("pairs_by_id", {})
     return pairs_by_id.get(pair_id)
 
 
@@ -30,16 +38,130 @@ def set_pairs(store: SessionStore, pairs: list[Pair]) -> None:
     store.set("pairs_by_id", build_index_by_id(pairs))
 
 
-def get_pairs(store: SessionStore) -> list[Pair]:
+def set_pair_table(store: SessionStore, table: PairTable, mode: str) -> PairView:
+    """セッション専用の札表を設定し、モードのビューを使用ペアにする（共有データセットは手放す）。"""
+    _release_dataset(store)
+    store.set("pair_table", table)
+    return select_mode(store, mode)
+
+
+def attach_dataset(store: SessionStore, lease: DatasetLease, mode: str) -> PairView:
+    """共有データセットの利用券をセッションに設定し、モードのビューを使用ペアにする。
+
+    - セッションには利用券（内容ハッシュ）だけを置き、札表・Tips 表・ルール画像は共有側から引く。
+    - それまでの利用券は解放する（他に参照するセッションが無ければ共有側から外れる）。
+    """
+    previous: DatasetLease | None = store.get("dataset_lease")
+    store.set("dataset_lease", lease)
+    store.set("pair_table", None)
+    if previous is not None and previous is not lease:
+        previous.release()
+    return select_mode(store, mode)
+
+
+def _release_dataset(store: SessionStore) -> None:
+    lease: DatasetLease | None = store.get("dataset_lease")
+    if lease is not None:
+        store.set("dataset_lease", None)
+        lease.release()
+
+
+def get_shared_dataset(store: SessionStore) -> SharedDataset | None:
+    """セッションが参照している共有データセットを返す（無ければ None）。"""
+    lease: DatasetLease | None = store.get("dataset_lease")
+    if lease is None or lease.released:
+        return None
+    return lease.dataset
+
+
+def get_dataset_key(store: SessionStore) -> str | None:
+    """セッションが参照している共有データセットの内容ハッシュを返す（無ければ None）。"""
+    lease: DatasetLease | None = store.get("dataset_lease")
+    return None if lease is None else lease.key
+
+
+def get_pair_table(store: SessionStore) -> PairTable | None:
+    """セッションの札表を返す（共有データセットを優先し、未読込なら None）。"""
+    dataset = get_shared_dataset(store)
+    if dataset is not None:
+        return dataset.table
+    return store.get("pair_table")
+
+
+def get_tips_frame(store: SessionStore) -> pd.DataFrame | None:
+    """共有データセットの Tips 表（決まり字を含む）を返す（無ければ None）。共有のため変更しないこと。"""
+    dataset = get_shared_dataset(store)
+    return None if dataset is None else dataset.tips
+
+
+def get_rule_image(store: SessionStore) -> RuleImage | None:
+    """共有データセットの表示用ルール画像を返す（無ければ None）。"""
+    dataset = get_shared_dataset(store)
+    return None if dataset is None else dataset.rule_image
+
+
+def get_dataset_warnings(store: SessionStore) -> tuple[str, ...]:
+    """共有データセットの読み込み時の警告を返す（無ければ空）。"""
+    dataset = get_shared_dataset(store)
+    return () if dataset is None else dataset.warnings
+
+
+def select_mode(store: SessionStore, mode: str) -> PairView:
+    """札表のモード（kana/kanji）のビューを pairs / pairs_by_id に設定する。
+
+    - ビューは札表が保持しているものをそのまま使う（コピーや索引の再構築はしない）。
+      共有データセットのビューは全セッションで同じオブジェクトを参照する。
+    - 札表が未設定のときは呼び出さないこと。
+    """
+    table = get_pair_table(store)
+    assert table is not None, "札表が未設定です"
+    view = table.view(mode)
+    store.set("pairs", view)
+    # ビューは get(id) を持つため、id 引きの辞書としても使う
+    store.set("pairs_by_id", view)
+    store.set("data_mode", view.mode)
+    return view
+
+
+def get_pairs(store: SessionStore) -> Sequence[Pair]:
     """セッションのペア一覧を返す（未設定時は空リスト）。"""
     return store.get("pairs", [])
 
 
-def get_pairs_map(store: SessionStore) -> dict[int, Pair]:
-    """セッションのペア辞書を返す（未設定時は空辞書）。"""
+def get_pairs_map(store: SessionStore) -> PairLookup:
+    """セッションのペア索引（辞書または `PairView`）を返す（未設定時は空辞書）。
+
+    札表から設定した場合は `PairView` のため、辞書のメソッドは `get` だけを使うこと。
+    """
     return store.get("pairs_by_id", {})
 
 
+# ---- Board helpers ----
+
+
+def set_board(store: SessionStore, board: Board) -> None:
+    """盤面をセッションに設定する（`grid` には同じ二次元配列を設定する）。"""
+    store.set("board", board)
+    store.set("grid", board.grid)
+
+
+def get_board(store: SessionStore) -> Board | None:
+    """セッションの盤面を返す。
+
+    - `board` が無く `grid` だけがある場合は、grid から索引を作り直して設定する。
+    - どちらも無ければ None。
+    """
+    board: Board | None = store.get("board")
+    grid = store.get("grid")
+    if board is not None and board.grid is grid:
+        return board
+    if not grid:
+        return None
+    board = Board(grid)
+    store.set("board", board)
+    return board
+
+
 # ---- Dataset metadata helpers ----
 
 
@@ -0,0 +1,207 @@
+"""
+アップロードデータセットのコンパイル済みキャッシュ（Streamlit 非依存）
+
+目的:
+- アップロードされたバイト列の内容ハッシュをキーに、読み込み済みの成果物
+  （かなペア・漢字ペア・Tips 表（決まり字を含む）・ルール画像・設定 TOML）を保持する。
+- 同じ ZIP の再アップロードはハッシュ照合だけで済ませ、CSV 解析や決まり字算出を省く。
+
+構成:
+- メモリ（LRU・総バイト数上限）→ ディスク（`DiskCache`）の 2 段構成。
+- ヒット/ミスの回数は `cache_stats()` で参照できる。
+- ディスク上の成果物は pickle のため、署名付き（`DiskCache(signed=True)`）のディスクキャッシュにだけ
+  置く。署名を照合できたもの（このディレクトリの鍵で書いたもの）以外は読み込まない。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import pickle
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import cached_property
+from typing import IO, TYPE_CHECKING
+
+from src.competitive_karuta_trainer.domain import Pair
+from src.competitive_karuta_trainer.services.disk_cache import DiskCache, default_cache_dir
+from src.competitive_karuta_trainer.services.rule_image import RuleImage
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# 成果物の形式バージョン（読み込みパイプラインの出力が変わったら上げる）
+ARTIFACT_VERSION = 6
+
+# 既定の上限（バイト）
+MEMORY_MAX_BYTES = 64 * 1024 * 1024
+DISK_MAX_BYTES = 256 * 1024 * 1024
+
+# 内容ハッシュを作るときに 1 回に読むバイト数
+_HASH_BLOCK_BYTES = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CompiledDataset:
+    """読み込み済みのデータセット一式。
+
+    現状の契約:
+    - kana/kanji: 正規化・重複統合済みの `Pair` リスト
+    - tips_columns: Tips 表の列（列名 -> 値のリスト。id, 上の句, 下の句, [ヒント], [決まり字]）
+    - rule_image: 表示用に処理したルール画像（任意、`rule_image.prepare_rule_image` の結果）
+    - config_toml: 同梱されていた config.toml のバイト列（任意）
+    - warnings: 読み込みは続けたが利用者に知らせること（例: ルール画像を外した理由）
+    - tips: Tips 表の DataFrame。初回参照時に tips_columns から作る（pandas はここで初めて読み込む）。
+      共有されるため変更しないこと
+    """
+
+    kana: list[Pair]
+    kanji: list[Pair]
+    tips_columns: dict[str, list[object]]
+    rule_image: RuleImage | None
+    config_toml: bytes | None
+    warnings: tuple[str, ...] = ()
+
+    @cached_property
+    def tips(self) -> pd.DataFrame:
+        import pandas as pd
+
+        return pd.DataFrame(self.tips_columns)
+
+    def __getstate__(self) -> dict[str, object]:
+        # 遅延生成した DataFrame は永続化しない
+        state = dict(self.__dict__)
+        state.pop("tips", None)
+        return state
+
+
+def content_key(*chunks: bytes | str) -> str:
+    """バイト列（または文字列）群から内容ハッシュのキーを作る。"""
+    return _content_hash(chunks).hexdigest()
+
+
+def content_key_stream(stream: IO[bytes], *chunks: bytes | str) -> str:
+    """`content_key(*chunks, <stream の全内容>)` と同じキーを、ストリームを分割して読みながら作る。
+
+    stream はシーク可能であること（読み終えた後は先頭に戻す）。
+    """
+    h = _content_hash(chunks)
+    size = stream.seek(0, io.SEEK_END)
+    stream.seek(0)
+    h.update(size.to_bytes(8, "big"))
+    while block := stream.read(_HASH_BLOCK_BYTES):
+        h.update(block)
+    stream.seek(0)
+    return h.hexdigest()
+
+
+def _content_hash(chunks: Iterable[bytes | str]) -> hashlib._Hash:
+    h = hashlib.sha256(f"dataset-v{ARTIFACT_VERSION}".encode())
+    for chunk in chunks:
+        b = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+        # 区切りの曖昧さを避けるため長さを前置する
+        h.update(len(b).to_bytes(8, "big"))
+        h.update(b)
+    return h
+
+
+class DatasetCache:
+    """コンパイル済みデータセットの 2 段キャッシュ（メモリ + ディスク）。"""
+
+    def __init__(self, disk: DiskCache | None, memory_max_bytes: int) -> None:
+        if disk is not None and not disk.signed:
+            raise ValueError("DatasetCache には署名付きの DiskCache を渡してください。")
+        self.disk = disk
+        self.memory_max_bytes = int(memory_max_bytes)
+        self._memory: OrderedDict[str, tuple[CompiledDataset, int]] = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> CompiledDataset | None:
+        """キーに対応する成果物を返す。無ければ None。"""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return entry[0]
+        blob = self.disk.get(key) if self.disk is not None else None
+        if blob is not None:
+            try:
+                artifact = pickle.loads(blob)
+            except Exception:
+                artifact = None
+            if isinstance(artifact, CompiledDataset):
+                with self._lock:
+                    self.disk_hits += 1
+                    self._remember(key, artifact, len(blob))
+                return artifact
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, artifact: CompiledDataset) -> None:
+        """成果物を保存する（ディスク書き込みの失敗は無視）。"""
+        blob = pickle.dumps(artifact, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._remember(key, artifact, len(blob))
+        if self.disk is not None:
+            self.disk.put(key, blob)
+
+    def _remember(self, key: str, artifact: CompiledDataset, nbytes: int) -> None:
+        """メモリ層に登録し、上限を超えた分を古い順に追い出す（ロック保持中に呼ぶ）。"""
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= old[1]
+        if nbytes > self.memory_max_bytes:
+            return
+        self._memory[key] = (artifact, nbytes)
+        self._memory_bytes += nbytes
+        while self._memory_bytes > self.memory_max_bytes and self._memory:
+            _, (_, size) = self._memory.popitem(last=False)
+            self._memory_bytes -= size
+
+    def clear(self) -> None:
+        """メモリ層とディスク層を空にする。"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> dict[str, int]:
+        """ヒット/ミス回数と使用量を返す。"""
+        with self._lock:
+            out = {
+                "hits": self.memory_hits + self.disk_hits,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+            }
+        if self.disk is not None:
+            disk = self.disk.stats()
+            out["disk_bytes"] = disk["bytes"]
+            out["disk_evictions"] = disk["evictions"]
+        return out
+
+
+_CACHE = DatasetCache(
+    DiskCache(default_cache_dir("datasets"), DISK_MAX_BYTES, signed=True), MEMORY_MAX_BYTES
+)
+
+
+def get_dataset_cache() -> DatasetCache:
+    """プロセス共通のデータセットキャッシュを返す。"""
+    return _CACHE
+
+
+def cache_stats() -> dict[str, int]:
+    """プロセス共通のデータセットキャッシュの統計を返す。"""
+    return _CACHE.stats()
@@ -1,12 +1,22 @@
 """
 データセット読み込みサービス（Streamlit 非依存）
-- ZIP バイト列からの読込
+- ZIP バイト列（またはストリーム）からの読込
+- 展開後サイズ・メンバー数の上限（`upload_limits`）と、読み込みごとの所要時間・メモリの記録
 - 個別ファイル（ベース名->バイト列）の読込
 - ファイル名エイリアス解決
+- 内容ハッシュによるコンパイル済みキャッシュ（`dataset_cache`）
+- CSV の解析エンジン: `pandas.read_csv`（既定）または標準ライブラリ `csv`（任意）
+  csv エンジンは型推論を行わないため、数値のヒント等も文字列のまま Tips 表に入る。
 
 戻り値の契約:
     (pairs_kana: list[Pair], pairs_kanji: list[Pair], kimariji_df: pandas.DataFrame, rule_image_bytes: bytes)
 
+pandas は DataFrame が必要になった時点（`load_from_*` の戻り値、または engine="pandas"）で初めて読み込む。
+engine="csv" の `compile_*` はペアの作成までを pandas 無しで行える。
+ペアだけが必要な呼び出し側は `compile_zip_bytes` / `compile_multi_bytes` の成果物を直接使えばよい。
+アプリ（セッション）からは `share_zip` / `share_multi_bytes` を使い、セッション間で共有する
+データセット（`shared_datasets`）の利用券を受け取る。
+
 破壊的変更: 従来の3分割CSV（hyakunin_issyu.csv / hyakunin_issyu_kanji.csv / kimariji.csv）は
 サポートを終了。以後は「単一CSV + ルール画像（PNG）」のみを受け付ける。
 CSV のファイル名は固定しない（内容の列ヘッダで判定する）。
@@ -14,255 +24,468 @@ CSV のファイル名は固定しない（内容の列ヘッダで判定する
 
 from __future__ import annotations
 
+import csv
 import io
 import os
-import tempfile
+import time
 import zipfile
-from collections.abc import Callable
-from typing import Any  # noqa: F401  # 将来的な拡張で使用予定（インターフェイス維持）
-
-import pandas as pd
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import IO, TYPE_CHECKING
 
+from src.competitive_karuta_trainer.app.ports.session_store import SessionStore
 from src.competitive_karuta_trainer.domain import Pair
-from src.competitive_karuta_trainer.domain.data import load_pairs
+from src.competitive_karuta_trainer.domain.data import CSV_NA_VALUES, pairs_from_columns
+from src.competitive_karuta_trainer.services import perf
 from src.competitive_karuta_trainer.services.config_loader import (
     set_runtime_config,
     set_runtime_toml_bytes,
 )
-from src.competitive_karuta_trainer.services.kimariji import compute_kimariji_for_texts
+from src.competitive_karuta_trainer.services.dataset_cache import (
+    CompiledDataset,
+    content_key,
+    content_key_stream,
+    get_dataset_cache,
+)
+from src.competitive_karuta_trainer.services.kimariji import compute_kimariji_prefixes
+from src.competitive_karuta_trainer.services.rule_image import prepare_rule_image
+from src.competitive_karuta_trainer.services.shared_datasets import (
+    DatasetLease,
+    SharedDataset,
+    get_shared_datasets,
+)
+from src.competitive_karuta_trainer.services.upload_limits import (
+    UploadLimits,
+    is_needed_member,
+    needed_zip_members,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# データセット CSV と判定するために必要な列
+_REQUIRED_CSV_COLUMNS = frozenset({"上の句", "下の句", "上の句（ひらがな）", "下の句（ひらがな）"})
 
+# CSV の解析エンジン（"pandas": pandas.read_csv、"csv": 標準ライブラリ）
+# 既定は pandas（Tips 表の値の型が従来どおり pandas の型推論に従う）
+ENGINES = ("csv", "pandas")
+DEFAULT_ENGINE = "pandas"
 
-def _zip_members_by_basename(zf: zipfile.ZipFile) -> dict[str, str]:
-    """Zip 内のメンバーをベース名で引ける辞書にする（重複時は最初を優先）。"""
+
+def _zip_members_by_basename(members: Iterable[str]) -> dict[str, str]:
+    """Zip 内のメンバー名をベース名で引ける辞書にする（重複時は最初を優先）。"""
     out: dict[str, str] = {}
-    for name in zf.namelist():
+    for name in members:
         base = os.path.basename(name)
         if base and base not in out:
             out[base] = name
     return out
 
 
-def resolve_required_files(
+def _read_csv_header(stream: IO[bytes]) -> list[str]:
+    """ストリームから CSV のヘッダ行だけを読み出して列名のリストを返す。"""
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        return next(csv.reader(text), [])
+    finally:
+        # 元ストリームのクローズは呼び出し側に任せる
+        text.detach()
+
+
+def _csv_candidates(
     name_map: dict[str, str],
-    read_bytes: Callable[[str], bytes],
-) -> tuple[dict[str, str], list[str]]:
-    """ベース名->実体の辞書から、必要ファイル（CSV/PNG）を自動検出する。
-
-    - CSV: 列ヘッダに「上の句」「下の句」「上の句（ひらがな）」「下の句（ひらがな）」を全て含むものを優先。
-    - PNG: 拡張子 .png の最初の1件（任意）。
-
-    Args:
-        name_map: ベース名 -> 実体（Zip内フルパスやキー 等）
-        read_bytes: 実体から bytes を読み出すコールバック（引数は実体）
-    Returns:
-        (resolved_map, missing_keys)
-    resolved_map: {"csv": 実体, "rule": 実体?}
-    missing_keys: ["csv"] だけを返す（PNG は任意のため欠如しても含めない）
+    open_stream: Callable[[str], IO[bytes]],
+) -> Iterator[str]:
+    """ヘッダ行に必須列を全て含む CSV の実体を、ベース名順に遅延列挙する。
+
+    各 CSV はヘッダ行のみをストリームから読む（本体は解析しない）。
     """
-    csv_candidate = None
-    # CSV を探索（中身を確認して判定）
     for base, real in sorted(name_map.items()):
         if not base.lower().endswith(".csv"):
             continue
         try:
-            b = read_bytes(real)
-            df = pd.read_csv(io.BytesIO(b))
-            cols = set(df.columns)
-            need = {"上の句", "下の句", "上の句（ひらがな）", "下の句（ひらがな）"}
-            if need.issubset(cols):
-                csv_candidate = real
-                break
+            with open_stream(real) as stream:
+                cols = set(_read_csv_header(stream))
         except Exception:
             continue
+        if _REQUIRED_CSV_COLUMNS.issubset(cols):
+            yield real
+
 
-    rule_candidate = None
+def _find_rule_image(name_map: dict[str, str]) -> str | None:
+    """拡張子 .png の最初の1件（ベース名順）を返す。"""
     for base, real in sorted(name_map.items()):
         if base.lower().endswith(".png"):
-            rule_candidate = real
-            break
-
-    resolved: dict[str, str] = {}
-    missing: list[str] = []
-    if csv_candidate is None:
-        missing.append("csv")
-    else:
-        resolved["csv"] = csv_candidate
-    if rule_candidate is not None:
-        resolved["rule"] = rule_candidate
-    return resolved, missing
-
-
-def _read_pairs_from_bytes(content: bytes) -> list[Pair]:
-    """CSV バイト列を一時ファイルに落として load_pairs で読み込む。"""
-    with tempfile.NamedTemporaryFile("wb", suffix=".csv", delete=False) as tf:
-        tf.write(content)
-        tmp = tf.name
-    try:
-        return load_pairs(tmp)
-    finally:
+            return real
+    return None
+
+
+def _read_dataset_columns(
+    name_map: dict[str, str],
+    open_stream: Callable[[str], IO[bytes]],
+    engine: str,
+) -> dict[str, list[object]] | None:
+    """ヘッダ判定を通過した CSV を順に解析し、最初に解析できたものの列を返す（無ければ None）。
+
+    各 CSV の本体は高々 1 回だけデコードする。
+    """
+    read = _read_csv_columns if engine == "csv" else _read_frame_columns
+    for real in _csv_candidates(name_map, open_stream):
         try:
-            os.remove(tmp)
+            with open_stream(real) as stream:
+                return read(stream)
         except Exception:
-            pass
+            continue
+    return None
+
+
+def _read_csv_columns(stream: IO[bytes]) -> dict[str, list[object]]:
+    """標準ライブラリの csv で CSV を列（列名 -> 値のリスト）に読み込む。
+
+    `pandas.read_csv` の既定に合わせる:
+    - 先頭行がヘッダー（BOM は除去）、空行はスキップ
+    - 既定の欠損文字列と、列が足りない行の不足分は欠損（None）
+    - 同名の列は最初の列を使う
+    値の型推論は行わない（全て文字列）。数値の列は pandas エンジンと型が異なる
+    （例: ヒント "1" は pandas では int64 の 1）ため、既定のエンジンにはしない。
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.reader(text)
+        header = next(reader, None)
+        if not header:
+            raise ValueError("CSV にヘッダ行がありません。")
+        positions: dict[str, int] = {}
+        for i, name in enumerate(header):
+            positions.setdefault(name, i)
+        out: dict[str, list[object]] = {name: [] for name in positions}
+        targets = [(i, out[name]) for name, i in positions.items()]
+        # 行のリストは作らず、1 行ずつ列に振り分ける（ピークメモリを列の分だけに抑える）
+        for row in reader:
+            if not row:
+                continue
+            n = len(row)
+            for i, values in targets:
+                value = row[i] if i < n else ""
+                values.append(None if value in CSV_NA_VALUES else value)
+    finally:
+        # 元ストリームのクローズは呼び出し側に任せる
+        text.detach()
+    return out
+
+
+def _read_frame_columns(stream: IO[bytes]) -> dict[str, list[object]]:
+    """pandas.read_csv で CSV を読み込み、列（列名 -> 値のリスト）にして返す。"""
+    import pandas as pd
+
+    df = pd.read_csv(stream)
+    return {str(c): df[c].tolist() for c in df.columns}
+
+
+def _apply_config(config_toml: bytes | None) -> None:
+    """同梱の config.toml をランタイム設定に反映する（無ければ解除）。"""
+    try:
+        if config_toml is not None:
+            set_runtime_toml_bytes(config_toml)
+        else:
+            set_runtime_config(None)
+    except Exception:
+        set_runtime_config(None)
+
+
+def _from_compiled(
+    compiled: CompiledDataset,
+) -> tuple[list[Pair], list[Pair], pd.DataFrame, bytes | None]:
+    """コンパイル済み成果物から設定を反映し、ローダの戻り値を作る。"""
+    _apply_config(compiled.config_toml)
+    # リストは呼び出し側で差し替えられても成果物に影響しないよう複製する
+    rule = compiled.rule_image
+    return (
+        list(compiled.kana),
+        list(compiled.kanji),
+        compiled.tips,
+        None if rule is None else rule.data,
+    )
+
+
+def _check_engine(engine: str) -> None:
+    if engine not in ENGINES:
+        raise ValueError(f"未知の CSV エンジンです: {engine}（{', '.join(ENGINES)} のいずれか）")
 
 
 def load_from_zip_bytes(
-    data: bytes,
+    data: bytes, *, engine: str = DEFAULT_ENGINE
 ) -> tuple[list[Pair], list[Pair], pd.DataFrame, bytes | None]:
-    """Zip バイト列からデータセットを読み込む（単一CSV + PNG を自動検出）。"""
-    with zipfile.ZipFile(io.BytesIO(data)) as zf:
-        name_map = _zip_members_by_basename(zf)
-        resolved, missing_keys = resolve_required_files(
-            name_map, read_bytes=lambda member: zf.read(member)
+    """Zip バイト列からデータセットを読み込む（単一CSV + PNG を自動検出）。
+
+    同一内容の ZIP は内容ハッシュでコンパイル済みキャッシュから返す。
+    """
+    with perf.span("dataset.load_zip"):
+        return _from_compiled(compile_zip_bytes(data, engine=engine))
+
+
+@dataclass(frozen=True)
+class LoadStats:
+    """1 回の読み込み（`share_zip` / `share_multi_bytes`）の記録。
+
+    - upload_bytes: アップロードのバイト数（ZIP は圧縮後）
+    - extracted_bytes: 解析した対象メンバーの展開後サイズの合計（共有・キャッシュから返した場合は None）
+    - memory: 読み込み中のメモリの最大値（ヒープの最大は trace_memory=True のときのみ）
+    """
+
+    source: str
+    upload_bytes: int
+    extracted_bytes: int | None
+    seconds: float
+    memory: perf.MemoryPeak
+
+
+# 直近の読み込みの記録を置くセッションのキー（利用券 "dataset_lease" と並べて置く）
+LOAD_STATS_KEY = "dataset_load_stats"
+
+
+def last_load_stats(store: SessionStore) -> LoadStats | None:
+    """セッション（store）で直近に行った読み込みの記録を返す（無ければ None）。"""
+    stats = store.get(LOAD_STATS_KEY)
+    return stats if isinstance(stats, LoadStats) else None
+
+
+@contextmanager
+def _record_load(
+    source: str, upload_bytes: int, store: SessionStore | None, trace_memory: bool
+) -> Iterator[list[int]]:
+    """読み込みの所要時間・メモリの最大値を記録する（解析した場合は展開後サイズを積んでもらう）。
+
+    store があれば、記録をそのセッションに置く（他のセッションの読み込みとは混ざらない）。
+    """
+    extracted: list[int] = []
+    t0 = time.perf_counter()
+    with perf.span(f"dataset.load_{source}"), perf.memory_peak(trace=trace_memory) as memory:
+        yield extracted
+    if store is not None:
+        store.set(
+            LOAD_STATS_KEY,
+            LoadStats(
+                source=source,
+                upload_bytes=upload_bytes,
+                extracted_bytes=sum(extracted) if extracted else None,
+                seconds=time.perf_counter() - t0,
+                memory=memory,
+            ),
         )
-        if missing_keys:
-            # CSV は必須、PNG は任意
-            raise ValueError("Zip に必要ファイルが不足しています: " + ", ".join(missing_keys))
-
-        with zf.open(resolved["csv"]) as f:
-            df = pd.read_csv(io.BytesIO(f.read()))
-        # かな・漢字を明示列指定で抽出（重複列名の混入を防ぐ）
-        kana_src_cols = [c for c in ("上の句（ひらがな）", "下の句（ひらがな）") if c in df.columns]
-        if len(kana_src_cols) != 2:
-            raise ValueError(
-                "CSV に『上の句（ひらがな）』『下の句（ひらがな）』列が見つかりません。"
-            )
-        kana_df = df[kana_src_cols].rename(
-            columns={"上の句（ひらがな）": "上の句", "下の句（ひらがな）": "下の句"}
+
+
+def share_zip(
+    source: bytes | IO[bytes],
+    *,
+    engine: str = DEFAULT_ENGINE,
+    limits: UploadLimits | None = None,
+    store: SessionStore | None = None,
+    trace_memory: bool = False,
+) -> DatasetLease:
+    """ZIP を読み込み、セッション間で共有するデータセットの利用券を返す。
+
+    - source はバイト列か、シーク可能なバイナリストリーム（アップロードされたファイル等）。
+      ストリームは複製せず、内容ハッシュの算出もメンバーの展開も分割して読む。
+    - 同一内容の ZIP が他のセッションで読み込み済みなら、解析せずに同じデータセットを参照する。
+    - 展開後サイズが上限（limits、既定は環境変数の指定）を超える場合は `UploadTooLargeError`。
+    - store があれば読み込みの記録（`last_load_stats`）をそのセッションに置く。
+      trace_memory=True なら読み込みの間だけ tracemalloc でヒープの最大を計る（遅くなる）。
+    """
+    _check_engine(engine)
+    limits = limits or UploadLimits.from_env()
+    stream = io.BytesIO(source) if isinstance(source, bytes) else source
+    size = stream.seek(0, io.SEEK_END)
+    stream.seek(0)
+    with _record_load("zip", size, store, trace_memory) as extracted:
+        key = content_key_stream(stream, "zip", engine)
+
+        def compile_() -> CompiledDataset:
+            compiled, nbytes = _compile_from_zip(stream, engine, limits)
+            extracted.append(nbytes)
+            return compiled
+
+        lease = get_shared_datasets().acquire(
+            key, lambda: SharedDataset.from_compiled(key, _cached_compile(key, compile_))
         )
-        kanji_src_cols = [c for c in ("上の句", "下の句") if c in df.columns]
-        if len(kanji_src_cols) != 2:
-            raise ValueError("CSV に『上の句』『下の句』列が見つかりません。")
-        kanji_df = df[kanji_src_cols]
-        # 決まり字（上の句かな）を算出して df に付与
-        if "上の句（ひらがな）" in df.columns:
-            km_df = compute_kimariji_for_texts(
-                df["上の句（ひらがな）"].tolist(), original_label="上の句（ひらがな）"
-            )
-            if len(km_df) == len(df):
-                df = df.copy()
-                df["_決まり字"] = km_df["決まり字"].values
-        # CSV バイト化して既存ロジックに通す
-        kana_csv = kana_df.to_csv(index=False).encode("utf-8")
-        kanji_csv = kanji_df.to_csv(index=False).encode("utf-8")
-        kana_pairs = _read_pairs_from_bytes(kana_csv)
-        kanji_pairs = _read_pairs_from_bytes(kanji_csv)
-        # Tips は「ひらがな」の上の句/下の句をベースに作成し、id で参照できるようにする
-        tips_src_cols = [c for c in ("上の句（ひらがな）", "下の句（ひらがな）") if c in df.columns]
-        has_hint = "ヒント" in df.columns
-        if has_hint:
-            tips_src_cols.append("ヒント")
-        kimariji_df = (
-            df[tips_src_cols]
-            .rename(
-                columns={
-                    "上の句（ひらがな)": "上の句",
-                    "上の句（ひらがな）": "上の句",
-                    "下の句（ひらがな)": "下の句",
-                    "下の句（ひらがな）": "下の句",
-                }
-            )
-            .copy()
-            if tips_src_cols
-            else pd.DataFrame()
+        _apply_config(lease.dataset.config_toml)
+        return lease
+
+
+def compile_zip_bytes(
+    data: bytes, *, engine: str = DEFAULT_ENGINE, limits: UploadLimits | None = None
+) -> CompiledDataset:
+    """Zip バイト列からコンパイル済み成果物を返す（キャッシュ利用、設定の反映や DataFrame 化は行わない）。"""
+    _check_engine(engine)
+    key = content_key("zip", engine, data)
+    limits = limits or UploadLimits.from_env()
+    return _cached_compile(key, lambda: _compile_from_zip(io.BytesIO(data), engine, limits)[0])
+
+
+def _cached_compile(key: str, compile_: Callable[[], CompiledDataset]) -> CompiledDataset:
+    """コンパイル済みキャッシュを引き、無ければ compile_() で作って保存する。"""
+    cache = get_dataset_cache()
+    compiled = cache.get(key)
+    if compiled is None:
+        with perf.span("dataset.compile"):
+            compiled = compile_()
+        cache.put(key, compiled)
+    return compiled
+
+
+def _compile_from_zip(
+    stream: IO[bytes], engine: str, limits: UploadLimits
+) -> tuple[CompiledDataset, int]:
+    """ZIP を解析してコンパイル済み成果物と、対象メンバーの展開後サイズの合計を返す。
+
+    中央ディレクトリで対象メンバーとサイズを確かめてから、必要なメンバーだけを
+    ストリームで展開する（設定の反映は行わない）。
+    """
+    with zipfile.ZipFile(stream) as zf:
+        members, extracted = needed_zip_members(zf, limits)
+        name_map = _zip_members_by_basename(members)
+        columns = _read_dataset_columns(
+            name_map, open_stream=lambda member: zf.open(member), engine=engine
         )
-        if not kimariji_df.empty:
-            # kana_pairs と同じ並びなので 0..N-1 を id として付与
-            kimariji_df.insert(0, "id", list(range(len(kimariji_df))))
-        if "_決まり字" in df.columns and not kimariji_df.empty:
-            kimariji_df = kimariji_df.copy()
-            kimariji_df["決まり字"] = df["_決まり字"].values
+        if columns is None:
+            # CSV は必須、PNG は任意
+            raise ValueError("Zip に必要ファイルが不足しています: csv")
 
         rule_img_bytes: bytes | None = None
-        if "rule" in resolved:
-            with zf.open(resolved["rule"]) as f:
+        rule_member = _find_rule_image(name_map)
+        if rule_member is not None:
+            with zf.open(rule_member) as f:
                 rule_img_bytes = f.read()
         # 任意の config.toml が含まれていれば取り込む
+        config_toml: bytes | None = None
         try:
-            base_map = _zip_members_by_basename(zf)
-            cfg_member = base_map.get("config.toml")
+            cfg_member = name_map.get("config.toml")
             if cfg_member:
                 with zf.open(cfg_member) as f:
-                    set_runtime_toml_bytes(f.read())
-            else:
-                set_runtime_config(None)
+                    config_toml = f.read()
         except Exception:
-            set_runtime_config(None)
-    return kana_pairs, kanji_pairs, kimariji_df, rule_img_bytes
+            config_toml = None
+    return _compile_from_columns(columns, rule_img_bytes, config_toml), extracted
 
 
 def load_from_multi_bytes(
-    by_name_bytes: dict[str, bytes],
+    by_name_bytes: dict[str, bytes], *, engine: str = DEFAULT_ENGINE
 ) -> tuple[list[Pair], list[Pair], pd.DataFrame, bytes | None]:
-    """個別ファイル（ベース名->バイト列）からデータセットを読み込む（単一CSV + PNG を自動検出）。"""
-    resolved, missing_keys = resolve_required_files(
-        {k: k for k in by_name_bytes.keys()}, read_bytes=lambda k: by_name_bytes[k]
-    )
-    if missing_keys:
-        # CSV は必須、PNG は任意
-        raise ValueError("不足ファイル: " + ", ".join(missing_keys))
+    """個別ファイル（ベース名->バイト列）からデータセットを読み込む（単一CSV + PNG を自動検出）。
 
-    df = pd.read_csv(io.BytesIO(by_name_bytes[resolved["csv"]]))
-    kana_src_cols = [c for c in ("上の句（ひらがな）", "下の句（ひらがな）") if c in df.columns]
-    if len(kana_src_cols) != 2:
-        raise ValueError("CSV に『上の句（ひらがな）』『下の句（ひらがな）』列が見つかりません。")
-    kana_df = df[kana_src_cols].rename(
-        columns={"上の句（ひらがな）": "上の句", "下の句（ひらがな）": "下の句"}
-    )
-    kanji_src_cols = [c for c in ("上の句", "下の句") if c in df.columns]
-    if len(kanji_src_cols) != 2:
-        raise ValueError("CSV に『上の句』『下の句』列が見つかりません。")
-    kanji_df = df[kanji_src_cols]
-    # 決まり字（上の句かな）
-    if "上の句（ひらがな）" in df.columns:
-        km_df = compute_kimariji_for_texts(
-            df["上の句（ひらがな）"].tolist(), original_label="上の句（ひらがな）"
-        )
-        if len(km_df) == len(df):
-            df = df.copy()
-            df["_決まり字"] = km_df["決まり字"].values
-    kana_csv = kana_df.to_csv(index=False).encode("utf-8")
-    kanji_csv = kanji_df.to_csv(index=False).encode("utf-8")
-    kana = _read_pairs_from_bytes(kana_csv)
-    kanji = _read_pairs_from_bytes(kanji_csv)
-    # Tips（かな基準 + id 付与）
-    tips_src_cols = [c for c in ("上の句（ひらがな）", "下の句（ひらがな）") if c in df.columns]
-    if "ヒント" in df.columns:
-        tips_src_cols.append("ヒント")
-    tips_df = (
-        df[tips_src_cols]
-        .rename(
-            columns={
-                "上の句（ひらがな)": "上の句",
-                "上の句（ひらがな）": "上の句",
-                "下の句（ひらがな)": "下の句",
-                "下の句（ひらがな）": "下の句",
-            }
+    同一内容のファイル群は内容ハッシュでコンパイル済みキャッシュから返す。
+    """
+    with perf.span("dataset.load_multi"):
+        return _from_compiled(compile_multi_bytes(by_name_bytes, engine=engine))
+
+
+def share_multi_bytes(
+    by_name_bytes: dict[str, bytes],
+    *,
+    engine: str = DEFAULT_ENGINE,
+    limits: UploadLimits | None = None,
+    store: SessionStore | None = None,
+    trace_memory: bool = False,
+) -> DatasetLease:
+    """個別ファイルを読み込み、セッション間で共有するデータセットの利用券を返す。
+
+    対象外のファイルは無視し、対象ファイルのサイズが上限を超える場合は `UploadTooLargeError`。
+    store / trace_memory は `share_zip` と同じ。
+    """
+    _check_engine(engine)
+    limits = limits or UploadLimits.from_env()
+    by_name_bytes = {k: v for k, v in by_name_bytes.items() if is_needed_member(k)}
+    nbytes = limits.check_sizes({k: len(v) for k, v in by_name_bytes.items()})
+    with _record_load("multi", nbytes, store, trace_memory) as extracted:
+        key = _multi_key(by_name_bytes, engine)
+
+        def compile_() -> CompiledDataset:
+            extracted.append(nbytes)
+            return _compile_from_multi(by_name_bytes, engine)
+
+        lease = get_shared_datasets().acquire(
+            key, lambda: SharedDataset.from_compiled(key, _cached_compile(key, compile_))
         )
-        .copy()
-        if tips_src_cols
-        else pd.DataFrame()
+        _apply_config(lease.dataset.config_toml)
+        return lease
+
+
+def compile_multi_bytes(
+    by_name_bytes: dict[str, bytes], *, engine: str = DEFAULT_ENGINE
+) -> CompiledDataset:
+    """個別ファイルからコンパイル済み成果物を返す（キャッシュ利用、設定の反映や DataFrame 化は行わない）。"""
+    _check_engine(engine)
+    key = _multi_key(by_name_bytes, engine)
+    return _cached_compile(key, lambda: _compile_from_multi(by_name_bytes, engine))
+
+
+def _multi_key(by_name_bytes: dict[str, bytes], engine: str) -> str:
+    """個別ファイル群の内容ハッシュ（ファイル名順）。"""
+    chunks: list[bytes | str] = ["multi", engine]
+    for name in sorted(by_name_bytes):
+        chunks.extend((name, by_name_bytes[name]))
+    return content_key(*chunks)
+
+
+def _compile_from_multi(by_name_bytes: dict[str, bytes], engine: str) -> CompiledDataset:
+    """個別ファイルを解析してコンパイル済み成果物を作る（設定の反映は行わない）。"""
+    name_map = {k: k for k in by_name_bytes.keys()}
+    columns = _read_dataset_columns(
+        name_map, open_stream=lambda k: io.BytesIO(by_name_bytes[k]), engine=engine
     )
-    if not tips_df.empty:
-        tips_df.insert(0, "id", list(range(len(tips_df))))
-    if "_決まり字" in df.columns and not tips_df.empty:
-        tips_df = tips_df.copy()
-        tips_df["決まり字"] = df["_決まり字"].values
+    if columns is None:
+        # CSV は必須、PNG は任意
+        raise ValueError("不足ファイル: csv")
 
     rule_img: bytes | None = None
-    if "rule" in resolved:
-        rule_img = by_name_bytes[resolved["rule"]]
+    rule_name = _find_rule_image(name_map)
+    if rule_name is not None:
+        rule_img = by_name_bytes[rule_name]
+
+    # 任意の config.toml が含まれていれば取り込む
+    return _compile_from_columns(columns, rule_img, by_name_bytes.get("config.toml"))
+
 
+def _compile_from_columns(
+    columns: dict[str, list[object]],
+    rule_img: bytes | None,
+    config_toml: bytes | None,
+) -> CompiledDataset:
+    """解析済みの CSV の列からかな/漢字ペアと Tips 表の列を作り、成果物にまとめる（pandas 不要）。"""
+    # かな・漢字を明示列指定で抽出（重複列名の混入を防ぐ）
+    if not ("上の句（ひらがな）" in columns and "下の句（ひらがな）" in columns):
+        raise ValueError("CSV に『上の句（ひらがな）』『下の句（ひらがな）』列が見つかりません。")
+    if not ("上の句" in columns and "下の句" in columns):
+        raise ValueError("CSV に『上の句』『下の句』列が見つかりません。")
+    kana_upper = columns["上の句（ひらがな）"]
+    kana_lower = columns["下の句（ひらがな）"]
+    # 解析済みの列から直接 Pair を作る（正規化・重複統合は load_pairs と同じ）
+    kana = pairs_from_columns(kana_upper, kana_lower)
+    kanji = pairs_from_columns(columns["上の句"], columns["下の句"])
     if not kana or not kanji:
         raise ValueError("ファイルの内容が不正です。")
 
-    # 任意の config.toml が含まれていれば取り込む
-    try:
-        if "config.toml" in by_name_bytes:
-            set_runtime_toml_bytes(by_name_bytes["config.toml"])
-        else:
-            set_runtime_config(None)
-    except Exception:
-        set_runtime_config(None)
+    # Tips は「ひらがな」の上の句/下の句をベースに作成し、id で参照できるようにする
+    tips_columns: dict[str, list[object]] = {}
+    if kana_upper:
+        # kana と同じ並びなので 0..N-1 を id として付与
+        tips_columns["id"] = list(range(len(kana_upper)))
+    tips_columns["上の句"] = list(kana_upper)
+    tips_columns["下の句"] = list(kana_lower)
+    if "ヒント" in columns:
+        tips_columns["ヒント"] = list(columns["ヒント"])
+    if kana_upper:
+        # 決まり字（上の句かな）を算出して付与
+        tips_columns["決まり字"] = list(compute_kimariji_prefixes(kana_upper))  # type: ignore[arg-type]
 
-    return kana, kanji, tips_df, rule_img
+    # ルール画像は読み込み時に 1 回だけ検査・縮小する（結果は成果物としてキャッシュされる）
+    # 画像は任意のため、不正・大きすぎる場合は外して警告に留める
+    rule = None
+    warnings: list[str] = []
+    if rule_img is not None:
+        try:
+            rule = prepare_rule_image(rule_img)
+        except ValueError as e:
+            warnings.append(f"ルール画像を表示しません: {e}")
+    return CompiledDataset(kana, kanji, tips_columns, rule, config_toml, tuple(warnings))
@@ -0,0 +1,263 @@
+"""
+ディスク上のバイト列キャッシュ（Streamlit 非依存）
+
+目的:
+- 内容ハッシュをキーにしたバイト列を、プロセス再起動を跨いで保持する。
+- 総バイト数の上限を超えたら、最後に参照されてから最も古いものから削除する（LRU）。
+
+契約:
+- キーは 16 進のハッシュ文字列（ファイル名としてそのまま使う）。
+- 書き込みは一時ファイル + `os.replace` による原子的な置き換えで行う。
+- 読み取り専用のファイルシステム等で I/O に失敗しても例外は送出せず、キャッシュ無しとして振る舞う。
+- ディレクトリは本人のみ読み書きできる権限（0700）で作る。既存のディレクトリが他人の所有なら
+  使わない（他のユーザーが置いたファイルを読まない）。
+- signed=True のときは、ディレクトリ内の秘密鍵（0600）による HMAC-SHA256 を付けて保存し、
+  読み出し時に照合する。照合できないファイルはミスとして扱い削除する
+  （pickle 等、読み出すとコードを実行しうる形式を保存する場合に使う）。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import os
+import pathlib
+import secrets
+import stat
+import tempfile
+import threading
+from collections import OrderedDict
+
+# キャッシュ配置先を上書きする環境変数
+CACHE_DIR_ENV = "KARUTA_TRAINER_CACHE_DIR"
+
+_SUFFIX = ".bin"
+
+# 署名付きエントリの秘密鍵のファイル名と、エントリ先頭のタグ長
+_KEY_NAME = "hmac.key"
+_TAG_BYTES = hashlib.sha256().digest_size
+
+
+def default_cache_dir(name: str) -> pathlib.Path:
+    """用途名ごとの既定キャッシュディレクトリを返す。
+
+    環境変数 `KARUTA_TRAINER_CACHE_DIR` があればその配下、無ければ `~/.cache/competitive_karuta_trainer` 配下。
+    """
+    root = os.environ.get(CACHE_DIR_ENV)
+    base = (
+        pathlib.Path(root)
+        if root
+        else pathlib.Path.home() / ".cache" / "competitive_karuta_trainer"
+    )
+    return base / name
+
+
+class DiskCache:
+    """総バイト数で上限を持つディスクキャッシュ。
+
+    - 参照時刻はファイルの mtime で管理し、`get` のヒット時に更新する。
+    - 各エントリのサイズと参照順は初回利用時にディレクトリを 1 回だけ走査して索引にし、
+      以後の書き込み・追い出しは索引だけで行う（書き込みのたびにディレクトリを走査しない）。
+      他のプロセスが同じディレクトリに書いた分は、次に索引を作るときに反映される。
+    - 統計（hits/misses/writes/evictions）を保持する。
+    """
+
+    def __init__(
+        self, directory: str | pathlib.Path, max_bytes: int, *, signed: bool = False
+    ) -> None:
+        self.directory = pathlib.Path(directory)
+        self.max_bytes = int(max_bytes)
+        self.signed = signed
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # ファイル名 -> サイズ（参照の古い順）。None は未走査
+        self._index: OrderedDict[str, int] | None = None
+        self._total = 0
+        self._ready: bool | None = None
+        self._key: bytes | None = None
+
+    def _path(self, key: str) -> pathlib.Path:
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def _prepare(self) -> bool:
+        """ディレクトリ（と署名用の鍵）を用意し、使えるかを返す（ロック保持中に呼ぶ）。"""
+        if self._ready is None:
+            self._ready = False
+            try:
+                self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+                if _owned_by_me(self.directory):
+                    os.chmod(self.directory, 0o700)
+                    self._key = _load_key(self.directory / _KEY_NAME) if self.signed else None
+                    self._ready = not self.signed or self._key is not None
+            except OSError:
+                self._ready = False
+        return self._ready
+
+    def _ensure_index(self) -> OrderedDict[str, int]:
+        """エントリの索引を返す（未作成ならディレクトリを 1 回走査して作る。ロック保持中に呼ぶ）。"""
+        if self._index is None:
+            entries: list[tuple[float, str, int]] = []
+            try:
+                for p in self.directory.glob(f"*{_SUFFIX}"):
+                    try:
+                        st = p.stat()
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime, p.name, st.st_size))
+            except OSError:
+                pass
+            entries.sort()
+            self._index = OrderedDict((name, size) for _, name, size in entries)
+            self._total = sum(self._index.values())
+        return self._index
+
+    def get(self, key: str) -> bytes | None:
+        """キーに対応するバイト列を返す。無ければ None。"""
+        with self._lock:
+            ready = self._prepare()
+        path = self._path(key)
+        data: bytes | None = None
+        if ready:
+            try:
+                data = path.read_bytes()
+            except OSError:
+                data = None
+        if data is not None and self.signed:
+            data = self._verify(data)
+            if data is None:
+                # 改ざん・別の鍵で書かれたエントリは使わない
+                with self._lock:
+                    self._forget(path.name)
+                    _unlink(path)
+        if data is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+            index = self._ensure_index()
+            if path.name in index:
+                index.move_to_end(path.name)
+        return data
+
+    def put(self, key: str, data: bytes) -> bool:
+        """バイト列を原子的に書き込み、上限を超えた分を追い出す。書き込めたら True。"""
+        with self._lock:
+            ready = self._prepare()
+        if self.signed and self._key is not None:
+            data = hmac.new(self._key, data, hashlib.sha256).digest() + data
+        if not ready or self.max_bytes <= 0 or len(data) > self.max_bytes:
+            return False
+        path = self._path(key)
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, path)
+            except BaseException:
+                _unlink(pathlib.Path(tmp))
+                raise
+        except OSError:
+            return False
+        with self._lock:
+            self.writes += 1
+            index = self._ensure_index()
+            self._total += len(data) - index.pop(path.name, 0)
+            index[path.name] = len(data)
+            self._evict(keep=path.name)
+        return True
+
+    def _verify(self, blob: bytes) -> bytes | None:
+        """署名を照合し、本体を返す（照合できなければ None）。"""
+        if self._key is None or len(blob) < _TAG_BYTES:
+            return None
+        tag, body = blob[:_TAG_BYTES], blob[_TAG_BYTES:]
+        expected = hmac.new(self._key, body, hashlib.sha256).digest()
+        return body if hmac.compare_digest(tag, expected) else None
+
+    def _forget(self, name: str) -> None:
+        """索引からエントリを外す（ロック保持中に呼ぶ）。"""
+        if self._index is not None:
+            self._total -= self._index.pop(name, 0)
+
+    def _evict(self, keep: str | None = None) -> None:
+        """総バイト数が上限以下になるまで、参照の古いエントリから削除する（ロック保持中に呼ぶ）。"""
+        index = self._ensure_index()
+        for name in list(index):
+            if self._total <= self.max_bytes:
+                break
+            if name == keep:
+                continue
+            self._forget(name)
+            if _unlink(self.directory / name):
+                self.evictions += 1
+
+    def total_bytes(self) -> int:
+        """現在のディスク使用量（バイト、索引上の値）を返す。"""
+        with self._lock:
+            if not self._prepare():
+                return 0
+            self._ensure_index()
+            return self._total
+
+    def clear(self) -> None:
+        """全エントリを削除する（統計は保持）。"""
+        with self._lock:
+            try:
+                for p in self.directory.glob(f"*{_SUFFIX}"):
+                    _unlink(p)
+            except OSError:
+                pass
+            self._index = OrderedDict()
+            self._total = 0
+
+    def stats(self) -> dict[str, int]:
+        """統計値を返す。"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "bytes": self.total_bytes(),
+            "max_bytes": self.max_bytes,
+        }
+
+
+def _unlink(path: pathlib.Path) -> bool:
+    try:
+        path.unlink()
+    except OSError:
+        return False
+    return True
+
+
+def _owned_by_me(path: pathlib.Path) -> bool:
+    """path が実行ユーザーの所有か（所有者の概念が無い環境では True）。"""
+    getuid = getattr(os, "getuid", None)
+    if getuid is None:
+        return True
+    return path.stat().st_uid == getuid()
+
+
+def _load_key(path: pathlib.Path) -> bytes | None:
+    """署名用の秘密鍵を読み込む（無ければ 0600 で作る）。本人以外が読み書きできる鍵は使わない。"""
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        pass
+    else:
+        with os.fdopen(fd, "wb") as f:
+            f.write(secrets.token_bytes(32))
+    st = path.stat()
+    if not _owned_by_me(path) or stat.S_IMODE(st.st_mode) & 0o077:
+        return None
+    key = path.read_bytes()
+    return key if len(key) >= 32 else None
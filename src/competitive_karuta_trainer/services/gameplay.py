@@ -3,30 +3,29 @@ from __future__ import annotations
 import time
 from collections.abc import Iterable
 
-from src.competitive_karuta_trainer.app.ports.session_store import SessionStore
-from src.competitive_karuta_trainer.domain import (
-    Pair,
-    choose_target_from_grid,
-    index_by_id,
-    refill_cell,
-)
+from src.competitive_karuta_trainer.app.ports.session_store import SessionStore, transactional
+from src.competitive_karuta_trainer.domain import Pair
+from src.competitive_karuta_trainer.services import data_access
+from src.competitive_karuta_trainer.services.audio import prefetch_cell_audio, prefetch_grid_audio
 
 # UI コンポーネントからのイベント（クリック、開始、ミュート切替等）を受け取り、
 # セッション状態の更新とドメイン操作を一箇所に集約する。
 # 本モジュールは UI フレームワークに依存しない。状態アクセスは SessionStore 経由で行う。
+# 各イベントの書き込みはトランザクションにまとめ、処理の最後に 1 回で反映する。
 
 
+@transactional
 def handle_cell_click(store: SessionStore, r: int, c: int) -> None:
     """盤面セルクリック時の処理を行う。
 
     振る舞い:
-    - 正解: スコア加算、補充、次ターゲット選定、計時更新、自動再生のスケジュール。
+    - 正解: スコア加算、決まり字の更新、補充、次ターゲット選定、計時更新、自動再生のスケジュール。
     - 不正解: ミス加算、当該ターゲットのミス回数を更新。
     """
-    grid: list[list[int | None]] = store.get("grid")
-    if not grid:
+    board = data_access.get_board(store)
+    if board is None:
         return
-    card_id = grid[r][c]
+    card_id = board.card_at(r, c)
     target_id = store.get("target_id")
     if card_id is None or target_id is None:
         return
@@ -34,9 +33,11 @@ def handle_cell_click(store: SessionStore, r: int, c: int) -> None:
     if card_id == target_id:
         # 正解
         now_ts = time.time()
+        timing_started = store.get("timing_started")
+        started_at = store.get("target_started_at") if timing_started else None
         # 計測（ターゲット経過時間）
-        if store.get("timing_started") and store.get("target_started_at"):
-            duration = max(0.0, now_ts - float(store.get("target_started_at")))
+        if started_at:
+            duration = max(0.0, now_ts - float(started_at))
             times: dict[int, list[float]] = store.get("card_times", {})
             arr = times.get(int(target_id))
             if arr is None:
@@ -45,19 +46,31 @@ def handle_cell_click(store: SessionStore, r: int, c: int) -> None:
                 arr.append(duration)
             store.set("card_times", times)
 
+        # 読まれた時点の決まり字を記録し、以降の決まり字判定から除外する
+        live = store.get("live_kimariji")
+        if live is not None:
+            kimari = live.kimariji(int(target_id))
+            if kimari is not None:
+                kimari_map: dict[int, str] = store.get("card_kimariji", {})
+                kimari_map[int(target_id)] = kimari
+                store.set("card_kimariji", kimari_map)
+            live.remove(int(target_id))
+
         store.set("score", int(store.get("score", 0)) + 1)
         # 札を取り除いて補充
-        grid[r][c] = None
+        board.remove(r, c)
         deck: list[int] = store.get("deck", [])
-        refill_cell(grid, r, c, deck)
-        store.set("grid", grid)
-        next_target = choose_target_from_grid(grid)
+        board.refill(r, c, deck)
+        data_access.set_board(store, board)
+        # 補充された札の音声を先読みしておく（盤面の他の札は配置時に先読み済み）
+        prefetch_cell_audio(store, r, c)
+        next_target = board.choose_target()
         store.set("target_id", next_target)
         # 次ターゲットの計測開始
-        if store.get("timing_started") and next_target is not None:
+        if timing_started and next_target is not None:
             store.set("target_started_at", now_ts)
         # 自動再生スケジュール（最小遅延 2.0s）
-        store.set("autoplay_at", time.time() + 2.0)
+        store.set("autoplay_at", now_ts + 2.0)
         store.set("autoplay_min_delay", 2.0)
     else:
         # 不正解
@@ -68,26 +81,20 @@ def handle_cell_click(store: SessionStore, r: int, c: int) -> None:
         store.set("card_misses", cm)
 
 
+@transactional
 def sync_mode_pairs(store: SessionStore) -> None:
     """現在の設定モード（かな/漢字）に合わせて使用ペアを同期する。
 
-    - `pairs_kana`/`pairs_kanji` が存在する場合に限り、`pairs` と `pairs_by_id` を更新する。
+    - 札表（`pair_table`）が存在する場合に限り、`pairs` と `pairs_by_id` をモードのビューに差し替える。
     - `data_mode` も併せて更新する。
     """
-    pairs_kana = store.get("pairs_kana")
-    pairs_kanji = store.get("pairs_kanji")
-    if pairs_kana is None and pairs_kanji is None:
+    if data_access.get_pair_table(store) is None:
         return
     mode = (store.get("settings", {}) or {}).get("mode", "kana")
-    src = pairs_kana if mode == "kana" else pairs_kanji
-    if src is None:
-        return
-    pairs: list[Pair] = list(src)
-    store.set("pairs", pairs)
-    store.set("pairs_by_id", index_by_id(pairs))
-    store.set("data_mode", mode)
+    data_access.select_mode(store, mode)
 
 
+@transactional
 def start_game(store: SessionStore, selected_pairs: Iterable[Pair], rows: int, cols: int) -> None:
     """ゲーム開始時の計時・スケジュール等の初期化を行う。
 
@@ -100,6 +107,7 @@ def start_game(store: SessionStore, selected_pairs: Iterable[Pair], rows: int, c
     store.set("target_started_at", now_ts)
     store.set("card_times", {})
     store.set("card_misses", {})
+    store.set("card_kimariji", {})
     store.set("last_streamed_target_id", None)
     # 起動直後も音声が流れるよう自動再生を短い遅延でスケジュール
     store.set("autoplay_at", now_ts + 0.2)
@@ -112,6 +120,7 @@ def start_game(store: SessionStore, selected_pairs: Iterable[Pair], rows: int, c
     store.set("active_pair_ids", ids)
 
 
+@transactional
 def on_muted_toggle(store: SessionStore, new_muted: bool) -> None:
     """ミュート切替時の副作用（設定更新・再生スケジュール）を処理する。"""
     desired = bool(new_muted)
@@ -126,8 +135,9 @@ def on_muted_toggle(store: SessionStore, new_muted: bool) -> None:
     store.set("muted", desired)
     # トグル時のみストリーム状態をリセット
     store.set("last_streamed_target_id", None)
-    # プレイ中にミュート解除されたら、直ちに再生を試みる
+    # プレイ中にミュート解除されたら、盤面の音声を先読みし、直ちに再生を試みる
     if not desired and store.get("timing_started") and store.get("target_id") is not None:
+        prefetch_grid_audio(store)
         now = time.time()
         store.set("autoplay_at", now + 0.1)
         store.set("autoplay_min_delay", 0.1)
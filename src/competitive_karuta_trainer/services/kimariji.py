@@ -16,17 +16,20 @@
 
 使い方:
 - `compute_kimariji_df(pairs_kana)` を呼び出して `DataFrame` を取得する。
+- ゲーム中の「読まれた札を除いた」決まり字は `LiveKimariji` で追跡する。
 """
 
 from __future__ import annotations
 
 import re
 from collections.abc import Iterable
-
-import pandas as pd
+from typing import TYPE_CHECKING
 
 from src.competitive_karuta_trainer.domain.data import Pair
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 _PUNCTUATION_PATTERN = re.compile(r"[\s、。．，,。！？!？『』「」（）()・·…‥]+")
 
 
@@ -55,30 +58,197 @@ def _original_prefix_end_index(original: str, required_len: int) -> int:
     return len(original)
 
 
-def _compute_unique_lengths(stripped_list: list[str]) -> list[int]:
-    """除外済み文字列群に対する最短一意接頭辞の長さを返す（各要素ごと）。"""
-    uniq_len: list[int] = [0] * len(stripped_list)
-    for i, s in enumerate(stripped_list):
-        if not s:
-            uniq_len[i] = 0
-            continue
-        n = 1
-        while n <= len(s):
-            prefix = s[:n]
-            conflict = False
-            for j, t in enumerate(stripped_list):
-                if i == j:
-                    continue
-                if t.startswith(prefix):
-                    conflict = True
-                    break
-            if not conflict:
-                uniq_len[i] = n
+class _TrieNode:
+    """接頭辞トライのノード。
+
+    - count: このノードを通過する文字列の本数
+    - idsum: 通過する文字列インデックスの総和（count == 1 のとき唯一の文字列を指す）
+    - parked: 未展開のまま留め置いている唯一の文字列インデックス（無ければ -1）
+    """
+
+    __slots__ = ("children", "count", "idsum", "parked")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.count = 0
+        self.idsum = 0
+        self.parked = -1
+
+
+class _PrefixTrie:
+    """最短一意接頭辞の算出に用いる接頭辞トライ。
+
+    通過本数が 1 になった地点より先は展開せず、その文字列をノードに留め置く
+    （後続の文字列が同じ枝に来たときに 1 段ずつ押し下げる）。
+    これにより構築は総文字数に対して線形、ノード数は「決まり字の総和」程度に収まる。
+    """
+
+    def __init__(self, strings: list[str]) -> None:
+        self._strings = strings
+        self._root = _TrieNode()
+        for i, s in enumerate(strings):
+            self._insert(i, s)
+
+    def _insert(self, i: int, s: str) -> None:
+        strings = self._strings
+        node = self._root
+        node.count += 1
+        node.idsum += i
+        d = 0
+        while d < len(s):
+            child = node.children.get(s[d])
+            if child is None:
+                # 未到達の枝: 新しいノードに留め置いて終了
+                child = _TrieNode()
+                child.count = 1
+                child.idsum = i
+                child.parked = i
+                node.children[s[d]] = child
+                return
+            node = child
+            d += 1
+            node.count += 1
+            node.idsum += i
+            if node.parked >= 0:
+                # 留め置かれていた文字列を 1 段押し下げる（終端に達していればそのまま）
+                j = node.parked
+                node.parked = -1
+                t = strings[j]
+                if d < len(t):
+                    nxt = _TrieNode()
+                    nxt.count = 1
+                    nxt.idsum = j
+                    nxt.parked = j
+                    node.children[t[d]] = nxt
+
+    def remove(self, i: int) -> list[tuple[int, int]]:
+        """i 番目の文字列をトライから取り除く（O(L)）。
+
+        Returns:
+            取り除いた結果、通過本数が 1 になったノードの (唯一残った文字列, 深さ) の一覧。
+        """
+        s = self._strings[i]
+        node = self._root
+        node.count -= 1
+        node.idsum -= i
+        became_unique: list[tuple[int, int]] = []
+        for d, ch in enumerate(s, start=1):
+            if node.parked == i:
+                node.parked = -1
+                break
+            child = node.children[ch]
+            child.count -= 1
+            child.idsum -= i
+            if child.count == 0:
+                # 以降は i だけが通っていた枝なので丸ごと切り離す
+                del node.children[ch]
                 break
-            n += 1
-        if uniq_len[i] == 0:
-            uniq_len[i] = len(s)
-    return uniq_len
+            if child.count == 1:
+                became_unique.append((child.idsum, d))
+            node = child
+        return became_unique
+
+    def unique_length(self, i: int) -> int:
+        """i 番目の文字列の最短一意接頭辞の長さを返す（一意にならなければ全長）。"""
+        s = self._strings[i]
+        node = self._root
+        for d, ch in enumerate(s, start=1):
+            node = node.children[ch]
+            if node.count == 1:
+                return d
+        return len(s)
+
+
+def _compute_unique_lengths(stripped_list: list[str]) -> list[int]:
+    """除外済み文字列群に対する最短一意接頭辞の長さを返す（各要素ごと）。
+
+    - 空文字列は 0、他の文字列の接頭辞になっている（または重複する）文字列は全長を返す。
+    - 接頭辞トライで算出するため、計算量は総文字数に対して線形。
+    """
+    trie = _PrefixTrie(stripped_list)
+    return [trie.unique_length(i) if s else 0 for i, s in enumerate(stripped_list)]
+
+
+class LiveKimariji:
+    """ゲーム中に読まれた札を除外しながら、残り札の決まり字を追跡する。
+
+    - 生成時に対象札（札 ID と上の句かな）の決まり字をまとめて算出する。
+    - `remove()` で読まれた札を除外すると、その札と接頭辞を共有していた札の決まり字だけが
+      短くなる（札の文字数に比例する O(L)、全体の再計算は行わない）。
+    - 決まり字は `compute_kimariji_for_texts` と同じ基準（空白・句読点を除外）で扱う。
+    """
+
+    def __init__(self, items: Iterable[tuple[int, str]]) -> None:
+        """Args:
+        items: (札 ID, 上の句かな) の組。
+        """
+        self._ids: list[int] = []
+        self._originals: list[str] = []
+        for pair_id, original in items:
+            self._ids.append(int(pair_id))
+            self._originals.append(original or "")
+        self._index: dict[int, int] = {pid: i for i, pid in enumerate(self._ids)}
+        stripped = [_strip_for_kimariji(s) for s in self._originals]
+        self._trie = _PrefixTrie(stripped)
+        self._lengths: list[int] = [
+            self._trie.unique_length(i) if s else 0 for i, s in enumerate(stripped)
+        ]
+        self._alive: set[int] = set(range(len(self._ids)))
+
+    def __len__(self) -> int:
+        return len(self._alive)
+
+    def __contains__(self, pair_id: object) -> bool:
+        i = self._index.get(pair_id) if isinstance(pair_id, int) else None
+        return i is not None and i in self._alive
+
+    def remove(self, pair_id: int) -> None:
+        """読まれた札を除外し、影響を受ける札の決まり字を更新する。未登録/除外済みなら何もしない。"""
+        i = self._index.get(int(pair_id))
+        if i is None or i not in self._alive:
+            return
+        self._alive.discard(i)
+        for j, depth in self._trie.remove(i):
+            if depth < self._lengths[j]:
+                self._lengths[j] = depth
+
+    def length(self, pair_id: int) -> int | None:
+        """現在の決まり字の文字数（空白・句読点を除く）を返す。対象外なら None。"""
+        i = self._index.get(int(pair_id))
+        if i is None or i not in self._alive:
+            return None
+        return self._lengths[i]
+
+    def kimariji(self, pair_id: int) -> str | None:
+        """現在の決まり字を原文（空白を含む上の句かな）の接頭辞として返す。対象外なら None。"""
+        i = self._index.get(int(pair_id))
+        if i is None or i not in self._alive:
+            return None
+        original = self._originals[i]
+        return original[: _original_prefix_end_index(original, self._lengths[i])]
+
+    def current(self) -> dict[int, str]:
+        """残り札すべての現在の決まり字（札 ID -> 原文接頭辞）を返す。"""
+        out: dict[int, str] = {}
+        for i in sorted(self._alive):
+            original = self._originals[i]
+            out[self._ids[i]] = original[: _original_prefix_end_index(original, self._lengths[i])]
+        return out
+
+
+def _kimariji_rows(originals: list[str]) -> list[tuple[str, int, int]]:
+    """各原文の (決まり字の原文接頭辞, 決まり字の文字数, 原文末位置) を返す。"""
+    uniq_len = _compute_unique_lengths([_strip_for_kimariji(s) for s in originals])
+    rows: list[tuple[str, int, int]] = []
+    for original, klen in zip(originals, uniq_len, strict=True):
+        end_pos = _original_prefix_end_index(original, klen)
+        rows.append((original[:end_pos], klen, end_pos))
+    return rows
+
+
+def compute_kimariji_prefixes(original_list: Iterable[str]) -> list[str]:
+    """原文文字列の配列から、各要素の決まり字（原文側の接頭辞）を返す（pandas 不要）。"""
+    return [prefix for prefix, _, _ in _kimariji_rows(list(original_list))]
 
 
 def compute_kimariji_for_texts(
@@ -92,21 +262,20 @@ def compute_kimariji_for_texts(
     Returns:
         DataFrame（列: original_label, 決まり字, 決まり字（文字数）, 決まり字（原文末位置））
     """
+    import pandas as pd
+
     originals = list(original_list)
-    stripped_list: list[str] = [_strip_for_kimariji(s) for s in originals]
-    uniq_len = _compute_unique_lengths(stripped_list)
-    rows: list[dict[str, object]] = []
-    for original, klen in zip(originals, uniq_len, strict=True):
-        end_pos = _original_prefix_end_index(original, klen)
-        kimari_original = original[:end_pos]
-        rows.append(
-            {
-                original_label: original,
-                "決まり字": kimari_original,
-                "決まり字（文字数）": klen,
-                "決まり字（原文末位置）": end_pos,
-            }
+    rows: list[dict[str, object]] = [
+        {
+            original_label: original,
+            "決まり字": kimari_original,
+            "決まり字（文字数）": klen,
+            "決まり字（原文末位置）": end_pos,
+        }
+        for original, (kimari_original, klen, end_pos) in zip(
+            originals, _kimariji_rows(originals), strict=True
         )
+    ]
     return pd.DataFrame(rows)
 
 
@@ -0,0 +1,270 @@
+"""
+再実行ごとの処理時間の計測（Streamlit 非依存）
+
+目的:
+- 1 回の再実行（rerun）の各段階（状態初期化・各 UI の描画・自動再生判定など）や、
+  音声合成・データセット読み込みの所要時間を記録し、遅いクリックの内訳を追えるようにする。
+
+契約:
+- `rerun()` で 1 回の再実行を囲み、その中の `span(name)` を再実行ごとの記録（`RerunTrace`）に積む。
+  再実行の外（先読みワーカー等の別スレッド）の `span` は集計にのみ反映する。
+- 区間名ごとに直近 `PERF_WINDOW` 件の所要時間を保持し、パーセンタイル（p50/p90/p99）を返す。
+- 環境変数 `KARUTA_TRAINER_PERF_LOG` を設定すると、再実行ごとの記録を JSON Lines で追記する
+  （"1" なら既定のキャッシュ配下 `perf/reruns.jsonl`、それ以外はそのパス）。
+  ファイルが `PERF_LOG_MAX_BYTES` を超えたら `.1` に退避して新しく書き始める。
+- `memory_peak(trace=True)` は囲んだ処理の間だけ tracemalloc を有効にし、その処理の Python ヒープの最大を返す
+  （プロセスの最大常駐サイズも併せて返すが、これはプロセス開始からの値）。
+- 計測や書き込みの失敗は例外を送出しない。
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import math
+import os
+import pathlib
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass, field
+
+from src.competitive_karuta_trainer.services.disk_cache import default_cache_dir
+
+# JSON Lines の出力先を指定する環境変数
+PERF_LOG_ENV = "KARUTA_TRAINER_PERF_LOG"
+
+# 区間ごとに保持する直近の件数
+PERF_WINDOW = 200
+
+# JSON Lines の退避サイズ（バイト）
+PERF_LOG_MAX_BYTES = 8 * 1024 * 1024
+
+# 再実行全体の区間名
+RERUN_SPAN = "rerun"
+
+
+@dataclass
+class RerunTrace:
+    """1 回の再実行の記録（区間名と所要秒の並び）。"""
+
+    started_at: float
+    spans: list[tuple[str, float]] = field(default_factory=list)
+    total_s: float | None = None
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "ts": self.started_at,
+            "total_ms": None if self.total_s is None else round(self.total_s * 1e3, 3),
+            "spans": [{"name": n, "ms": round(s * 1e3, 3)} for n, s in self.spans],
+        }
+
+
+@dataclass
+class MemoryPeak:
+    """`memory_peak()` で囲んだ処理のメモリの最大値（バイト、取れない値は None）。
+
+    - traced_peak: 処理中の Python ヒープの最大（開始時点からの増分。計測したときのみ）
+    - rss_peak: 終了時点のプロセスの最大常駐サイズ（プロセス開始からの最大で、処理ごとの値ではない）
+    """
+
+    traced_peak: int | None = None
+    rss_peak: int | None = None
+
+    def as_dict(self) -> dict[str, int | None]:
+        return {"traced_peak": self.traced_peak, "rss_peak": self.rss_peak}
+
+
+def _max_rss() -> int | None:
+    """プロセスの最大常駐サイズ（バイト）。resource が無い環境では None。"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux は KiB、macOS はバイト
+    return int(peak) if sys.platform == "darwin" else int(peak) * 1024
+
+
+# memory_peak(trace=True) が tracemalloc を開始した区間の数（0 になったら停止する）
+_TRACE_LOCK = threading.Lock()
+_TRACE_USERS = 0
+
+
+def _start_tracing() -> bool:
+    """tracemalloc を（必要なら開始して）有効にする。自分で開始した区間なら True。"""
+    global _TRACE_USERS
+    with _TRACE_LOCK:
+        if _TRACE_USERS == 0 and tracemalloc.is_tracing():
+            # `python -X tracemalloc` 等で外から有効にされている
+            return False
+        if _TRACE_USERS == 0:
+            tracemalloc.start()
+        _TRACE_USERS += 1
+        return True
+
+
+def _stop_tracing() -> None:
+    global _TRACE_USERS
+    with _TRACE_LOCK:
+        _TRACE_USERS -= 1
+        if _TRACE_USERS == 0:
+            tracemalloc.stop()
+
+
+@contextmanager
+def memory_peak(*, trace: bool = False) -> Iterator[MemoryPeak]:
+    """with ブロックのメモリの最大値を計る。
+
+    tracemalloc は処理を数倍遅くするため、trace=True のとき（または外から有効にされているとき）
+    だけブロックの間有効にし、ブロック内のヒープの最大を取る。
+    tracemalloc はプロセスで 1 つのため、同時に計測している他のスレッドの確保も含まれうる。
+    """
+    out = MemoryPeak()
+    started = _start_tracing() if trace else False
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+    try:
+        yield out
+    finally:
+        if tracing and tracemalloc.is_tracing():
+            out.traced_peak = max(0, tracemalloc.get_traced_memory()[1] - base)
+        if started:
+            _stop_tracing()
+        out.rss_peak = _max_rss()
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    """最近傍順位法のパーセンタイル（sorted_values は昇順・非空）。"""
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class PerfRecorder:
+    """区間ごとの所要時間の集計と、再実行ごとの記録の出力。"""
+
+    def __init__(self, window: int = PERF_WINDOW, log_path: pathlib.Path | None = None) -> None:
+        self.window = max(1, int(window))
+        self.log_path = log_path
+        self._samples: dict[str, deque[float]] = {}
+        self._counts: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._current: contextvars.ContextVar[RerunTrace | None] = contextvars.ContextVar(
+            "perf_trace", default=None
+        )
+
+    def record(self, name: str, sec: float) -> None:
+        """区間の所要時間を記録する。"""
+        trace = self._current.get()
+        if trace is not None:
+            trace.spans.append((name, sec))
+        with self._lock:
+            window = self._samples.get(name)
+            if window is None:
+                window = self._samples[name] = deque(maxlen=self.window)
+            window.append(sec)
+            self._counts[name] = self._counts.get(name, 0) + 1
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """with ブロックの所要時間を name として記録する（例外時も記録する）。"""
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - t0)
+
+    @contextmanager
+    def rerun(self) -> Iterator[RerunTrace]:
+        """1 回の再実行を囲み、終了時に全体の所要時間を記録して出力する。"""
+        trace = RerunTrace(started_at=time.time())
+        token = self._current.set(trace)
+        t0 = time.perf_counter()
+        try:
+            yield trace
+        finally:
+            self._current.reset(token)
+            trace.total_s = time.perf_counter() - t0
+            self.record(RERUN_SPAN, trace.total_s)
+            self._write(trace)
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """区間名ごとの件数・直近ウィンドウのパーセンタイル（ミリ秒）を返す。"""
+        with self._lock:
+            snapshot = {
+                name: (list(w), self._counts.get(name, 0)) for name, w in self._samples.items()
+            }
+        out: dict[str, dict[str, float]] = {}
+        for name, (values, count) in snapshot.items():
+            if not values:
+                continue
+            values.sort()
+            out[name] = {
+                "count": count,
+                "p50_ms": _percentile(values, 50) * 1e3,
+                "p90_ms": _percentile(values, 90) * 1e3,
+                "p99_ms": _percentile(values, 99) * 1e3,
+                "max_ms": values[-1] * 1e3,
+            }
+        return out
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+
+    def _write(self, trace: RerunTrace) -> None:
+        path = self.log_path
+        if path is None:
+            return
+        line = json.dumps(trace.as_dict(), ensure_ascii=False) + "\n"
+        try:
+            with self._lock:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    if path.stat().st_size > PERF_LOG_MAX_BYTES:
+                        os.replace(path, path.with_name(path.name + ".1"))
+                except FileNotFoundError:
+                    pass
+                with path.open("a", encoding="utf-8") as f:
+                    f.write(line)
+        except OSError:
+            pass
+
+
+def _log_path_from_env() -> pathlib.Path | None:
+    raw = os.environ.get(PERF_LOG_ENV)
+    if not raw:
+        return None
+    if raw == "1":
+        return default_cache_dir("perf") / "reruns.jsonl"
+    return pathlib.Path(raw)
+
+
+_RECORDER = PerfRecorder(log_path=_log_path_from_env())
+
+
+def get_perf_recorder() -> PerfRecorder:
+    """プロセス共通の計測器を返す。"""
+    return _RECORDER
+
+
+def span(name: str) -> AbstractContextManager[None]:
+    """プロセス共通の計測器で区間を計る（`with perf.span("...")`）。"""
+    return _RECORDER.span(name)
+
+
+def rerun() -> AbstractContextManager[RerunTrace]:
+    """プロセス共通の計測器で 1 回の再実行を囲む。"""
+    return _RECORDER.rerun()
+
+
+def perf_stats() -> dict[str, dict[str, float]]:
+    """プロセス共通の計測器の集計を返す。"""
+    return _RECORDER.stats()
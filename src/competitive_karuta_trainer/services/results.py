@@ -0,0 +1,76 @@
+"""
+ゲーム結果の集計（Streamlit 非依存）
+
+目的:
+- 終了時の結果表示（総時間・平均・苦手な札・ミスした札・各札の取得時間）に使う値を
+  セッション状態から集計する。
+- UI の結果表示と、UI を介さないシミュレーションで同じ集計を使う。
+
+契約:
+- 1 枚あたりの時間は、このゲームでの各札の最後の計測値を用いる。
+- 苦手な札は計測済みの札のうち遅い方から上位 10%（最低 1 枚）。
+- 各札の取得時間は今回使用した全札を対象とし、計測あり（降順）→未計測の順に並べる。
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+from src.competitive_karuta_trainer.app.ports.session_store import SessionStore
+
+# 苦手な札として扱う割合（遅い方から）
+WEAK_FRACTION = 0.10
+
+
+@dataclass(frozen=True)
+class GameSummary:
+    """1 ゲーム分の集計結果。
+
+    現状の契約:
+    - durations: 計測済みの札の (秒, 札 ID)。遅い順。
+    - weak: durations の先頭（苦手な札）。
+    - misses: ミスのあった札の (回数, 札 ID)。多い順。
+    - all_durations: 今回使用した全札の (秒 or None, 札 ID)。計測あり（降順）→未計測。
+    """
+
+    total_sec: float
+    avg_per_card: float | None
+    durations: list[tuple[float, int]]
+    weak: list[tuple[float, int]]
+    misses: list[tuple[int, int]]
+    all_durations: list[tuple[float | None, int]]
+
+
+def summarize_results(store: SessionStore) -> GameSummary:
+    """セッション状態から今回のゲームの結果を集計する。"""
+    times: dict[int, list[float]] = store.get("card_times") or {}
+    durations: list[tuple[float, int]] = [
+        (float(arr[-1]), pid) for pid, arr in times.items() if arr
+    ]
+    total_sec = sum(d for d, _ in durations)
+    avg_per_card = total_sec / len(durations) if durations else None
+    durations.sort(key=lambda x: x[0], reverse=True)
+    weak = durations[: max(1, math.ceil(len(durations) * WEAK_FRACTION))] if durations else []
+
+    misses_map: dict[int, int] = store.get("card_misses", {}) or {}
+    misses = [(cnt, pid) for pid, cnt in misses_map.items() if cnt and cnt > 0]
+    misses.sort(reverse=True, key=lambda x: x[0])
+
+    active_ids: list[int] | None = store.get("active_pair_ids")
+    if active_ids is None:
+        active_ids = [p.id for p in store.get("pairs") or []]
+    all_durations: list[tuple[float | None, int]] = []
+    for pid in active_ids:
+        arr = times.get(pid)
+        all_durations.append((float(arr[-1]) if arr else None, pid))
+    all_durations.sort(key=lambda x: (x[0] is None, -(x[0] if x[0] is not None else 0.0)))
+
+    return GameSummary(
+        total_sec=total_sec,
+        avg_per_card=avg_per_card,
+        durations=durations,
+        weak=weak,
+        misses=misses,
+        all_durations=all_durations,
+    )
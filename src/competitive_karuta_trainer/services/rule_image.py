@@ -0,0 +1,107 @@
+"""
+ルール画像の読み込み時処理（Streamlit 非依存）
+
+目的:
+- アップロードされたルール画像（PNG）を読み込み時に 1 回だけ検査・縮小し、
+  表示のたびに元の大きな画像を送らないようにする。
+
+契約:
+- `prepare_rule_image(raw)` は PNG のヘッダ（IHDR）から寸法を読み、不正な PNG や
+  画素数が `RULE_IMAGE_MAX_PIXELS` を超えるものは ValueError で拒否する（展開前に判定する）。
+- 長辺が `RULE_IMAGE_MAX_SIDE` を超える場合は、表示に十分な大きさまで縮小して PNG で
+  再圧縮する（Pillow が無い環境では縮小せず元のバイト列を使う）。
+  再圧縮の結果が元より大きければ元のバイト列を使う。
+- 結果（`RuleImage`）はコンパイル済みデータセットの一部としてキャッシュされる。
+  画像は任意のため、読み込み側は ValueError のとき画像を外して警告に留める（データセットは拒否しない）。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import struct
+from dataclasses import dataclass
+
+# 表示用の長辺の上限（ページは画面の高さ 95vh に合わせて表示する。高精細画面でも足りる大きさ）
+RULE_IMAGE_MAX_SIDE = 2400
+
+# 受け付ける画素数の上限（展開後のメモリを抑えるため）
+RULE_IMAGE_MAX_PIXELS = 50_000_000
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+@dataclass(frozen=True)
+class RuleImage:
+    """表示用に処理したルール画像。
+
+    - data: 表示に使うバイト列（縮小・再圧縮済み、または元のまま）
+    - width/height: data の寸法（px）
+    - source_bytes: アップロードされた元の画像のバイト数
+    - digest: data の内容ハッシュ（表示側のキャッシュキー）
+    """
+
+    data: bytes
+    mimetype: str
+    width: int
+    height: int
+    source_bytes: int
+    digest: str
+
+
+def png_size(raw: bytes) -> tuple[int, int]:
+    """PNG のヘッダ（IHDR）から (幅, 高さ) を返す（画素は展開しない）。不正なら ValueError。"""
+    if len(raw) < 24 or not raw.startswith(_PNG_SIGNATURE) or raw[12:16] != b"IHDR":
+        raise ValueError("ルール画像が PNG として読み込めません。")
+    width, height = struct.unpack(">II", raw[16:24])
+    if width <= 0 or height <= 0:
+        raise ValueError("ルール画像の寸法が不正です。")
+    return width, height
+
+
+def prepare_rule_image(
+    raw: bytes,
+    *,
+    max_side: int = RULE_IMAGE_MAX_SIDE,
+    max_pixels: int = RULE_IMAGE_MAX_PIXELS,
+) -> RuleImage:
+    """ルール画像を検査し、必要なら縮小・再圧縮して返す。"""
+    width, height = png_size(raw)
+    if width * height > max_pixels:
+        raise ValueError(
+            f"ルール画像が大きすぎます（{width}x{height}px、上限 {max_pixels:,} 画素）。"
+        )
+    data = raw
+    if max(width, height) > max_side:
+        resized = _downscale_png(raw, max_side)
+        if resized is not None and len(resized[0]) < len(raw):
+            data, (width, height) = resized
+    return RuleImage(
+        data=data,
+        mimetype="image/png",
+        width=width,
+        height=height,
+        source_bytes=len(raw),
+        digest=hashlib.sha256(data).hexdigest(),
+    )
+
+
+def _downscale_png(raw: bytes, max_side: int) -> tuple[bytes, tuple[int, int]] | None:
+    """長辺を max_side に縮小した PNG と寸法を返す（Pillow が無い・復号できない場合は None）。"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    try:
+        with Image.open(io.BytesIO(raw)) as src:
+            img: Image.Image = src
+            # パレット・1bit 等は縮小時に最近傍補間になるため、色を保ったまま展開してから縮小する
+            if src.mode not in ("RGB", "RGBA", "L"):
+                has_alpha = src.mode in ("LA", "PA") or "transparency" in src.info
+                img = src.convert("RGBA" if has_alpha else "RGB")
+            img.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+            out = io.BytesIO()
+            img.save(out, format="PNG", optimize=True)
+            return out.getvalue(), img.size
+    except Exception:
+        return None
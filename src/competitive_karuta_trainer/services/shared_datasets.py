@@ -0,0 +1,147 @@
+"""
+セッション間で共有する読み込み済みデータセット（Streamlit 非依存）
+
+目的:
+- 同じ ZIP を複数のセッション（ブラウザ）が読み込んでも、札表（`PairTable`）と Tips 表は
+  プロセス内に 1 つだけ持つ。セッションが保持するのは内容ハッシュを持つ利用券（`DatasetLease`）のみ。
+
+契約:
+- `acquire(key, build)` はキー（内容ハッシュ）の共有データセットを参照し、利用券を返す。
+  未登録なら build() で作って登録する。
+- 利用券ごとに参照数を 1 つ持つ。`DatasetLease.release()` の呼び出し、または利用券の破棄
+  （セッション状態ごと回収された場合）で参照数を減らし、0 になったら登録を外す。
+- 共有データセットは読み取り専用。札表・Tips 表を変更しないこと。
+- Streamlit の `st.cache_resource` と同じくプロセス単位のモジュール変数で保持する
+  （サービス層を Streamlit から切り離すため、キャッシュ機構は自前で持つ）。
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from src.competitive_karuta_trainer.domain import PairTable
+from src.competitive_karuta_trainer.services.dataset_cache import CompiledDataset
+from src.competitive_karuta_trainer.services.rule_image import RuleImage
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@dataclass(frozen=True)
+class SharedDataset:
+    """セッション間で共有する読み込み済みデータセット。"""
+
+    key: str
+    table: PairTable
+    compiled: CompiledDataset
+
+    @classmethod
+    def from_compiled(cls, key: str, compiled: CompiledDataset) -> SharedDataset:
+        return cls(key, PairTable.from_pairs(compiled.kana, compiled.kanji), compiled)
+
+    @property
+    def tips(self) -> pd.DataFrame:
+        return self.compiled.tips
+
+    @property
+    def rule_image(self) -> RuleImage | None:
+        return self.compiled.rule_image
+
+    @property
+    def config_toml(self) -> bytes | None:
+        return self.compiled.config_toml
+
+    @property
+    def warnings(self) -> tuple[str, ...]:
+        return self.compiled.warnings
+
+
+class DatasetLease:
+    """共有データセットの利用券（セッションに保持する）。"""
+
+    __slots__ = ("key", "_registry", "_finalizer", "__weakref__")
+
+    def __init__(self, key: str, registry: SharedDatasetRegistry) -> None:
+        self.key = key
+        self._registry = registry
+        self._finalizer = weakref.finalize(self, registry._release, key)
+
+    @property
+    def dataset(self) -> SharedDataset:
+        """共有データセットを返す（解放済みの利用券では KeyError）。"""
+        if not self._finalizer.alive:
+            raise KeyError(self.key)
+        return self._registry._entries[self.key][0]
+
+    @property
+    def released(self) -> bool:
+        return not self._finalizer.alive
+
+    def release(self) -> None:
+        """参照をやめる（2 回目以降は何もしない）。"""
+        self._finalizer()
+
+
+class SharedDatasetRegistry:
+    """内容ハッシュをキーにした共有データセットの参照数つき登録簿。"""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[SharedDataset, int]] = {}
+        # 利用券の回収（weakref.finalize）は GC の契機で任意の箇所から呼ばれうるため、
+        # ロック保持中の同じスレッドから再入しても止まらないよう RLock を使う
+        self._lock = threading.RLock()
+
+    def acquire(self, key: str, build: Callable[[], SharedDataset]) -> DatasetLease:
+        """キーの共有データセットの利用券を返す（未登録なら build() で作って登録する）。"""
+        with self._lock:
+            if key in self._entries:
+                return self._lease(key)
+        # 構築（CSV 解析等）はロックの外で行い、同時に作られた場合は先に登録したものを使う
+        dataset = build()
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (dataset, 0)
+            return self._lease(key)
+
+    def _lease(self, key: str) -> DatasetLease:
+        """参照数を 1 つ増やして利用券を作る（ロック保持中に呼ぶ）。"""
+        dataset, refs = self._entries[key]
+        self._entries[key] = (dataset, refs + 1)
+        return DatasetLease(key, self)
+
+    def _release(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            dataset, refs = entry
+            if refs <= 1:
+                del self._entries[key]
+            else:
+                self._entries[key] = (dataset, refs - 1)
+
+    def get(self, key: str) -> SharedDataset | None:
+        """登録中の共有データセットを返す（参照数は変えない）。"""
+        with self._lock:
+            entry = self._entries.get(key)
+        return None if entry is None else entry[0]
+
+    def stats(self) -> dict[str, int]:
+        """登録数と参照数の合計を返す。"""
+        with self._lock:
+            return {
+                "datasets": len(self._entries),
+                "leases": sum(refs for _, refs in self._entries.values()),
+            }
+
+
+_REGISTRY = SharedDatasetRegistry()
+
+
+def get_shared_datasets() -> SharedDatasetRegistry:
+    """プロセス共通の登録簿を返す。"""
+    return _REGISTRY
@@ -0,0 +1,122 @@
+"""
+音声合成バックエンドの実装（`TtsBackend` ポートの実装群）
+
+- gtts: Google Text-to-Speech（ネットワーク必須）
+- local: 録音済み mp3 を置いたディレクトリから読み込む（ネットワーク不要）
+- stub: テキスト長に比例した長さの無音 mp3 を決定的に生成する（ネットワーク不要・計測/試験用）
+
+選択は `create_tts_backend(name, local_dir=...)` で行う（既定は gtts）。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import pathlib
+from dataclasses import dataclass
+from io import BytesIO
+
+from src.competitive_karuta_trainer.app.ports.tts_backend import TtsBackend
+
+try:
+    from gtts import gTTS
+except Exception:  # pragma: no cover - import error handling
+    gTTS = None  # type: ignore
+
+# 利用可能なバックエンド名
+BACKEND_NAMES = ("gtts", "local", "stub")
+
+
+@dataclass(frozen=True)
+class GttsBackend:
+    """gTTS による合成（ネットワーク障害時は None）。"""
+
+    name: str = "gtts"
+    cacheable: bool = True
+
+    def synthesize(self, text: str, lang: str) -> bytes | None:
+        if not text or gTTS is None:
+            return None
+        try:
+            tts = gTTS(text=text, lang=lang)
+            bio = BytesIO()
+            tts.write_to_fp(bio)
+            return bio.getvalue()
+        except Exception:
+            return None
+
+
+@dataclass(frozen=True)
+class LocalFileBackend:
+    """録音済み mp3 をディレクトリから読み込む。
+
+    ファイル名は次の順に探す（見つからなければ None）。
+    - `<上の句>.mp3`（空白は除去）
+    - `<sha256(上の句).hex>.mp3`
+    """
+
+    directory: str
+    cacheable: bool = False
+
+    @property
+    def name(self) -> str:
+        return f"local:{self.directory}"
+
+    def synthesize(self, text: str, lang: str) -> bytes | None:
+        if not text:
+            return None
+        base = pathlib.Path(self.directory)
+        stem = "".join(text.split())
+        candidates: list[str] = []
+        # パス区切りを含むテキストはディレクトリ外を指しうるため名前では探さない
+        if stem and "/" not in stem and "\\" not in stem and stem not in (".", ".."):
+            candidates.append(f"{stem}.mp3")
+        candidates.append(f"{hashlib.sha256(text.encode('utf-8')).hexdigest()}.mp3")
+        for fname in candidates:
+            try:
+                return (base / fname).read_bytes()
+            except OSError:
+                continue
+        return None
+
+
+# MPEG-1 Layer III / 32kbps / 32kHz / モノラルのフレームヘッダ（1 フレーム 144 バイト・36ms）
+_STUB_FRAME_HEADER = bytes([0xFF, 0xFB, 0x18, 0xC0])
+_STUB_FRAME_BYTES = 144
+_STUB_FRAME_SEC = 1152 / 32000
+
+
+@dataclass(frozen=True)
+class StubBackend:
+    """テキスト長に比例した長さの無音 mp3 を生成する（決定的・ネットワーク不要）。
+
+    サイド情報とメインデータを 0 埋めしたフレームはデコーダ上で無音として再生される。
+    長さは「基本秒 + 1 文字あたり秒 × 空白を除く文字数」。
+    """
+
+    name: str = "stub"
+    cacheable: bool = False
+    base_sec: float = 0.3
+    sec_per_char: float = 0.12
+
+    def synthesize(self, text: str, lang: str) -> bytes | None:
+        if not text:
+            return None
+        chars = sum(1 for ch in text if not ch.isspace())
+        duration = self.base_sec + self.sec_per_char * chars
+        frames = max(1, math.ceil(duration / _STUB_FRAME_SEC))
+        frame = _STUB_FRAME_HEADER + bytes(_STUB_FRAME_BYTES - len(_STUB_FRAME_HEADER))
+        return frame * frames
+
+
+def create_tts_backend(name: str | None, *, local_dir: str | None = None) -> TtsBackend:
+    """名前から音声合成バックエンドを作る。
+
+    - 未知の名前や、local でディレクトリ未指定の場合は gtts にフォールバックする。
+    """
+    key = (name or "gtts").strip().lower()
+    if key == "stub":
+        return StubBackend()
+    if key == "local" and local_dir:
+        return LocalFileBackend(directory=str(pathlib.Path(local_dir).expanduser()))
+    return GttsBackend()
@@ -0,0 +1,121 @@
+"""
+アップロードされたデータセットのサイズ制限（Streamlit 非依存）
+
+目的:
+- 細工された ZIP（展開後に巨大になるもの・メンバー数が極端に多いもの）でメモリを使い果たさないよう、
+  展開する前に中央ディレクトリの申告サイズで判定して拒否する。
+
+契約:
+- 読み込むのはデータセットに必要なメンバー（.csv / .png / config.toml）だけ。それ以外
+  （ディレクトリ・macOS のリソースフォーク `__MACOSX/` や `._*`・暗号化されたもの）は開かない。
+- 必要なメンバーの展開後サイズが 1 つでも `max_member_bytes` を超える、または合計が
+  `max_total_bytes` を超える場合は `UploadTooLargeError` を送出する。
+  ZIP の全エントリ数が `max_members` を超える場合も同様。
+- 展開は申告サイズで打ち切られる（`zipfile` は file_size を超えて返さず、超えた場合は CRC エラー）
+  ため、申告サイズでの判定がそのまま実際に展開されるバイト数の上限になる。
+- 上限は環境変数で変更できる（`KARUTA_TRAINER_MAX_MEMBER_BYTES` / `KARUTA_TRAINER_MAX_TOTAL_BYTES`）。
+"""
+
+from __future__ import annotations
+
+import os
+import zipfile
+from dataclasses import dataclass
+
+# 上限を指定する環境変数（バイト）
+MAX_MEMBER_BYTES_ENV = "KARUTA_TRAINER_MAX_MEMBER_BYTES"
+MAX_TOTAL_BYTES_ENV = "KARUTA_TRAINER_MAX_TOTAL_BYTES"
+
+# 既定の上限（10 万首の CSV でも 25MB 程度）
+MAX_MEMBER_BYTES = 64 * 1024 * 1024
+MAX_TOTAL_BYTES = 128 * 1024 * 1024
+MAX_MEMBERS = 10_000
+
+# データセットとして読み込むメンバー（ベース名の拡張子・ファイル名）
+_NEEDED_SUFFIXES = (".csv", ".png")
+_NEEDED_NAMES = frozenset({"config.toml"})
+
+
+class UploadTooLargeError(ValueError):
+    """アップロードの展開後サイズ・メンバー数が上限を超えている。"""
+
+
+@dataclass(frozen=True)
+class UploadLimits:
+    """展開後サイズ・メンバー数の上限。"""
+
+    max_member_bytes: int = MAX_MEMBER_BYTES
+    max_total_bytes: int = MAX_TOTAL_BYTES
+    max_members: int = MAX_MEMBERS
+
+    @classmethod
+    def from_env(cls) -> UploadLimits:
+        """環境変数の指定を反映した上限を返す（不正な値は既定値）。"""
+        return cls(
+            max_member_bytes=_int_from_env(MAX_MEMBER_BYTES_ENV, MAX_MEMBER_BYTES),
+            max_total_bytes=_int_from_env(MAX_TOTAL_BYTES_ENV, MAX_TOTAL_BYTES),
+        )
+
+    def check_sizes(self, sizes: dict[str, int]) -> int:
+        """名前 -> 展開後サイズの各値と合計を検査し、合計を返す。"""
+        total = 0
+        for name, size in sizes.items():
+            if size > self.max_member_bytes:
+                raise UploadTooLargeError(
+                    f"{name} の展開後サイズ（{format_bytes(size)}）が"
+                    f"上限（{format_bytes(self.max_member_bytes)}）を超えています。"
+                )
+            total += size
+        if total > self.max_total_bytes:
+            raise UploadTooLargeError(
+                f"展開後サイズの合計（{format_bytes(total)}）が"
+                f"上限（{format_bytes(self.max_total_bytes)}）を超えています。"
+            )
+        return total
+
+
+def _int_from_env(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if raw:
+        try:
+            return max(0, int(raw))
+        except ValueError:
+            pass
+    return default
+
+
+def format_bytes(n: int) -> str:
+    """バイト数を表示用の文字列にする（1MB 以上は MB、未満は KB）。"""
+    if n >= 1024 * 1024:
+        return f"{n / (1024 * 1024):.1f}MB"
+    return f"{n / 1024:.1f}KB"
+
+
+def is_needed_member(name: str) -> bool:
+    """データセットとして読み込む対象のメンバー名か（ベース名で判定）。"""
+    if name.endswith("/") or name.startswith("__MACOSX/"):
+        return False
+    base = os.path.basename(name)
+    if not base or base.startswith("._"):
+        return False
+    lower = base.lower()
+    return lower.endswith(_NEEDED_SUFFIXES) or base in _NEEDED_NAMES
+
+
+def needed_zip_members(zf: zipfile.ZipFile, limits: UploadLimits) -> tuple[list[str], int]:
+    """ZIP の中央ディレクトリだけを見て、読み込むメンバー名と展開後サイズの合計を返す。
+
+    メンバーは開かない。上限を超える場合は `UploadTooLargeError`。
+    """
+    infos = zf.infolist()
+    if len(infos) > limits.max_members:
+        raise UploadTooLargeError(
+            f"ZIP のエントリ数（{len(infos)}）が上限（{limits.max_members}）を超えています。"
+        )
+    sizes: dict[str, int] = {}
+    for info in infos:
+        # 暗号化されたメンバーは読めないため対象にしない
+        if info.is_dir() or info.flag_bits & 0x1 or not is_needed_member(info.filename):
+            continue
+        sizes[info.filename] = info.file_size
+    return list(sizes), limits.check_sizes(sizes)
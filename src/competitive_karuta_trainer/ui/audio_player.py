@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import base64
+from functools import lru_cache
 from typing import Any
 
 import streamlit as st
 
 from src.competitive_karuta_trainer.adapters.session_store_streamlit import StSessionStore
 from src.competitive_karuta_trainer.services.audio import get_target_audio_bytes
+from src.competitive_karuta_trainer.ui.media import media_url
 
 
 def render_audio_player(placeholder: Any, store: StSessionStore, target_id: int | None) -> None:
@@ -18,6 +20,7 @@ def render_audio_player(placeholder: Any, store: StSessionStore, target_id: int
     - ミュートではない
 
     音声取得ロジックは `audio.get_target_audio_bytes()` に委譲する。
+    音声本体はメディア URL で参照し、再実行ごとに base64 を送らない（`_audio_src`）。
     """
     if not (
         st.session_state.get("timing_started")
@@ -28,9 +31,8 @@ def render_audio_player(placeholder: Any, store: StSessionStore, target_id: int
     audio_bytes = get_target_audio_bytes(store)
     if audio_bytes:
         player_id = f"player-{target_id}"
-        b64 = base64.b64encode(audio_bytes).decode("utf-8")
-        html = f'<audio id="{player_id}" src="data:audio/mp3;base64,{b64}" controls></audio>'
-        placeholder.markdown(html, unsafe_allow_html=True)
+        src = _audio_src(audio_bytes, "player")
+        placeholder.markdown(_player_html(src, player_id), unsafe_allow_html=True)
     else:
         placeholder.caption("音声を準備しています…")
 
@@ -40,12 +42,39 @@ def build_autoplay_html(audio_bytes: bytes, player_id: str, defer_ms: int = 0) -
 
     defer_ms: 再生開始をミリ秒単位で遅延させる（0 なら即時）。
     """
-    b64 = base64.b64encode(audio_bytes).decode("utf-8")
+    return _autoplay_html(_audio_src(audio_bytes, "autoplay"), player_id, int(max(0, defer_ms)))
+
+
+def _audio_src(audio_bytes: bytes, slot: str) -> str:
+    """音声の参照先 URL を返す。
+
+    - Streamlit のメディアファイルマネージャに登録し、内容ハッシュ由来の安定した URL を返す
+      （同一内容は再登録されず、再実行ごとの送信量は URL 分のみ）。
+    - ランタイム外などで登録できない場合は data URI（base64 はクリップごとにメモ化）にフォールバックする。
+    """
+    return media_url(audio_bytes, "audio/mpeg", f"karuta-audio-{slot}") or _data_uri(audio_bytes)
+
+
+@lru_cache(maxsize=32)
+def _data_uri(audio_bytes: bytes) -> str:
+    """mp3 バイト列の data URI を返す（クリップごとにメモ化）。"""
+    return "data:audio/mp3;base64," + base64.b64encode(audio_bytes).decode("utf-8")
+
+
+@lru_cache(maxsize=64)
+def _player_html(src: str, player_id: str) -> str:
+    """操作用プレーヤーの HTML を返す（参照先ごとにメモ化）。"""
+    return f'<audio id="{player_id}" src="{src}" controls></audio>'
+
+
+@lru_cache(maxsize=64)
+def _autoplay_html(src: str, player_id: str, defer_ms: int) -> str:
+    """自動再生用の HTML を返す（参照先・遅延ごとにメモ化）。"""
     tpl = (
         (
             """
                 <div>
-                    <audio id="__ID__" src="data:audio/mp3;base64,__SRC__" controls autoplay></audio>
+                    <audio id="__ID__" src="__SRC__" controls autoplay></audio>
                     <button id="__ID___btn" style="display:none;margin-left:8px;">▶ 再生</button>
                 </div>
                 <script>
@@ -72,8 +101,8 @@ def build_autoplay_html(audio_bytes: bytes, player_id: str, defer_ms: int = 0) -
                 """
         )
         .replace("__ID__", player_id)
-        .replace("__SRC__", b64)
-        .replace("__DEFER__", str(int(max(0, defer_ms))))
+        .replace("__SRC__", src)
+        .replace("__DEFER__", str(defer_ms))
     )
     return tpl
 
@@ -6,6 +6,7 @@ import streamlit as st
 
 from src.competitive_karuta_trainer.adapters.session_store_streamlit import StSessionStore
 from src.competitive_karuta_trainer.domain import Pair
+from src.competitive_karuta_trainer.services import perf
 from src.competitive_karuta_trainer.services.gameplay import (
     handle_cell_click as _svc_handle_cell_click,
 )
@@ -39,4 +40,5 @@ def render_board(on_click: Callable[[int, int], None]) -> None:
 
 def handle_click(store: StSessionStore, r: int, c: int) -> None:
     """盤面セルクリック時の処理をサービスに委譲する。"""
-    _svc_handle_cell_click(store, r, c)
+    with perf.span("handle_cell_click"):
+        _svc_handle_cell_click(store, r, c)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import random
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 
 import streamlit as st
 
@@ -13,7 +13,7 @@ from src.competitive_karuta_trainer.services.gameplay import sync_mode_pairs as
 
 def render_header(
     store: StSessionStore,
-    reset_game: Callable[[list[Pair] | None, int | None, int | None], None],
+    reset_game: Callable[[Sequence[Pair] | None, int | None, int | None], None],
 ) -> object:
     """メインヘッダー（スタートボタン + 音声プレースホルダ）を描画する。
 
@@ -29,7 +29,7 @@ def render_header(
         if st.button("スタート", use_container_width=False, disabled=start_disabled):
             # 現在のモードに合わせて pairs/pairs_by_id を同期
             _svc_sync_mode_pairs(store)
-            all_pairs: list[Pair] = st.session_state.pairs
+            all_pairs: Sequence[Pair] = st.session_state.pairs
             subset_size = int(st.session_state.settings.get("samples", 30))
             rows = int(st.session_state.settings.get("rows", 5))
             cols = int(st.session_state.settings.get("cols", 4))
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
 import os
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 
 import streamlit as st
 
-from src.competitive_karuta_trainer.domain import Pair, index_by_id
-from src.competitive_karuta_trainer.services import dataset_loader
+from src.competitive_karuta_trainer.adapters.session_store_streamlit import StSessionStore
+from src.competitive_karuta_trainer.domain import Pair
+from src.competitive_karuta_trainer.services import data_access, dataset_loader
 from src.competitive_karuta_trainer.services.config_loader import load_default_settings_values
 
 
-def render_upload_ui(reset_game: Callable[[list[Pair]], None]) -> None:
+def render_upload_ui(reset_game: Callable[[Sequence[Pair]], None]) -> None:
     """ランディングのアップロード UI を描画する。
 
     使用者は、呼び出し元で `len(st.session_state.pairs) == 0` のときに
@@ -43,19 +44,12 @@ def render_upload_ui(reset_game: Callable[[list[Pair]], None]) -> None:
             try:
                 if not up_zip:
                     raise ValueError("ZIP ファイルが選択されていません。")
-                kana, kanji, tips_df, rule_img = dataset_loader.load_from_zip_bytes(
-                    up_zip.getvalue()
+                lease = dataset_loader.share_zip(
+                    up_zip, store=StSessionStore(), trace_memory=_trace_memory()
                 )
-                st.session_state.pairs_kana = kana
-                st.session_state.pairs_kanji = kanji
-                st.session_state.kimariji_df = tips_df
-                st.session_state.rule_image_bytes = rule_img
                 selected_mode = st.session_state.get("settings", {}).get("mode", "kana")
-                use_pairs = kana if selected_mode == "kana" else kanji
-                st.session_state.pairs = use_pairs
-                st.session_state.pairs_by_id = index_by_id(use_pairs)
+                use_pairs = data_access.attach_dataset(StSessionStore(), lease, selected_mode)
                 st.session_state.data_path = "uploaded-zip://local"
-                st.session_state.data_mode = selected_mode
                 if "settings" not in st.session_state:
                     st.session_state.settings = {}
                 _defaults = load_default_settings_values()
@@ -81,17 +75,12 @@ def render_upload_ui(reset_game: Callable[[list[Pair]], None]) -> None:
                 by_name_bytes: dict[str, bytes] = {
                     os.path.basename(f.name): f.getvalue() for f in files
                 }
-                kana, kanji, tips_df, rule_img = dataset_loader.load_from_multi_bytes(by_name_bytes)
-                st.session_state.pairs_kana = kana
-                st.session_state.pairs_kanji = kanji
-                st.session_state.kimariji_df = tips_df
-                st.session_state.rule_image_bytes = rule_img
+                lease = dataset_loader.share_multi_bytes(
+                    by_name_bytes, store=StSessionStore(), trace_memory=_trace_memory()
+                )
                 selected_mode = st.session_state.get("settings", {}).get("mode", "kana")
-                use_pairs = kana if selected_mode == "kana" else kanji
-                st.session_state.pairs = use_pairs
-                st.session_state.pairs_by_id = index_by_id(use_pairs)
+                use_pairs = data_access.attach_dataset(StSessionStore(), lease, selected_mode)
                 st.session_state.data_path = "uploaded-multi://local"
-                st.session_state.data_mode = selected_mode
                 if "settings" not in st.session_state:
                     st.session_state.settings = {}
                 _defaults = load_default_settings_values()
@@ -105,3 +94,8 @@ def render_upload_ui(reset_game: Callable[[list[Pair]], None]) -> None:
                 st.rerun()
             except Exception as e:
                 err_holder.error(f"読み込みに失敗しました: {e}")
+
+
+def _trace_memory() -> bool:
+    """計測パネルが有効なら、読み込みのヒープの最大を計る。"""
+    return bool(st.session_state.get("perf_panel", False))
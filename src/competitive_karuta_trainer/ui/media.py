@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import streamlit as st
+
+
+def media_url(data: bytes, mimetype: str, coordinates: str) -> str | None:
+    """バイト列を Streamlit のメディアファイルマネージャに登録し、参照先 URL を返す。
+
+    - URL は内容ハッシュ由来で安定する（同一内容は再登録されず、ブラウザのキャッシュも効く）。
+    - 登録は再実行ごとに行う必要がある（参照されなくなったファイルは Streamlit 側で破棄されるため）。
+    - ランタイム外などで登録できない場合は None（呼び出し側で data URI 等にフォールバックする）。
+    """
+    try:
+        from streamlit.runtime import Runtime
+
+        if Runtime.exists():
+            url = Runtime.instance().media_file_mgr.add(data, mimetype, coordinates)
+            base_path = str(st.get_option("server.baseUrlPath") or "").strip("/")
+            return f"/{base_path}{url}" if base_path else url
+    except Exception:
+        pass
+    return None
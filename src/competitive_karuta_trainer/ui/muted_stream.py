@@ -7,14 +7,23 @@ import streamlit as st
 
 from src.competitive_karuta_trainer.domain import STREAMING_CHAR_DELAY, Pair
 
+# 未表示の文字は透明にしておき、animation-delay 経過後に表示する（ブラウザ側で進行）
+_STREAM_CSS = (
+    "<style>"
+    ".muted-stream .ch{opacity:0;animation:muted-stream-reveal 0s linear forwards;}"
+    "@keyframes muted-stream-reveal{to{opacity:1;}}"
+    "</style>"
+)
+
 
 def render_muted_stream(target: Pair | None) -> None:
     """ミュート時の上の句をストリーミング表示する。
 
     仕様:
-    - 無音モードかつ target がある場合に、上の句を1文字ずつ描画する。
-    - 自動リフレッシュが無くても進行するよう、1実行内でストリームを完結させる。
-    - 同じターゲットでは二重にストリームしない（完了後は全文静的表示）。
+    - 無音モードかつ target がある場合に、上の句を1文字ずつ表示する。
+    - 文字送りはブラウザ側（CSS アニメーション）で行い、スクリプトの実行はブロックしない。
+    - ターゲットごとに表示開始時刻を記録し、再実行時は経過分を表示済みとして続きから送る。
+    - 現在の決まり字（読まれた札を除いた判定）までを強調表示する（かなモードのみ）。
     """
     # スタート後（計測開始）かつ無音モード、ターゲットがある場合のみストリーム開始
     if not (
@@ -24,32 +33,57 @@ def render_muted_stream(target: Pair | None) -> None:
     ):
         return
 
-    holder = st.empty()
     current_tid = st.session_state.get("target_id")
-    already = st.session_state.get("last_streamed_target_id") == current_tid
-
-    # 既に同じターゲットのストリーミングが完了している場合は、同じ場所に全文を静的表示
-    if already:
-        text_full = target.kami
-        holder.markdown(
-            f'<div style="text-align:center;font-size:1.8rem;line-height:1.8;">{html_escape(text_full)}</div>',
-            unsafe_allow_html=True,
-        )
-        return
+    now = time.time()
+    if st.session_state.get("last_streamed_target_id") != current_tid:
+        st.session_state.last_streamed_target_id = current_tid
+        st.session_state.streamed_at = now
+    started = st.session_state.get("streamed_at")
+    elapsed = now - float(started) if started is not None else float("inf")
+
+    st.markdown(
+        _stream_html(target.kami, _live_kimariji_end(target), float(STREAMING_CHAR_DELAY), elapsed),
+        unsafe_allow_html=True,
+    )
+
+
+def _live_kimariji_end(target: Pair) -> int:
+    """ターゲットの現在の決まり字が上の句のどこまでかを返す（強調しない場合は 0）。
+
+    決まり字はかなで判定しているため、表示中の上の句がその接頭辞で始まるときのみ強調する。
+    """
+    live = st.session_state.get("live_kimariji")
+    if live is None:
+        return 0
+    kimari = live.kimariji(target.id)
+    if not kimari or not target.kami.startswith(kimari):
+        return 0
+    return len(kimari)
+
+
+def _reveal(text: str, start: int, delay: float, elapsed: float) -> str:
+    """text（上の句の start 文字目以降）を、表示時刻に達していない文字だけ遅延表示にする。"""
+    parts: list[str] = []
+    for i, ch in enumerate(text, start):
+        wait = i * delay - elapsed
+        if wait <= 0:
+            parts.append(html_escape(ch))
+        else:
+            style = f"animation-delay:{wait:.3f}s"
+            parts.append(f'<span class="ch" style="{style}">{html_escape(ch)}</span>')
+    return "".join(parts)
 
-    # ストリーミング実行（非ブロッキングに近い体感で、短時間のみブロック）
-    text_full = target.kami
-    total = len(text_full)
-    st.session_state.last_streamed_target_id = current_tid
-    # 最低1文字目は即時表示
-    for i in range(1, total + 1):
-        # 途中でターゲットが変わったら中断
-        if st.session_state.get("target_id") != current_tid:
-            return
-        text = text_full[:i]
-        holder.markdown(
-            f'<div style="text-align:center;font-size:1.8rem;line-height:1.8;">{html_escape(text)}</div>',
-            unsafe_allow_html=True,
-        )
-        if i < total:
-            time.sleep(float(STREAMING_CHAR_DELAY))
+
+def _stream_html(text: str, kimari_end: int, delay: float, elapsed: float) -> str:
+    """ストリーム表示用の HTML を返す（先頭 kimari_end 文字を強調）。
+
+    i 文字目（0 始まり）は表示開始から i*delay 秒後に現れる。elapsed は表示開始からの経過秒。
+    """
+    head = _reveal(text[:kimari_end], 0, delay, elapsed)
+    tail = _reveal(text[kimari_end:], kimari_end, delay, elapsed)
+    if head:
+        head = f'<span style="color:#d00;font-weight:600;">{head}</span>'
+    return (
+        f'{_STREAM_CSS}<div class="muted-stream" '
+        f'style="text-align:center;font-size:1.8rem;line-height:1.8;">{head}{tail}</div>'
+    )
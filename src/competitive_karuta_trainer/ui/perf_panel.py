@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import streamlit as st
+
+from src.competitive_karuta_trainer.adapters.session_store_streamlit import StSessionStore
+from src.competitive_karuta_trainer.services.dataset_loader import last_load_stats
+from src.competitive_karuta_trainer.services.perf import PERF_LOG_ENV, RerunTrace, get_perf_recorder
+from src.competitive_karuta_trainer.services.upload_limits import format_bytes
+
+
+def render_perf_panel(trace: RerunTrace) -> None:
+    """計測パネル（今回の再実行の内訳と、区間ごとの直近パーセンタイル）を描画する。
+
+    サイドバーの「計測パネル」が有効なときのみ表示する。
+    """
+    if not st.session_state.get("perf_panel", False):
+        return
+    recorder = get_perf_recorder()
+    with st.expander("計測", expanded=True):
+        total = f"{trace.total_s * 1e3:.1f} ms" if trace.total_s is not None else "-"
+        st.caption(f"今回の再実行: {total}")
+        st.table([{"区間": name, "ms": round(sec * 1e3, 2)} for name, sec in trace.spans])
+        stats = recorder.stats()
+        rows = [
+            {
+                "区間": name,
+                "件数": int(s["count"]),
+                "p50 (ms)": round(s["p50_ms"], 2),
+                "p90 (ms)": round(s["p90_ms"], 2),
+                "p99 (ms)": round(s["p99_ms"], 2),
+                "最大 (ms)": round(s["max_ms"], 2),
+            }
+            for name, s in sorted(stats.items())
+        ]
+        st.caption(f"直近 {recorder.window} 件のパーセンタイル（プロセス全体）")
+        st.table(rows)
+        _render_last_load()
+        if recorder.log_path is not None:
+            st.caption(f"JSON Lines: {recorder.log_path}")
+        else:
+            st.caption(
+                f"環境変数 {PERF_LOG_ENV} を設定すると再実行ごとの記録をファイルに出力します。"
+            )
+
+
+def _render_last_load() -> None:
+    """このセッションの直近のデータセット読み込みのサイズ・所要時間・メモリの最大値を表示する。"""
+    load = last_load_stats(StSessionStore())
+    if load is None:
+        return
+    mem = load.memory
+
+    def fmt(n: int | None) -> str:
+        return "-" if n is None else format_bytes(n)
+
+    extracted = (
+        "共有/キャッシュから取得" if load.extracted_bytes is None else fmt(load.extracted_bytes)
+    )
+    st.caption(
+        f"直近の読み込み（{load.source}）: アップロード {fmt(load.upload_bytes)} / 展開 {extracted} / "
+        f"{load.seconds * 1e3:.1f} ms / ヒープ最大 {fmt(mem.traced_peak)}"
+        f"（プロセスの最大常駐サイズ {fmt(mem.rss_peak)}）"
+    )
+    if mem.traced_peak is None:
+        st.caption("ヒープ最大は計測パネルを有効にしてから読み込むと表示されます。")
@@ -81,6 +81,9 @@ def render_sidebar(store: StSessionStore) -> None:
         # ミュート設定は常に反映（プレイ中でも切替可）
         _svc_on_muted_toggle(store, bool(new_muted))
 
+        # 再実行ごとの処理時間をメイン画面の下部に表示する（開発・調査用）
+        st.toggle("計測パネル", key="perf_panel")
+
         # ページ移動リンク（Streamlit が対応している場合はサイドバーに表示）
         # 環境により自動のページ切替UIが表示されますが、見つけやすいよう明示リンクを併設します。
         try:
@@ -1,14 +1,31 @@
 from __future__ import annotations
 
 import html
-import math
-import uuid
+import json
+from typing import TYPE_CHECKING
 
-import pandas as pd
 import streamlit as st
 import streamlit.components.v1 as components
 
+from src.competitive_karuta_trainer.adapters.session_store_streamlit import StSessionStore
 from src.competitive_karuta_trainer.domain import Pair
+from src.competitive_karuta_trainer.services import data_access
+from src.competitive_karuta_trainer.services.results import summarize_results
+from src.competitive_karuta_trainer.ui.tips_table import (
+    TIPS_COLUMN_WIDTHS,
+    TIPS_DISPLAY_COLUMNS,
+    FrameCache,
+    render_upper,
+    sort_by_kimariji,
+    split_upper,
+)
+
+if TYPE_CHECKING:
+    # pandas は起動時に読み込まない（Tips 表を持つデータセットの読み込み時に読み込まれる）
+    import pandas as pd
+
+# ヒントのポップオーバーに表示する行数（フォーカス行の周辺）
+POPOVER_WINDOW = 20
 
 
 def render_status_and_results(target: Pair | None) -> None:
@@ -37,38 +54,24 @@ def render_status_and_results(target: Pair | None) -> None:
     # 計測結果（今回のみ）
     if st.session_state.get("timing_started") and st.session_state.get("game_started_at"):
         st.subheader("計測結果")
-        times: dict[int, list[float]] = st.session_state.card_times or {}
-        # 今回の1枚あたり時間（このゲーム中の単回計測）
-        durations: list[tuple[float, int]] = []  # (sec, pair_id)
-        for pid, arr in times.items():
-            if arr:
-                durations.append((float(arr[-1]), pid))
-        total_sec = sum(d for d, _ in durations)
-        mm = int(total_sec // 60)
-        ss = int(total_sec % 60)
+        summary = summarize_results(StSessionStore())
+        mm = int(summary.total_sec // 60)
+        ss = int(summary.total_sec % 60)
         st.metric("総時間", f"{mm:02d}:{ss:02d}")
-        if durations:
-            n = len(durations)
-            avg_per_card = sum(d for d, _ in durations) / n
-            st.metric("平均/札", f"{avg_per_card:.2f}s")
+        if summary.durations:
+            st.metric("平均/札", f"{summary.avg_per_card:.2f}s")
             # 下位10%（遅い方）のみを苦手と判定
-            k = max(1, math.ceil(n * 0.10))
-            durations.sort(key=lambda x: x[0], reverse=True)
-            weak = durations[:k]
-            if weak:
+            if summary.weak:
                 st.markdown("**苦手な札（下位10%）**")
-                for sec, pid in weak:
+                for sec, pid in summary.weak:
                     p = _get_pair(pid)
                     if not p:
                         continue
                     st.write(f"• 『{p.kami}』→『{p.shimo}』 {sec:.2f}s")
             # ミスした札（降順・すべて表示）
-            misses: dict[int, int] = st.session_state.get("card_misses", {})
-            miss_rows = [(cnt, pid) for pid, cnt in misses.items() if cnt and cnt > 0]
-            if miss_rows:
-                miss_rows.sort(reverse=True, key=lambda x: x[0])
+            if summary.misses:
                 st.markdown("**ミスした札**")
-                for cnt, pid in miss_rows:
+                for cnt, pid in summary.misses:
                     p = _get_pair(pid)
                     if not p:
                         continue
@@ -76,12 +79,12 @@ def render_status_and_results(target: Pair | None) -> None:
             # 全札の取得時間（今回使用した全札を対象）
             st.markdown("**各札の取得時間**")
             # ヒント参照（まず id をキーに、互換用に句ベースも作成）
-            tips_df = st.session_state.get("kimariji_df")
+            tips_df = data_access.get_tips_frame(StSessionStore())
             hint_by_kami: dict[str, str] = {}
             hint_by_shimo: dict[str, str] = {}
             hint_by_id: dict[int, str] = {}
             try:
-                if isinstance(tips_df, pd.DataFrame) and "ヒント" in tips_df.columns:
+                if tips_df is not None and "ヒント" in tips_df.columns:
                     if "id" in tips_df.columns:
                         for _id, h in zip(tips_df["id"], tips_df["ヒント"], strict=False):  # type: ignore[arg-type]
                             try:
@@ -102,22 +105,9 @@ def render_status_and_results(target: Pair | None) -> None:
                 hint_by_shimo = {}
                 hint_by_id = {}
 
-            # 今回のゲームで使用した全ID
-            active_ids: list[int] | None = st.session_state.get("active_pair_ids")
-            if active_ids is None:
-                active_ids = [p.id for p in st.session_state.pairs]  # type: ignore[attr-defined]
-            times_map: dict[int, list[float]] = st.session_state.card_times or {}
-            all_durations: list[tuple[float | None, int]] = []
-            for pid in active_ids:
-                arr = times_map.get(pid)
-                sec_val: float | None = float(arr[-1]) if arr and len(arr) > 0 else None
-                all_durations.append((sec_val, pid))
-            # 計測あり→降順、未計測は末尾
-            all_durations.sort(key=lambda x: (x[0] is None, -(x[0] if x[0] is not None else 0.0)))
-
             _render_results_table_with_inline_hints(
-                all_durations,
-                tips_df if isinstance(tips_df, pd.DataFrame) else None,
+                summary.all_durations,
+                tips_df,
                 hint_by_kami,
                 hint_by_shimo,
                 hint_by_id,
@@ -143,36 +133,6 @@ def _esc(x: object) -> str:
     return html.escape(x if isinstance(x, str) else "")
 
 
-def _render_upper(upper: object, key: object) -> str:
-    """上の句の先頭（決まり字の長さ＝非空白文字数）までを赤字で表示する。
-
-    - スペースは上の句の表記を維持し、カウントには含めない。
-    Args:
-        upper: 上の句テキスト。
-        key: 決まり字テキスト。
-    Returns:
-        強調表示済みのHTML文字列。
-    """
-    text = upper if isinstance(upper, str) else ""
-    k = key if isinstance(key, str) else ""
-    if not text or not k:
-        return _esc(text)
-    target = sum(1 for ch in k if not ch.isspace())
-    cnt = 0
-    prefix_chars: list[str] = []
-    suffix_chars: list[str] = []
-    for ch in text:
-        if cnt < target:
-            prefix_chars.append(ch)
-            if not ch.isspace():
-                cnt += 1
-        else:
-            suffix_chars.append(ch)
-    prefix = _esc("".join(prefix_chars))
-    suffix = _esc("".join(suffix_chars))
-    return f'<span class="upper-prefix">{prefix}</span>{suffix}'
-
-
 def _render_results_table_with_inline_hints(
     durations: list[tuple[float | None, int]],
     tips_df: pd.DataFrame | None,
@@ -182,9 +142,10 @@ def _render_results_table_with_inline_hints(
 ) -> None:
     """「各札の取得時間」表をHTMLで描画し、ヒント列のリンクでTipsの一部をポップオーバー表示する。
 
-    - ヒントをクリックすると、Tipsテーブルから該当行周辺のみを切り出した内容を
-      画面内にポップオーバーとして表示する。
+    - Tips 表は並び替え済みの JSON として 1 度だけ埋め込み、ヒントのクリック時に
+      該当行周辺のウィンドウをブラウザ側で描画する（送信量は札数に比例）。
     - ポップオーバーはクリック位置付近に表示され、ウィンドウ端で折り返される。
+    - 上の句は読まれた時点の決まり字（残り札のみで判定）までを強調する。
     """
     # 列定義
     css = """
@@ -194,6 +155,7 @@ def _render_results_table_with_inline_hints(
       .res-table th, .res-table td { border: 1px solid #eee; padding: 6px 8px; vertical-align: top; font-size: 0.95rem; }
       .res-table th { background: #fafafa; position: sticky; top: 0; z-index: 1; }
       .res-table .hint-cell a { margin-left: 0; text-decoration: underline; }
+      .res-table .upper-prefix { color: #d00; font-weight: 600; }
     </style>
     """
     parts: list[str] = [css, '<div class="res-wrap">', '<table class="res-table">']
@@ -208,191 +170,176 @@ def _render_results_table_with_inline_hints(
     )
     parts.append("<tbody>")
 
-    # 行とオーバーレイに使うコンテンツを準備
-    contents: dict[str, str] = {}
+    index = _get_tips_index(tips_df) if tips_df is not None and not tips_df.empty else None
+    # 読まれた時点の決まり字（札 ID -> 上の句かなの接頭辞）
+    card_kimariji: dict[int, str] = st.session_state.get("card_kimariji") or {}
+    # ヒントのリンクを出した行の Tips 表内の位置（ポップオーバーに送る行の範囲を決める）
+    linked_positions: list[int] = []
     for sec, pid in durations:
         p = _get_pair(pid)
         if not p:
             continue
         hint_val = None
-        if isinstance(tips_df, pd.DataFrame):
+        if tips_df is not None:
             # id があれば最優先で使用（句の重複による取りこぼし防止）
             if hint_by_id and pid in hint_by_id:
                 hint_val = hint_by_id.get(pid)
             else:
                 hint_val = hint_by_kami.get(p.kami) or hint_by_shimo.get(p.shimo)
         parts.append("<tr>")
-        parts.append(f"<td>{_esc(p.kami)}</td>")
+        kimari = card_kimariji.get(pid)
+        if kimari and p.kami.startswith(kimari):
+            # かなモードでは読まれた時点の決まり字までを強調
+            parts.append(f"<td>{render_upper(p.kami, kimari)}</td>")
+        else:
+            parts.append(f"<td>{_esc(p.kami)}</td>")
         parts.append(f"<td>{_esc(p.shimo)}</td>")
         parts.append(f"<td>{('-' if sec is None else f'{sec:.2f}')}</td>")
-        if hint_val and isinstance(tips_df, pd.DataFrame):
-            _id = f"h{pid}"
-            contents[_id] = _build_tips_window_html(
-                tips_df, focus_upper=p.kami, focus_lower=p.shimo, focus_id=pid, window=20
-            )
+        if hint_val and tips_df is not None:
+            # Tips 表内の位置（見つからなければ -1: 先頭ウィンドウを強調なしで表示）
+            pos = index.locate(pid, p.kami, p.shimo) if index is not None else None
+            data_pos = -1 if pos is None else pos
+            linked_positions.append(data_pos)
             parts.append(
-                f'<td class="hint-cell"><a href="#" class="hint-link" data-id="{_id}">{_esc(hint_val)}</a></td>'
+                f'<td class="hint-cell"><a href="#" class="hint-link" data-pos="{data_pos}">{_esc(hint_val)}</a></td>'
             )
         else:
             parts.append("<td>-</td>")
         parts.append("</tr>")
     parts.append("</tbody></table></div>")
-    # オーバーレイと隠しコンテンツ
-    overlay = _build_triggers_with_popover_html(contents)
+    # ポップオーバー（リンクを出した行の周辺だけの Tips 表の JSON とクライアント側の描画スクリプト）
+    tips_json = index.payload_json(linked_positions) if index is not None else "null"
+    overlay = _build_triggers_with_popover_html(tips_json)
     parts.append(overlay)
     components.html("".join(parts), height=520, width=1440, scrolling=False)
 
 
-def _build_tips_window_html(
-    tips_df: pd.DataFrame,
-    *,
-    focus_upper: str | None,
-    focus_lower: str | None,
-    focus_id: int | None = None,
-    window: int = 20,
-) -> str:
-    """ヒントのウィンドウ用HTMLを構築して返す（描画は呼び出し側）。
+class _TipsIndex:
+    """ポップオーバー用に並び替え済みの Tips 表と、行の位置索引を保持する。
 
-    Returns:
-        HTML 文字列。
+    - 並び順: 決まり字の長さ（非空白文字数）が長いほど上、その上で五十音順（上の句）
+    - rows: ブラウザ側でウィンドウを描画するための各行の値（表示列の順）。
+      上の句は決まり字があれば [強調部, 残り] の組で持つ。
+    - `payload_json(positions)` は指定位置の周辺ウィンドウに入る行だけを JSON にする
+      （表全体は送らない）。
+    - 位置索引は id → 上の句 → 下の句 の順で引く（同値が複数あれば先頭行）
     """
-    # 既存ロジックを流用してサブテーブルを作成
-    if not isinstance(tips_df, pd.DataFrame) or tips_df.empty:
-        return "<div>Tips がありません。</div>"
-    df = tips_df.copy()
-    # 並び順: 決まり字の長さ（非空白文字数）が長いほど上、その上で五十音順（上の句）
-    if "決まり字" in df.columns:
-
-        def _count_nonspace(x: object) -> int:
-            s = str(x) if isinstance(x, str) else ""
-            return sum(1 for ch in s if not ch.isspace())
-
-        df = (
-            df.assign(_len=df["決まり字"].apply(_count_nonspace))
-            .sort_values(["_len", "上の句"], ascending=[False, True])
-            .drop(columns=["_len"], errors="ignore")
-        )
-    elif "上の句" in df.columns:
-        df = df.sort_values(["上の句"])  # 決まり字がない場合のフォールバック
-    df = df.reset_index(drop=True)
-    match_idx = None
-    # id があれば id を最優先
-    if focus_id is not None and "id" in df.columns:
-        hit = df.index[df["id"] == focus_id]
-        if len(hit) > 0:
-            match_idx = int(hit[0])
-    if match_idx is None and focus_upper and "上の句" in df.columns:
-        hit = df.index[df["上の句"] == focus_upper]
-        if len(hit) > 0:
-            match_idx = int(hit[0])
-    if match_idx is None and focus_lower and "下の句" in df.columns:
-        hit = df.index[df["下の句"] == focus_lower]
-        if len(hit) > 0:
-            match_idx = int(hit[0])
-    n = len(df)
-    if match_idx is None:
-        start = 0
-        end = min(n, window)
-    else:
-        half = max(1, window // 2)
-        pos = int(match_idx)
-        start = max(0, min(pos - half, n - window))
-        end = min(n, start + window)
-    dfw = df.iloc[start:end]
 
-    css = """
-    <style>
-      .tips-wrap { max-height: 420px; overflow: auto; border: 1px solid #eee; border-radius: 4px; }
-      table.table-cards { table-layout: fixed; width: 100%; border-collapse: collapse; }
-      .table-cards th, .table-cards td { border: 1px solid #eee; padding: 6px 8px; vertical-align: top; font-size: 0.95rem; }
-      .table-cards th { background: #fafafa; position: sticky; top: 0; z-index: 1; }
-      .table-cards .upper-prefix { color: #d00; font-weight: 600; }
-      .table-cards tr.hl { background: #fff6e5; }
-      .table-cards th, .table-cards td { word-break: break-word; overflow-wrap: anywhere; }
-    </style>
-    """
-    display_cols = [c for c in ["上の句", "下の句", "ヒント"] if c in dfw.columns]
-    width_map = {"上の句": "32%", "下の句": "32%", "ヒント": "36%"}
-    wrap_id = f"tipswrap-{uuid.uuid4().hex[:8]}"
-    parts: list[str] = [
-        css,
-        f'<div id="{wrap_id}" class="tips-wrap">',
-        '<table class="table-cards">',
-    ]
-    parts.append("<colgroup>")
-    for c in display_cols:
-        parts.append(f'<col style="width:{width_map.get(c, "auto")}">')
-    parts.append("</colgroup>")
-    parts.append("<thead><tr>")
-    for c in display_cols:
-        parts.append(f"<th>{_esc(c)}</th>")
-    parts.append("</tr></thead>")
-    parts.append("<tbody>")
-    for idx, row in dfw.iterrows():
-        klass = ' class="hl"' if match_idx is not None and idx == match_idx else ""
-        parts.append(f"<tr{klass}>")
-        for c in display_cols:
-            if c == "上の句" and "決まり字" in dfw.columns:
-                cell_html = _render_upper(row.get("上の句"), row.get("決まり字"))
-            else:
-                cell_html = _esc(row.get(c))
-            parts.append(f"<td>{cell_html}</td>")
-        parts.append("</tr>")
-    parts.append("</tbody></table>")
-    parts.append("</div>")
-    parts.append(
-        """
-        <script>
-        (function() {
-            function centerRow(wrap) {
-                const row = wrap.querySelector('tr.hl');
-                if (!row) return;
-                const thead = wrap.querySelector('thead');
-                const headerH = thead ? thead.offsetHeight : 0;
-                const view = Math.max(0, wrap.clientHeight - headerH);
-                let target = row.offsetTop - headerH - (view/2) + (row.offsetHeight/2);
-                target = Math.max(0, Math.min(target, wrap.scrollHeight - wrap.clientHeight));
-                wrap.scrollTop = target;
-            }
-        const wrap = document.getElementById('"""
-        + wrap_id
-        + """');
-            if (!wrap) return;
-            requestAnimationFrame(() => centerRow(wrap));
-            requestAnimationFrame(() => centerRow(wrap));
-            setTimeout(() => centerRow(wrap), 60);
-        })();
-        </script>
+    __slots__ = ("cols", "rows", "pos_by_id", "pos_by_upper", "pos_by_lower")
+
+    def __init__(self, tips_df: pd.DataFrame) -> None:
+        df = sort_by_kimariji(tips_df)
+        df = df.reset_index(drop=True)
+
+        display_cols = [c for c in TIPS_DISPLAY_COLUMNS if c in df.columns]
+        has_key = "決まり字" in df.columns
+        columns = {c: df[c].tolist() for c in df.columns}
+        rows: list[list[object]] = []
+        for i in range(len(df)):
+            row: list[object] = []
+            for c in display_cols:
+                if c == "上の句" and has_key:
+                    row.append(list(split_upper(columns["上の句"][i], columns["決まり字"][i])))
+                else:
+                    v = columns[c][i]
+                    row.append(v if isinstance(v, str) else "")
+            rows.append(row)
+        self.cols = display_cols
+        self.rows = rows
+
+        self.pos_by_id: dict[object, int] = {}
+        self.pos_by_upper: dict[object, int] = {}
+        self.pos_by_lower: dict[object, int] = {}
+        for col, dst in (
+            ("id", self.pos_by_id),
+            ("上の句", self.pos_by_upper),
+            ("下の句", self.pos_by_lower),
+        ):
+            if col in columns:
+                for pos, v in enumerate(columns[col]):
+                    dst.setdefault(v, pos)
+
+    def payload_json(self, positions: list[int], window: int = POPOVER_WINDOW) -> str:
+        """positions（-1 は先頭）の周辺 window 行の和集合だけを含む表データの JSON を返す。
+
+        rows は「位置 -> 行」の対応（ブラウザ側の位置 data-pos と同じ番号）、n は表全体の行数。
         """
-    )
-    return "".join(parts)
+        n = len(self.rows)
+        keep: set[int] = set()
+        for pos in positions:
+            keep.update(_window_range(pos, n, window))
+        payload = {
+            "cols": self.cols,
+            "widths": [TIPS_COLUMN_WIDTHS.get(c, "auto") for c in self.cols],
+            "n": n,
+            "rows": {str(i): self.rows[i] for i in sorted(keep)},
+        }
+        # </script> による埋め込み崩れを防ぐ
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).replace("</", "<\\/")
+
+    def locate(
+        self, focus_id: int | None, focus_upper: str | None, focus_lower: str | None
+    ) -> int | None:
+        """フォーカス行の位置を返す（id を最優先、次に上の句、下の句）。無ければ None。"""
+        if focus_id is not None and focus_id in self.pos_by_id:
+            return self.pos_by_id[focus_id]
+        if focus_upper and focus_upper in self.pos_by_upper:
+            return self.pos_by_upper[focus_upper]
+        if focus_lower and focus_lower in self.pos_by_lower:
+            return self.pos_by_lower[focus_lower]
+        return None
+
+
+# データセット（DataFrame の同一性）ごとの索引キャッシュ
+_TIPS_INDEX_CACHE: FrameCache[_TipsIndex] = FrameCache()
+
+
+def _get_tips_index(tips_df: pd.DataFrame) -> _TipsIndex:
+    """Tips 表の索引を返す（同じ DataFrame に対しては初回のみ構築）。"""
+    return _TIPS_INDEX_CACHE.get(tips_df, "popover", _TipsIndex)
+
+
+def _window_range(pos: int, n: int, window: int) -> range:
+    """ポップオーバーに表示する行の範囲（ブラウザ側の buildWindow と同じ計算）。"""
+    if pos < 0:
+        return range(0, min(n, window))
+    half = max(1, window // 2)
+    start = max(0, min(pos - half, n - window))
+    return range(start, min(n, start + window))
 
 
-def _build_triggers_with_popover_html(contents: dict[str, str]) -> str:
+def _build_triggers_with_popover_html(tips_json: str, window: int = POPOVER_WINDOW) -> str:
     """ヒント用HTMLポップオーバー（アンカー表示）を構築して返す。
 
+    Tips 表は JSON で 1 度だけ埋め込み、クリックされた行の周辺 window 行を
+    ブラウザ側で描画する（文字列は textContent で挿入するためエスケープ不要）。
+
     Args:
-        contents: id -> HTML 本文。
+        tips_json: `_TipsIndex.payload_json(...)`（Tips が無ければ "null"）。
+        window: ポップオーバーに表示する行数。
     Returns:
         HTML 文字列。
     """
     css = """
         <style>
-            .hidden { display: none; }
             /* ポップオーバー本体 */
             .hint-popover { position: fixed; top: 0; left: 0; display: none; z-index: 9999; background: #fff; border: 1px solid #ddd; border-radius: 8px; box-shadow: 0 6px 24px rgba(0,0,0,0.25); width: min(1200px, 92vw); max-height: 82vh; overflow: hidden; }
             .hint-popover-header { display: flex; align-items: center; justify-content: space-between; padding: 8px 10px; border-bottom: 1px solid #eee; }
             .hint-popover-title { font-weight: 600; }
             .hint-popover-close { border: none; background: transparent; font-size: 20px; cursor: pointer; line-height: 1; padding: 4px 8px; }
             .hint-popover-body { padding: 8px 10px; overflow: hidden; }
-            /* 内容のテーブルラッパ（流用） */
-            .tips-wrap { max-height: 420px; }
+            /* 内容のテーブル */
+            .tips-wrap { max-height: 420px; overflow: auto; border: 1px solid #eee; border-radius: 4px; }
+            table.table-cards { table-layout: fixed; width: 100%; border-collapse: collapse; }
+            .table-cards th, .table-cards td { border: 1px solid #eee; padding: 6px 8px; vertical-align: top; font-size: 0.95rem; }
+            .table-cards th { background: #fafafa; position: sticky; top: 0; z-index: 1; }
+            .table-cards .upper-prefix { color: #d00; font-weight: 600; }
+            .table-cards tr.hl { background: #fff6e5; }
+            .table-cards th, .table-cards td { word-break: break-word; overflow-wrap: anywhere; }
         </style>
         """
     parts: list[str] = [css]
-    # 隠しコンテンツ
-    for _id, content_html in contents.items():
-        parts.append(f'<div id="content-{_id}" class="hidden">{content_html}</div>')
+    parts.append(f'<script type="application/json" id="tips-data">{tips_json}</script>')
     # ポップオーバー本体とスクリプト
     parts.append(
         """
@@ -407,10 +354,79 @@ def _build_triggers_with_popover_html(contents: dict[str, str]) -> str:
                 (function(){
                     const pop = document.getElementById('hint-popover');
                     const body = document.getElementById('hint-popover-body');
+                    const WINDOW = __WINDOW__;
+                    let tips = null;
                     let lastAnchor = null;
 
+                    function loadTips(){
+                        if (tips === null) {
+                            const el = document.getElementById('tips-data');
+                            try { tips = JSON.parse(el ? el.textContent : 'null'); } catch(e) { tips = undefined; }
+                        }
+                        return tips || null;
+                    }
+
                     function clamp(v, min, max){ return Math.max(min, Math.min(v, max)); }
 
+                    // 並び替え済み Tips のうち pos 周辺 WINDOW 行を表として組み立てる
+                    function buildWindow(pos){
+                        const data = loadTips();
+                        if (!data || !data.rows || !data.n) {
+                            const empty = document.createElement('div');
+                            empty.textContent = 'Tips がありません。';
+                            return empty;
+                        }
+                        const n = data.n;
+                        let start, end;
+                        if (pos < 0) {
+                            start = 0;
+                            end = Math.min(n, WINDOW);
+                        } else {
+                            const half = Math.max(1, Math.floor(WINDOW / 2));
+                            start = Math.max(0, Math.min(pos - half, n - WINDOW));
+                            end = Math.min(n, start + WINDOW);
+                        }
+                        const wrap = document.createElement('div');
+                        wrap.className = 'tips-wrap';
+                        const table = document.createElement('table');
+                        table.className = 'table-cards';
+                        const cg = document.createElement('colgroup');
+                        data.widths.forEach(w => { const col = document.createElement('col'); col.style.width = w; cg.appendChild(col); });
+                        table.appendChild(cg);
+                        const thead = document.createElement('thead');
+                        const htr = document.createElement('tr');
+                        data.cols.forEach(c => { const th = document.createElement('th'); th.textContent = c; htr.appendChild(th); });
+                        thead.appendChild(htr);
+                        table.appendChild(thead);
+                        const tbody = document.createElement('tbody');
+                        for (let i = start; i < end; i++) {
+                            // 送られてくるのはリンクのある行の周辺だけ（範囲はサーバ側と同じ計算）
+                            const row = data.rows[i];
+                            if (!row) continue;
+                            const tr = document.createElement('tr');
+                            if (i === pos) tr.className = 'hl';
+                            row.forEach(v => {
+                                const td = document.createElement('td');
+                                if (Array.isArray(v)) {
+                                    if (v[0]) {
+                                        const span = document.createElement('span');
+                                        span.className = 'upper-prefix';
+                                        span.textContent = v[0];
+                                        td.appendChild(span);
+                                    }
+                                    td.appendChild(document.createTextNode(v[1] || ''));
+                                } else {
+                                    td.textContent = v || '';
+                                }
+                                tr.appendChild(td);
+                            });
+                            tbody.appendChild(tr);
+                        }
+                        table.appendChild(tbody);
+                        wrap.appendChild(table);
+                        return wrap;
+                    }
+
                     function centerRowIn(wrap){
                         const row = wrap.querySelector('tr.hl');
                         if (!row) return;
@@ -458,10 +474,9 @@ def _build_triggers_with_popover_html(contents: dict[str, str]) -> str:
                         pop.style.top = top + 'px';
                     }
 
-                    function openById(id, anchor){
-                        const src = document.getElementById('content-'+id);
-                        if (!src) return;
-                        body.innerHTML = src.innerHTML;
+                    function openAt(pos, anchor){
+                        body.innerHTML = '';
+                        body.appendChild(buildWindow(pos));
                         lastAnchor = anchor || null;
                         // 表示＆位置決め
                         positionNear(anchor);
@@ -502,7 +517,10 @@ def _build_triggers_with_popover_html(contents: dict[str, str]) -> str:
 
                     // テーブル内リンクをバインド
                     document.querySelectorAll('.hint-link').forEach(a=>{
-                        a.addEventListener('click', (e)=>{ e.preventDefault(); openById(a.getAttribute('data-id'), a); });
+                        a.addEventListener('click', (e)=>{
+                            e.preventDefault();
+                            openAt(parseInt(a.getAttribute('data-pos'), 10), a);
+                        });
                     });
 
                     // 右上×
@@ -512,6 +530,6 @@ def _build_triggers_with_popover_html(contents: dict[str, str]) -> str:
                     window.addEventListener('resize', ()=>{ if (pop.style.display !== 'none' && lastAnchor) positionNear(lastAnchor); });
                 })();
                 </script>
-                """
+                """.replace("__WINDOW__", str(int(max(1, window))))
     )
     return "".join(parts)
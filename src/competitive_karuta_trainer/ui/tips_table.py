@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import html
+import threading
+import weakref
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    # pandas は起動時に読み込まない（Tips 表を持つデータセットの読み込み時に読み込まれる）
+    import pandas as pd
+
+T = TypeVar("T")
+
+# Tips 表の表示列と列幅
+TIPS_DISPLAY_COLUMNS = ("上の句", "下の句", "ヒント")
+TIPS_COLUMN_WIDTHS = {"上の句": "32%", "下の句": "32%", "ヒント": "36%"}
+
+_PRIORITY_ORDER = {"高": 0, "中": 1, "低": 2}
+
+# str.isspace() と同じ空白文字の集合（pyarrow 文字列型の正規表現では \s が ASCII のみのため明示する）
+_SPACE_CLASS = "[" + "".join(chr(i) for i in range(0x3001) if chr(i).isspace()) + "]"
+
+
+class FrameCache(Generic[T]):
+    """DataFrame の同一性（と任意のモード）をキーにした小さなキャッシュ。
+
+    - データセットの DataFrame はセッション間で共有され変更されない前提で、`id()` と弱参照で照合する。
+    - 破棄済みの DataFrame のエントリは登録時に掃除し、件数は max_entries に抑える。
+    - Streamlit はセッションごとに別スレッドで再実行するため、登録簿はロックで保護する。
+      構築（build）はロックの外で行い、同時に作られた場合は先に登録したものを使う。
+    """
+
+    def __init__(self, max_entries: int = 8) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._entries: dict[tuple[int, Hashable], tuple[weakref.ref[pd.DataFrame], T]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, df: pd.DataFrame, mode: Hashable, build: Callable[[pd.DataFrame], T]) -> T:
+        """キャッシュ済みの値を返す。無ければ build(df) で構築して登録する。"""
+        key = (id(df), mode)
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is not None and hit[0]() is df:
+                return hit[1]
+        value = build(df)
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is not None and hit[0]() is df:
+                return hit[1]
+            for k in [k for k, (ref, _) in self._entries.items() if ref() is None]:
+                del self._entries[k]
+            while len(self._entries) >= self.max_entries:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (weakref.ref(df), value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def count_nonspace(values: pd.Series) -> pd.Series:
+    """各値の非空白文字数を返す（文字列以外は 0）。列単位で一括計算する。"""
+    import pandas as pd
+
+    if not (values.dtype == object or pd.api.types.is_string_dtype(values.dtype)):
+        return pd.Series(0, index=values.index, dtype="int64")
+    lengths = values.str.replace(_SPACE_CLASS, "", regex=True).str.len()
+    return lengths.fillna(0).astype("int64")
+
+
+def sort_by_kimariji(df: pd.DataFrame) -> pd.DataFrame:
+    """Tips 表を並び替える。
+
+    - 決まり字の長さ（非空白の文字数）が長いほど上、その上で五十音順（上の句）
+    - 決まり字がなければ五十音順（上の句）のみ
+    """
+    if "決まり字" in df.columns:
+        return (
+            df.assign(_len=count_nonspace(df["決まり字"]))
+            .sort_values(["_len", "上の句"], ascending=[False, True])
+            .drop(columns=["_len"], errors="ignore")
+        )
+    if "上の句" in df.columns:
+        return df.sort_values(["上の句"])
+    return df
+
+
+def split_upper(upper: object, key: object) -> tuple[str, str]:
+    """上の句を、決まり字の長さ（非空白文字数）までの先頭部と残りに分ける。
+
+    - スペースは上の句の表記を維持し、カウントには含めない。
+    - 決まり字が無い場合は先頭部を空にする。
+    """
+    text = upper if isinstance(upper, str) else ""
+    k = key if isinstance(key, str) else ""
+    if not text or not k:
+        return "", text
+    target = sum(1 for ch in k if not ch.isspace())
+    cnt = 0
+    for i, ch in enumerate(text):
+        if cnt >= target:
+            return text[:i], text[i:]
+        if not ch.isspace():
+            cnt += 1
+    return text, ""
+
+
+def _esc(x: object) -> str:
+    """HTMLエスケープ（None対応）"""
+    return html.escape(x if isinstance(x, str) else "")
+
+
+def render_upper(upper: object, key: object) -> str:
+    """上の句の先頭（決まり字の長さ＝非空白文字数）までを赤字で表示する。"""
+    if not isinstance(upper, str) or not upper or not isinstance(key, str) or not key:
+        return _esc(upper)
+    prefix, suffix = split_upper(upper, key)
+    return f'<span class="upper-prefix">{_esc(prefix)}</span>{_esc(suffix)}'
+
+
+def tips_sort_mode(df: pd.DataFrame) -> str:
+    """Tips ページの並び替えモード（列構成から決まる）を返す。"""
+    base = "kimariji" if "決まり字" in df.columns else "upper" if "上の句" in df.columns else "none"
+    return f"priority+{base}" if "優先度" in df.columns else base
+
+
+def _prepare_tips_page_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Tips ページ表示用に列を落とし、並び替えた表を返す。"""
+    drop_cols = [c for c in ["id", "長さ"] if c in df.columns]
+    if drop_cols:
+        df = df.drop(columns=drop_cols)
+    if "優先度" in df.columns:
+        sort_key = df["優先度"].map(_PRIORITY_ORDER).fillna(99)
+        df = (
+            df.assign(_優先度順=sort_key)
+            .sort_values(["_優先度順", "決まり字"], ascending=[True, True])
+            .drop(columns=["_優先度順", "優先度"])
+        )
+    return sort_by_kimariji(df)
+
+
+_CSS = """
+<style>
+  table.table-cards { table-layout: fixed; width: 100%; border-collapse: collapse; }
+  .table-cards th, .table-cards td { border: 1px solid #eee; padding: 6px 8px; vertical-align: top; font-size: 0.95rem; }
+  .table-cards th { background: #fafafa; }
+  .table-cards .upper-prefix { color: #d00; font-weight: 600; }
+  .table-cards th, .table-cards td { word-break: break-word; overflow-wrap: anywhere; }
+</style>
+"""
+
+
+def _build_tips_page_html(df: pd.DataFrame) -> str:
+    df = _prepare_tips_page_frame(df)
+    display_cols = [c for c in TIPS_DISPLAY_COLUMNS if c in df.columns]
+
+    parts: list[str] = [_CSS, '<table class="table-cards">']
+    parts.append("<colgroup>")
+    for c in display_cols:
+        parts.append(f'<col style="width:{TIPS_COLUMN_WIDTHS.get(c, "auto")}">')
+    parts.append("</colgroup>")
+
+    parts.append("<thead><tr>")
+    for c in display_cols:
+        parts.append(f"<th>{_esc(c)}</th>")
+    parts.append("</tr></thead>")
+
+    # 列ごとに値を取り出して行を組み立てる（iterrows を避ける）
+    keys = df["決まり字"].tolist() if "決まり字" in df.columns else None
+    cells_by_col: list[list[str]] = []
+    for c in display_cols:
+        values = df[c].tolist()
+        if c == "上の句" and keys is not None:
+            cells_by_col.append([render_upper(u, k) for u, k in zip(values, keys, strict=True)])
+        else:
+            cells_by_col.append([_esc(v) for v in values])
+
+    parts.append("<tbody>")
+    rows = zip(*cells_by_col, strict=True) if cells_by_col else [()] * len(df)
+    for row in rows:
+        parts.append("<tr>")
+        parts.extend(f"<td>{cell}</td>" for cell in row)
+        parts.append("</tr>")
+    parts.append("</tbody></table>")
+    return "".join(parts)
+
+
+_TIPS_PAGE_CACHE: FrameCache[str] = FrameCache()
+
+
+def render_tips_page_html(df: pd.DataFrame) -> str:
+    """Tips ページの表 HTML を返す（同じ DataFrame・並び替えモードでは初回のみ構築）。"""
+    return _TIPS_PAGE_CACHE.get(df, tips_sort_mode(df), _build_tips_page_html)
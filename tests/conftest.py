@@ -0,0 +1,10 @@
+"""テスト共通の設定。"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+
+# キャッシュ（データセット・音声）は利用者の既定ディレクトリではなく一時ディレクトリに置く
+# （サービスのモジュール変数が作られる前、テストモジュールの読み込みより先に設定する）
+os.environ.setdefault("KARUTA_TRAINER_CACHE_DIR", tempfile.mkdtemp(prefix="karuta-test-"))
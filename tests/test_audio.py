@@ -0,0 +1,42 @@
+"""音声合成結果のメモリキャッシュ（失敗は保存しない・バックエンドごとに分ける）。"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from src.competitive_karuta_trainer.services import audio
+
+
+@dataclass(frozen=True)
+class _FlakyBackend:
+    """指定回数だけ失敗してから、音声として tag を返すバックエンド。"""
+
+    tag: bytes
+    failures: int = 0
+    name: str = "flaky"
+    cacheable: bool = False
+    calls: list[str] = field(default_factory=list, compare=False, hash=False)
+
+    def synthesize(self, text: str, lang: str) -> bytes | None:
+        self.calls.append(text)
+        if len(self.calls) <= self.failures:
+            return None
+        return self.tag + text.encode()
+
+
+def test_failed_synthesis_is_retried() -> None:
+    backend = _FlakyBackend(b"ok:", failures=1)
+    assert audio._synthesize_with(backend, "あきのたの", "ja") is None
+    assert audio._synthesize_with(backend, "あきのたの", "ja") == "ok:あきのたの".encode()
+    # 成功した結果はメモリキャッシュから返す
+    assert audio._synthesize_with(backend, "あきのたの", "ja") == "ok:あきのたの".encode()
+    assert backend.calls == ["あきのたの", "あきのたの"]
+
+
+def test_backends_with_same_name_do_not_share_results() -> None:
+    first = _FlakyBackend(b"first:")
+    second = _FlakyBackend(b"second:")
+    assert first.name == second.name
+    assert audio._synthesize_with(first, "はるすぎて", "ja") == "first:はるすぎて".encode()
+    assert audio._synthesize_with(second, "はるすぎて", "ja") == "second:はるすぎて".encode()
+    assert len(first.calls) == 1 and len(second.calls) == 1
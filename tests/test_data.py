@@ -0,0 +1,128 @@
+"""CSV からのペア読み込み（`load_pairs` / `pairs_from_columns`）の確認。"""
+
+from __future__ import annotations
+
+import pathlib
+import random
+import re
+
+import pandas as pd
+import pytest
+
+from src.competitive_karuta_trainer.domain.data import Pair, load_pairs, pairs_from_columns
+
+
+def test_load_pairs_appends_fallback_lines_after_csv_rows(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "cards.csv"
+    path.write_text(
+        "上の句 , 下の句 \n"
+        "あきの　たの,わがころも  では\n"
+        "はるすぎて,NA\n"
+        "\n"
+        "たごのうらに、ふじのたかねに\n"
+        "あきの たの,わがころも では\n",
+        encoding="utf-8",
+    )
+    assert load_pairs(path) == [
+        Pair(0, "あきの たの", "わがころも では"),
+        # 欠損（NA）の行は CSV としては読まないが、行テキストの分割で補う
+        Pair(1, "はるすぎて", "NA"),
+        Pair(2, "たごのうらに", "ふじのたかねに"),
+    ]
+
+
+def test_pairs_from_columns_skips_missing_and_duplicates() -> None:
+    pairs = pairs_from_columns(
+        ["あ", None, "う", "あ"],
+        ["い", "え", "", "い"],
+        fallback=(["か", "あ"], ["き", "い"]),
+    )
+    assert pairs == [Pair(0, "あ", "い"), Pair(1, "か", "き")]
+
+
+def test_pairs_from_columns_rejects_empty() -> None:
+    with pytest.raises(ValueError):
+        pairs_from_columns([None], ["い"])
+
+
+def _two_pass_load_pairs(path: pathlib.Path) -> list[tuple[str, str]]:
+    """以前の 2 回読み（pandas で解析した後、行テキストを読み直して補う）の結果。"""
+
+    def norm(s: str) -> str:
+        return re.sub(r"\s+", " ", s.replace("　", " ").strip())
+
+    df = pd.read_csv(path, header=0, sep=",", engine="python", dtype=str, encoding="utf-8")
+    df.rename(columns={c: c.strip() for c in df.columns}, inplace=True)
+    col_kami = next((c for c in df.columns if c.replace(" ", "") == "上の句"), None)
+    col_shimo = next((c for c in df.columns if c.replace(" ", "") == "下の句"), None)
+    if col_kami is None or col_shimo is None:
+        col_kami, col_shimo = df.columns[:2]
+    rows: list[tuple[str, str]] = []
+    for kami, shimo in zip(df[col_kami], df[col_shimo], strict=True):
+        if not (pd.isna(kami) or pd.isna(shimo)):
+            rows.append((norm(kami), norm(shimo)))
+    for line in path.read_text(encoding="utf-8").splitlines()[1:]:
+        if not line.strip():
+            continue
+        sep = "," if "," in line else "、" if "、" in line else None
+        if sep is not None:
+            kami, shimo = line.split(sep, 1)
+            rows.append((norm(kami), norm(shimo)))
+    out: list[tuple[str, str]] = []
+    for row in rows:
+        if row[0] and row[1] and row not in out:
+            out.append(row)
+    return out
+
+
+def _random_csv(rng: random.Random) -> str:
+    cells = ["あ", "い う", "　か ", "NA", "nan", "", '"q,q"', '"m\nl"', "x、y", " ", '"a""b"']
+    lines = [rng.choice(["上の句,下の句", "下の句 , 上の句,ヒント", "a,b"])]
+    for _ in range(rng.randint(1, 8)):
+        if rng.random() < 0.2:
+            lines.append(rng.choice(cells) + "、" + rng.choice(cells))
+        else:
+            lines.append(",".join(rng.choice(cells) for _ in range(rng.randint(0, 2))))
+    newline = rng.choice(["\n", "\r\n"])
+    return newline.join(lines) + newline
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_load_pairs_matches_two_pass_result(tmp_path: pathlib.Path, seed: int) -> None:
+    path = tmp_path / "cards.csv"
+    path.write_text(_random_csv(random.Random(seed)), encoding="utf-8", newline="")
+    try:
+        expected = _two_pass_load_pairs(path)
+    except ValueError:
+        expected = []
+    if not expected:
+        with pytest.raises(ValueError):
+            load_pairs(path)
+    else:
+        assert [(p.kami, p.shimo) for p in load_pairs(path)] == expected
+
+
+def test_load_pairs_opens_file_once_without_pandas(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "cards.csv"
+    path.write_text(
+        "上の句,下の句\nあきの,わがころも\nはるすぎて、なつきにけらし\n", encoding="utf-8"
+    )
+    opened: list[pathlib.Path] = []
+    real_open = pathlib.Path.open
+
+    def counting_open(self: pathlib.Path, *args: object, **kwargs: object) -> object:
+        opened.append(self)
+        return real_open(self, *args, **kwargs)  # type: ignore[call-overload]
+
+    def no_read_csv(*args: object, **kwargs: object) -> None:
+        raise AssertionError("ローカルファイルを pandas で読み直した")
+
+    monkeypatch.setattr(pathlib.Path, "open", counting_open)
+    monkeypatch.setattr(pd, "read_csv", no_read_csv)
+    assert load_pairs(path) == [
+        Pair(0, "あきの", "わがころも"),
+        Pair(1, "はるすぎて", "なつきにけらし"),
+    ]
+    assert opened == [path]
@@ -0,0 +1,27 @@
+"""セッションのペア索引（辞書 / `PairView`）の確認。"""
+
+from __future__ import annotations
+
+from src.competitive_karuta_trainer.adapters.session_store_memory import InMemorySessionStore
+from src.competitive_karuta_trainer.domain import Pair, PairTable
+from src.competitive_karuta_trainer.services import data_access
+
+KANA = [Pair(0, "あきのたの", "わがころもでは"), Pair(1, "はるすぎて", "ころもほすてふ")]
+KANJI = [Pair(0, "秋の田の", "わが衣手は"), Pair(1, "春過ぎて", "衣ほすてふ")]
+
+
+def test_get_pair_from_dict_index() -> None:
+    store = InMemorySessionStore()
+    data_access.set_pairs(store, KANA)
+    assert data_access.get_pair(store, 1) == KANA[1]
+    assert data_access.get_pair(store, 5) is None
+    assert data_access.get_pair(store, None) is None
+
+
+def test_get_pair_from_table_view() -> None:
+    store = InMemorySessionStore()
+    view = data_access.set_pair_table(store, PairTable.from_pairs(KANA, KANJI), "kanji")
+    assert data_access.get_pairs_map(store) is view
+    assert data_access.get_pair(store, 0) == KANJI[0]
+    assert data_access.get_pair(store, 5) is None
+    assert list(data_access.get_pairs(store)) == KANJI
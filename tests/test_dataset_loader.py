@@ -0,0 +1,76 @@
+"""データセット読み込み（ZIP / 個別ファイル）の確認。"""
+
+from __future__ import annotations
+
+import io
+import struct
+import tracemalloc
+import zipfile
+
+import pytest
+
+from src.competitive_karuta_trainer.adapters.session_store_memory import InMemorySessionStore
+from src.competitive_karuta_trainer.services import dataset_loader
+
+CSV = (
+    "id,上の句,下の句,上の句（ひらがな）,下の句（ひらがな）,ヒント\n"
+    "1,秋の田の,わが衣手は,あきのたの,わがころもでは,秋\n"
+    "2,春過ぎて,衣ほすてふ,はるすぎて,ころもほすてふ,春\n"
+).encode()
+
+
+def _png_header(width: int, height: int) -> bytes:
+    """IHDR までの PNG ヘッダ（画素データは持たない）。"""
+    ihdr = struct.pack(">II", width, height) + b"\x08\x02\x00\x00\x00"
+    return b"\x89PNG\r\n\x1a\n" + struct.pack(">I", len(ihdr)) + b"IHDR" + ihdr
+
+
+def _zip(files: dict[str, bytes]) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, data in files.items():
+            zf.writestr(name, data)
+    return buf.getvalue()
+
+
+@pytest.mark.parametrize(
+    "png",
+    [b"not a png", _png_header(100_000, 100_000)],
+    ids=["invalid", "too-many-pixels"],
+)
+def test_bad_rule_image_is_dropped_with_warning(png: bytes) -> None:
+    compiled = dataset_loader.compile_zip_bytes(_zip({"cards.csv": CSV, "rule.png": png}))
+    assert compiled.rule_image is None
+    assert len(compiled.kana) == 2
+    assert len(compiled.warnings) == 1 and "ルール画像" in compiled.warnings[0]
+
+    compiled = dataset_loader.compile_multi_bytes({"cards.csv": CSV, "rule.png": png})
+    assert compiled.rule_image is None
+    assert len(compiled.warnings) == 1
+
+
+def test_dataset_without_rule_image_has_no_warnings() -> None:
+    compiled = dataset_loader.compile_zip_bytes(_zip({"cards.csv": CSV}))
+    assert compiled.rule_image is None
+    assert compiled.warnings == ()
+
+
+def test_load_stats_are_kept_per_session() -> None:
+    store_a, store_b = InMemorySessionStore(), InMemorySessionStore()
+    zip_bytes = _zip({"cards.csv": CSV + "3,夏,夜,なつ,よる,夏\n".encode()})
+    lease_a = dataset_loader.share_zip(zip_bytes, store=store_a, trace_memory=True)
+    lease_b = dataset_loader.share_multi_bytes({"cards.csv": CSV}, store=store_b)
+    try:
+        stats_a = dataset_loader.last_load_stats(store_a)
+        stats_b = dataset_loader.last_load_stats(store_b)
+        assert stats_a is not None and stats_b is not None
+        assert (stats_a.source, stats_a.upload_bytes) == ("zip", len(zip_bytes))
+        assert (stats_b.source, stats_b.upload_bytes) == ("multi", len(CSV))
+        # 読み込みの間だけ tracemalloc を有効にしてヒープの最大を計る
+        assert stats_a.memory.traced_peak is not None
+        assert stats_b.memory.traced_peak is None
+        assert not tracemalloc.is_tracing()
+        assert dataset_loader.last_load_stats(InMemorySessionStore()) is None
+    finally:
+        lease_a.release()
+        lease_b.release()
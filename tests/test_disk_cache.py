@@ -0,0 +1,84 @@
+"""ディスクキャッシュの権限・署名・追い出し（索引による総バイト数の管理）。"""
+
+from __future__ import annotations
+
+import os
+import pathlib
+import stat
+
+import pytest
+
+from src.competitive_karuta_trainer.services.dataset_cache import DatasetCache
+from src.competitive_karuta_trainer.services.disk_cache import DiskCache
+
+
+def test_directory_is_private(tmp_path: pathlib.Path) -> None:
+    directory = tmp_path / "cache"
+    directory.mkdir(mode=0o755)
+    os.chmod(directory, 0o755)
+    cache = DiskCache(directory, 1024)
+    assert cache.put("aa", b"x")
+    assert stat.S_IMODE(directory.stat().st_mode) == 0o700
+
+
+def test_evicts_least_recently_used_without_rescanning(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = DiskCache(tmp_path, 30)
+    assert cache.put("a", b"1" * 10)
+    assert cache.put("b", b"2" * 10)
+    assert cache.put("c", b"3" * 10)
+    assert cache.get("a") == b"1" * 10  # a を最近参照したものにする
+
+    def fail_glob(self: pathlib.Path, pattern: str) -> list[pathlib.Path]:
+        raise AssertionError("put がディレクトリを走査した")
+
+    monkeypatch.setattr(pathlib.Path, "glob", fail_glob)
+    assert cache.put("d", b"4" * 10)
+    assert cache.total_bytes() == 30
+    assert cache.evictions == 1
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1" * 10
+    assert cache.put("a", b"5" * 5)  # 上書きは差分だけ数える
+    assert cache.total_bytes() == 25
+
+
+def test_index_picks_up_existing_entries(tmp_path: pathlib.Path) -> None:
+    assert DiskCache(tmp_path, 100).put("a", b"1" * 40)
+    cache = DiskCache(tmp_path, 100)
+    assert cache.total_bytes() == 40
+    assert cache.put("b", b"2" * 70)
+    assert cache.get("a") is None
+    assert cache.total_bytes() == 70
+
+
+def test_signed_entries_reject_tampering(tmp_path: pathlib.Path) -> None:
+    cache = DiskCache(tmp_path, 1024, signed=True)
+    assert cache.put("aa", b"payload")
+    assert cache.get("aa") == b"payload"
+
+    path = tmp_path / "aa.bin"
+    path.write_bytes(path.read_bytes()[:-1] + b"!")
+    assert cache.get("aa") is None
+    assert not path.exists()
+
+    # 鍵を知らない第三者が置いたファイルも読まない
+    (tmp_path / "bb.bin").write_bytes(b"\0" * 32 + b"payload")
+    assert cache.get("bb") is None
+    # 別のインスタンスでも同じ鍵で読める
+    assert cache.put("cc", b"again")
+    assert DiskCache(tmp_path, 1024, signed=True).get("cc") == b"again"
+
+
+def test_signed_cache_refuses_shared_key(tmp_path: pathlib.Path) -> None:
+    assert DiskCache(tmp_path, 1024, signed=True).put("aa", b"payload")
+    os.chmod(tmp_path / "hmac.key", 0o644)
+    cache = DiskCache(tmp_path, 1024, signed=True)
+    assert cache.get("aa") is None
+    assert not cache.put("bb", b"payload")
+
+
+def test_dataset_cache_requires_signed_disk(tmp_path: pathlib.Path) -> None:
+    with pytest.raises(ValueError):
+        DatasetCache(DiskCache(tmp_path, 1024), 1024)
+    DatasetCache(DiskCache(tmp_path, 1024, signed=True), 1024)
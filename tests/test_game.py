@@ -0,0 +1,103 @@
+"""盤面（Board）の索引を、grid の全走査と突き合わせる。"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from src.competitive_karuta_trainer.domain.game import (
+    Board,
+    Grid,
+    choose_target_from_grid,
+    grid_positions,
+    init_board,
+    init_grid,
+    refill_cell,
+    remaining_on_grid,
+)
+
+
+def _scan(grid: Grid) -> dict[int, tuple[int, int]]:
+    """grid を全走査して、札 ID -> セルの対応を返す。"""
+    return {card_id: (r, c) for r, c in grid_positions(grid) if (card_id := grid[r][c]) is not None}
+
+
+def _assert_index_matches_grid(board: Board) -> None:
+    expected = _scan(board.grid)
+    assert board.remaining == len(expected)
+    assert sorted(board.cards()) == sorted(expected)
+    for card_id, cell in expected.items():
+        assert board.position(card_id) == cell
+        assert board.card_at(*cell) == card_id
+    assert sorted(board._occupied) == sorted(expected.values())
+    assert all(board._occupied[i] == cell for cell, i in board._slot.items())
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_board_index_matches_full_scan_after_each_operation(seed: int) -> None:
+    rng = random.Random(seed)
+    rows, cols = rng.randint(1, 5), rng.randint(1, 5)
+    deck = rng.sample(range(1000), rng.randint(0, rows * cols * 2))
+    legacy_deck = list(deck)
+    board = init_board(deck, rows, cols)
+    legacy: Grid = init_grid(legacy_deck, rows, cols)
+    assert board.grid == legacy
+    next_id = 1000
+    for _ in range(rng.randint(0, 60)):
+        r, c = rng.randrange(rows), rng.randrange(cols)
+        op = rng.random()
+        if op < 0.45:
+            removed = board.remove(r, c)
+            assert removed == legacy[r][c]
+            legacy[r][c] = None
+            if removed is not None:
+                assert board.position(removed) is None
+        elif op < 0.8:
+            # 旧来の関数は Board と二次元配列のどちらにも同じ結果を返す
+            refill_cell(board, r, c, deck)
+            refill_cell(legacy, r, c, legacy_deck)
+            assert deck == legacy_deck
+        elif board.card_at(r, c) is None:
+            board.place(r, c, next_id)
+            legacy[r][c] = next_id
+            next_id += 1
+        else:
+            with pytest.raises(ValueError):
+                board.place(r, c, next_id)
+        assert board.grid == legacy
+        _assert_index_matches_grid(board)
+        assert remaining_on_grid(board) == remaining_on_grid(legacy) == board.remaining
+
+        on_board = set(_scan(legacy))
+        target = board.choose_target()
+        assert (target is None) if not on_board else (target in on_board)
+        legacy_target = choose_target_from_grid(legacy)
+        assert (legacy_target is None) if not on_board else (legacy_target in on_board)
+        assert (choose_target_from_grid(board) is None) == (not on_board)
+
+
+def test_choose_target_draws_every_card_on_board() -> None:
+    random.seed(0)
+    board = Board([[1, None, 2], [None, 3, 4]])
+    board.remove(0, 2)
+    assert {board.choose_target() for _ in range(200)} == {1, 3, 4}
+    for r, c in grid_positions(board.grid):
+        board.remove(r, c)
+    assert board.choose_target() is None
+    assert choose_target_from_grid(board) is None
+    assert remaining_on_grid(board) == 0
+
+
+def test_refill_keeps_cell_and_deck_when_occupied_or_deck_empty() -> None:
+    board = Board([[7, None]])
+    deck = [5]
+    board.refill(0, 0, deck)
+    assert deck == [5] and board.card_at(0, 0) == 7
+    board.refill(0, 1, deck)
+    assert deck == [] and board.position(5) == (0, 1)
+    assert board.remove(0, 1) == 5
+    board.refill(0, 1, deck)
+    assert board.card_at(0, 1) is None
+    assert board.remove(0, 1) is None
+    _assert_index_matches_grid(board)
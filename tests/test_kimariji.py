@@ -0,0 +1,113 @@
+"""決まり字の算出（接頭辞トライ）を定義どおりの総当たりと突き合わせる。"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from src.competitive_karuta_trainer.services.kimariji import (
+    LiveKimariji,
+    _compute_unique_lengths,
+    _strip_for_kimariji,
+    compute_kimariji_prefixes,
+)
+
+
+def _brute_force_lengths(stripped_list: list[str]) -> list[int]:
+    """他のどの文字列とも共有しない最短の接頭辞の長さ（O(n^2 L)）。無ければ全長、空なら 0。"""
+    out: list[int] = []
+    for i, s in enumerate(stripped_list):
+        length = len(s)
+        for n in range(1, len(s) + 1):
+            prefix = s[:n]
+            if not any(j != i and t.startswith(prefix) for j, t in enumerate(stripped_list)):
+                length = n
+                break
+        out.append(length)
+    return out
+
+
+def _random_deck(rng: random.Random) -> list[str]:
+    """接頭辞の共有・他の接頭辞になる文字列・重複・空白/句読点を含む原文の群を作る。"""
+    alphabet = rng.choice(["ab", "abc", "あいう", "あいうえおかきくけこ"])
+    separators = [" ", "　", "、", "。", "・", "（", "）", "!"]
+    deck: list[str] = []
+    for _ in range(rng.randint(0, 40)):
+        kind = rng.random()
+        if deck and kind < 0.15:
+            # 重複
+            deck.append(rng.choice(deck))
+        elif deck and kind < 0.35:
+            # 既存の文字列の接頭辞、または既存の文字列を延長したもの
+            base = rng.choice(deck)
+            if rng.random() < 0.5:
+                deck.append(base[: rng.randint(0, len(base))])
+            else:
+                deck.append(base + "".join(rng.choices(alphabet, k=rng.randint(1, 3))))
+        else:
+            chars = rng.choices(alphabet, k=rng.randint(0, 8))
+            # 空白・句読点を混ぜる（判定からは除外される）
+            for _ in range(rng.randint(0, 3)):
+                chars.insert(rng.randint(0, len(chars)), rng.choice(separators))
+            deck.append("".join(chars))
+    return deck
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_unique_lengths_match_brute_force(seed: int) -> None:
+    rng = random.Random(seed)
+    stripped = [_strip_for_kimariji(s) for s in _random_deck(rng)]
+    assert _compute_unique_lengths(stripped) == _brute_force_lengths(stripped)
+
+
+@pytest.mark.parametrize(
+    "stripped",
+    [
+        [],
+        [""],
+        ["", ""],
+        ["あ"],
+        ["あ", "あ"],
+        ["あき", "あきの", "あきのた"],
+        ["あきのたの", "あきかぜに", "あさぼらけ", "あさぼらけ"],
+        ["ab", "abc", "abd", "b"],
+    ],
+)
+def test_unique_lengths_edge_cases(stripped: list[str]) -> None:
+    assert _compute_unique_lengths(stripped) == _brute_force_lengths(stripped)
+
+
+def test_prefixes_keep_original_whitespace_and_punctuation() -> None:
+    originals = ["あき の たの", "あき、かぜに", "あさ・ぼらけ"]
+    assert compute_kimariji_prefixes(originals) == ["あき の", "あき、か", "あさ"]
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_live_kimariji_matches_full_recompute_after_each_removal(seed: int) -> None:
+    rng = random.Random(seed)
+    deck = _random_deck(rng)
+    ids = rng.sample(range(1000), len(deck))
+    live = LiveKimariji(zip(ids, deck, strict=True))
+    remaining = dict(zip(ids, deck, strict=True))
+    order = list(ids)
+    rng.shuffle(order)
+    for pair_id in order:
+        live.remove(pair_id)
+        del remaining[pair_id]
+        expected = dict(zip(remaining, compute_kimariji_prefixes(remaining.values()), strict=True))
+        assert live.current() == expected
+        lengths = _brute_force_lengths([_strip_for_kimariji(s) for s in remaining.values()])
+        assert [live.length(pid) for pid in remaining] == lengths
+        assert pair_id not in live
+        assert len(live) == len(remaining)
+
+
+def test_live_kimariji_ignores_unknown_and_removed_ids() -> None:
+    live = LiveKimariji([(1, "あきの"), (2, "あきか")])
+    live.remove(3)
+    live.remove(1)
+    live.remove(1)
+    assert live.current() == {2: "あ"}
+    assert live.kimariji(1) is None
+    assert live.length(3) is None
@@ -0,0 +1,83 @@
+"""セッションストアのトランザクション（commit で一括反映・rollback で破棄）。"""
+
+from __future__ import annotations
+
+import pytest
+
+from src.competitive_karuta_trainer.adapters.session_store_memory import InMemorySessionStore
+from src.competitive_karuta_trainer.app.ports.session_store import (
+    SessionStore,
+    SessionTransaction,
+    transaction,
+    transactional,
+)
+
+
+def test_commit_applies_dirty_keys_in_one_set_many() -> None:
+    shared = {"a": 1}
+    store = InMemorySessionStore({"x": 0, "shared": shared})
+    tx = SessionTransaction(store)
+    tx.set("x", 1)
+    tx.set("x", 2)
+    tx.set("y", "new")
+    tx.set("shared", shared)  # 現在値と同一オブジェクトは変更とみなさない
+    assert tx.get("x") == 2
+    assert store.data["x"] == 0
+    assert tx.dirty == {"x", "y"}
+
+    assert tx.commit() == 2
+    assert store.data == {"x": 2, "y": "new", "shared": shared}
+    assert store.stats()["sets"] == 0
+    assert store.stats()["commits"] == 1
+    assert tx.dirty == frozenset()
+    assert tx.commit() == 0
+    assert store.stats()["commits"] == 1
+
+
+def test_rollback_leaves_store_untouched() -> None:
+    store = InMemorySessionStore({"x": 0})
+    tx = SessionTransaction(store)
+    tx.set("x", 1)
+    tx.set_many({"y": 2})
+    tx.rollback()
+    assert tx.get("x") == 0
+    assert tx.get("y") is None
+    assert tx.commit() == 0
+    assert store.data == {"x": 0}
+    assert store.stats() == {"sets": 0, "commits": 0, "keys": 1}
+
+
+def test_transaction_rolls_back_on_error() -> None:
+    store = InMemorySessionStore({"x": 0})
+    with pytest.raises(RuntimeError), transaction(store) as tx:
+        tx.set("x", 1)
+        raise RuntimeError("boom")
+    assert store.data == {"x": 0}
+    assert store.stats()["commits"] == 0
+
+
+def test_nested_transactions_commit_once() -> None:
+    store = InMemorySessionStore()
+
+    @transactional
+    def bump(s: SessionStore, key: str) -> None:
+        s.set(key, (s.get(key) or 0) + 1)
+
+    with transaction(store) as tx:
+        bump(tx, "x")
+        bump(tx, "x")
+        assert store.data == {}
+    assert store.data == {"x": 2}
+    assert store.stats()["commits"] == 1
+
+
+def test_rollback_keeps_in_place_changes() -> None:
+    times: dict[str, float] = {}
+    store = InMemorySessionStore({"card_times": times})
+    with pytest.raises(RuntimeError), transaction(store) as tx:
+        tx.get("card_times")["あきのたの"] = 1.5
+        tx.set("x", 1)
+        raise RuntimeError("boom")
+    # set した値は破棄されるが、取得した dict へのその場の変更は残る（契約どおり）
+    assert "x" not in store.data
+    assert store.data["card_times"] == {"あきのたの": 1.5}
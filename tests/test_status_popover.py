@@ -0,0 +1,48 @@
+"""結果画面のヒントのポップオーバーに送る Tips 表の確認。"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import subprocess
+import sys
+
+import pandas as pd
+
+from src.competitive_karuta_trainer.ui import status
+
+
+def _tips(n: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "id": list(range(n)),
+            "上の句": [f"うえ{i:03d}" for i in range(n)],
+            "下の句": [f"した{i:03d}" for i in range(n)],
+            "ヒント": [f"ヒント{i}" for i in range(n)],
+        }
+    )
+
+
+def test_payload_holds_only_windows_of_linked_rows() -> None:
+    index = status._TipsIndex(_tips(200))
+    data = json.loads(index.payload_json([100, 105, -1], window=20))
+    assert data["n"] == 200
+    # 100 と 105 の周辺（90..114）と先頭ウィンドウ（0..19）の和集合
+    assert sorted(int(k) for k in data["rows"]) == [*range(0, 20), *range(90, 115)]
+
+
+def test_window_range_is_clamped_to_table() -> None:
+    assert status._window_range(-1, 5, 20) == range(0, 5)
+    assert status._window_range(0, 200, 20) == range(0, 20)
+    assert status._window_range(199, 200, 20) == range(180, 200)
+
+
+def test_app_import_does_not_load_pandas() -> None:
+    # 起動時（データセット読み込み前）は pandas を読み込まない
+    code = (
+        "import sys\n"
+        "import src.competitive_karuta_trainer.app.entrypoint\n"
+        "sys.exit('pandas' in sys.modules)\n"
+    )
+    root = pathlib.Path(__file__).resolve().parents[1]
+    assert subprocess.run([sys.executable, "-c", code], cwd=root, check=False).returncode == 0
@@ -0,0 +1,48 @@
+"""DataFrame の同一性をキーにしたキャッシュ（FrameCache）。"""
+
+from __future__ import annotations
+
+import threading
+
+import pandas as pd
+
+from src.competitive_karuta_trainer.ui.tips_table import FrameCache
+
+
+def test_reuses_value_for_same_frame_and_mode() -> None:
+    cache: FrameCache[int] = FrameCache()
+    df = pd.DataFrame({"a": [1, 2]})
+    calls: list[str] = []
+
+    def build(frame: pd.DataFrame) -> int:
+        calls.append("build")
+        return len(frame)
+
+    assert cache.get(df, "x", build) == 2
+    assert cache.get(df, "x", build) == 2
+    assert cache.get(df, "y", build) == 2
+    assert calls == ["build", "build"]
+
+
+def test_concurrent_sessions_share_entries_safely() -> None:
+    cache: FrameCache[int] = FrameCache(max_entries=4)
+    frames = [pd.DataFrame({"a": range(i)}) for i in range(16)]
+    errors: list[BaseException] = []
+    start = threading.Barrier(8)
+
+    def session(offset: int) -> None:
+        start.wait()
+        try:
+            for round_ in range(200):
+                df = frames[(offset + round_) % len(frames)]
+                assert cache.get(df, round_ % 3, len) == len(df)
+        except BaseException as e:  # スレッド内の失敗を本体に伝える
+            errors.append(e)
+
+    threads = [threading.Thread(target=session, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert len(cache._entries) <= cache.max_entries